@@ -0,0 +1,71 @@
+"""
+Benchmarks for POST /api/add through the Flask test client.
+
+The result cache is disabled so every round measures a full evaluation:
+JSON decode, calculation and response serialization.
+"""
+import pytest
+from flask.json.provider import DefaultJSONProvider
+
+from conftest import record_throughput, size_id
+from src.api import app, result_cache
+from src.fast_json import encoder_name
+from src.workloads import STYLES, generate_input
+
+
+# The endpoint echoes its input, so the largest sizes are left to bench_calculator
+API_SIZES = [10, 1_000, 100_000, 1_000_000]
+
+# Large inputs, where echoing and serializing the input dominate
+RESPONSE_SIZES = [1_000_000, 10_000_000]
+
+
+@pytest.fixture
+def client():
+    """Test client with the result cache switched off."""
+    original = result_cache.max_entries
+    result_cache.max_entries = 0
+    result_cache.clear()
+    try:
+        yield app.test_client()
+    finally:
+        result_cache.max_entries = original
+
+
+@pytest.mark.parametrize('api_size', API_SIZES, ids=[size_id(size) for size in API_SIZES])
+@pytest.mark.parametrize('style', list(STYLES))
+def bench_api_add(benchmark, client, style, api_size):
+    body = {'numbers': generate_input(style, api_size)}
+    benchmark.group = f'api-add-{style}'
+    
+    response = benchmark(client.post, '/api/add', json=body)
+    
+    assert response.status_code == 200
+    record_throughput(benchmark, len(body['numbers']))
+
+
+@pytest.mark.parametrize('api_size', RESPONSE_SIZES, ids=[size_id(size) for size in RESPONSE_SIZES])
+@pytest.mark.parametrize('echo', ['true', 'false'])
+def bench_api_add_echo(benchmark, client, echo, api_size):
+    body = {'numbers': generate_input('default', api_size)}
+    benchmark.group = f'api-add-echo-{size_id(api_size)}'
+    
+    response = benchmark(client.post, f'/api/add?echo={echo}', json=body)
+    
+    assert response.status_code == 200
+    assert ('input' in response.get_json()) == (echo == 'true')
+    record_throughput(benchmark, len(body['numbers']))
+
+
+@pytest.mark.parametrize('api_size', RESPONSE_SIZES, ids=[size_id(size) for size in RESPONSE_SIZES])
+@pytest.mark.parametrize('provider', ['default', 'fast'])
+def bench_json_response(benchmark, provider, api_size):
+    payload = {'result': 123456789, 'input': generate_input('default', api_size), 'success': True}
+    json_provider = app.json if provider == 'fast' else DefaultJSONProvider(app)
+    benchmark.group = f'json-response-{size_id(api_size)}'
+    benchmark.extra_info['encoder'] = encoder_name() if provider == 'fast' else 'stdlib'
+    
+    with app.app_context():
+        benchmark(json_provider.response, payload)
+    
+    record_throughput(benchmark, api_size)
@@ -0,0 +1,73 @@
+"""
+Benchmarks for StringCalculator.add across sizes, delimiter styles and engines.
+"""
+import pytest
+
+from conftest import record_throughput
+from src.string_calculator import StringCalculator
+from src.workloads import STYLES, generate_input
+
+
+_inputs = {}
+
+
+def cached_input(style, size):
+    """Generate each input once per session; the 100 MB ones are costly."""
+    key = (style, size)
+    if key not in _inputs:
+        _inputs.clear()
+        _inputs[key] = generate_input(style, size)
+    return _inputs[key]
+
+
+@pytest.mark.parametrize('engine', ['regex', 'scan'])
+@pytest.mark.parametrize('style', list(STYLES))
+def bench_add(benchmark, style, size, engine):
+    calculator = StringCalculator(engine=engine)
+    numbers = cached_input(style, size)
+    benchmark.group = f'add-{style}-{engine}'
+    
+    result = benchmark(calculator.add, numbers)
+    
+    assert result == StringCalculator(engine='scan').add(numbers)
+    record_throughput(benchmark, len(numbers))
+
+
+@pytest.mark.parametrize('style', ['default', 'single_char'])
+def bench_add_numpy(benchmark, style, size):
+    pytest.importorskip('numpy')
+    calculator = StringCalculator(engine='numpy')
+    numbers = cached_input(style, size)
+    benchmark.group = f'add-{style}-numpy'
+    
+    benchmark(calculator.add, numbers)
+    record_throughput(benchmark, len(numbers))
+
+
+@pytest.mark.parametrize('numeric', ['bigint', 'int64'])
+@pytest.mark.parametrize('style', ['default', 'multi_char'])
+def bench_add_numeric(benchmark, style, size, numeric):
+    calculator = StringCalculator(numeric=numeric)
+    numbers = cached_input(style, size)
+    benchmark.group = f'add-{style}-{numeric}'
+    
+    result = benchmark(calculator.add, numbers)
+    
+    assert result == StringCalculator(engine='scan').add(numbers)
+    record_throughput(benchmark, len(numbers))
+
+
+@pytest.mark.parametrize('count', [2, 32])
+def bench_add_many_delimiters(benchmark, size, count):
+    # Delimiters sharing a prefix exercise the trie-compiled split pattern
+    delimiters = [f'<d{index:02d}>' for index in range(count)]
+    header = '//' + ''.join(f'[{delimiter}]' for delimiter in delimiters) + '\n'
+    body = cached_input('default', size).replace(',', delimiters[0]).replace('\n', delimiters[-1])
+    numbers = header + body
+    calculator = StringCalculator()
+    benchmark.group = f'add-many-delimiters-{count}'
+    
+    result = benchmark(calculator.add, numbers)
+    
+    assert result == StringCalculator().add(cached_input('default', size))
+    record_throughput(benchmark, len(numbers))
@@ -0,0 +1,67 @@
+"""
+Shared configuration for the String Calculator benchmark suite.
+
+Run from the backend directory (requires pytest-benchmark):
+
+    pytest benchmarks                                  # run everything up to 10 MB
+    pytest benchmarks --large                          # include the 100 MB inputs
+    pytest benchmarks --benchmark-save=baseline        # store a baseline in .benchmarks/
+    pytest benchmarks --benchmark-compare=0001 --regression-threshold=15
+    pytest benchmarks --benchmark-json=results.json    # export for trending
+
+With --benchmark-compare, a mean time more than --regression-threshold
+percent (default: $BENCHMARK_REGRESSION_THRESHOLD or 10) above the
+baseline - i.e. a throughput drop - fails the run, unless an explicit
+--benchmark-compare-fail is given.
+"""
+import os
+import sys
+
+import pytest
+
+# Make the src package importable regardless of the working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Input sizes in characters; LARGE_SIZES only run with --large
+SIZES = [10, 1_000, 100_000, 10_000_000]
+LARGE_SIZES = [100_000_000]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('calculator benchmarks')
+    group.addoption('--large', action='store_true', default=False,
+                    help='also benchmark 100 MB inputs')
+    group.addoption('--regression-threshold', type=int,
+                    default=int(os.environ.get('BENCHMARK_REGRESSION_THRESHOLD', 10)),
+                    help='percent slowdown of the mean versus the compared baseline that fails the run')
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Turn the regression threshold into a compare-fail check before the benchmark session starts."""
+    if config.getoption('benchmark_compare', None) and not config.getoption('benchmark_compare_fail', None):
+        from pytest_benchmark.utils import parse_compare_fail
+        threshold = config.getoption('regression_threshold')
+        config.option.benchmark_compare_fail = [parse_compare_fail(f'mean:{threshold}%')]
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        sizes = SIZES + (LARGE_SIZES if metafunc.config.getoption('large') else [])
+        metafunc.parametrize('size', sizes, ids=[size_id(size) for size in sizes])
+
+
+def record_throughput(benchmark, size):
+    """Attach input size and mean throughput to the benchmark's JSON record."""
+    benchmark.extra_info['input_chars'] = size
+    # --benchmark-disable runs each benchmark once without collecting stats
+    if benchmark.stats is not None:
+        benchmark.extra_info['mb_per_second'] = size / benchmark.stats.stats.mean / 1e6
+
+
+def size_id(size):
+    for unit, scale in (('MB', 1_000_000), ('KB', 1_000)):
+        if size >= scale:
+            return f'{size // scale}{unit}'
+    return f'{size}B'
@@ -4,32 +4,204 @@ Flask REST API for String Calculator.
 GREEN PHASE - TDD Cycle 9: REST API implementation.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+import functools
+import json
 import traceback
 import sys
 import os
+import time
+from typing import Optional
 
 # Fix relative import issue for direct execution
 if __name__ == '__main__':
     # Add parent directory to path for direct execution
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from src.string_calculator import StringCalculator
-    from src.exceptions import NegativeNumberError
+    from src.exceptions import (InvalidBodyError, InvalidDelimiterError, InvalidTokenError, LimitExceededError, NegativeNumberError,
+                                NumericOverflowError, SessionNotFoundError)
+    from src.limits import ConcurrencyLimiter
+    from src.bodies import RAW_CONTENT_TYPES, iter_body, open_body, supported_encodings
+    from src.result_cache import ResultCache
+    from src.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, ServiceMetrics
+    from src.sessions import SessionStore
+    from src.rules import NumberRules
+    from src.fast_json import FastJSONProvider, encoder_name
 else:
     # Use relative imports for pytest
     from .string_calculator import StringCalculator
-    from .exceptions import NegativeNumberError
+    from .exceptions import (InvalidBodyError, InvalidDelimiterError, InvalidTokenError, LimitExceededError, NegativeNumberError,
+                             NumericOverflowError, SessionNotFoundError)
+    from .limits import ConcurrencyLimiter
+    from .bodies import RAW_CONTENT_TYPES, iter_body, open_body, supported_encodings
+    from .result_cache import ResultCache
+    from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, ServiceMetrics
+    from .sessions import SessionStore
+    from .rules import NumberRules
+    from .fast_json import FastJSONProvider, encoder_name
 
 # Create Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
+# Largest number of inputs accepted by POST /api/add/batch
+app.config.setdefault('MAX_BATCH_SIZE', 1000)
+
+# Bytes read at a time from raw text bodies on POST /api/add/stream
+app.config.setdefault('STREAM_CHUNK_SIZE', 64 * 1024)
+
+# Result cache limits for POST /api/add (TTL in seconds)
+app.config.setdefault('RESULT_CACHE_MAX_ENTRIES', 10000)
+app.config.setdefault('RESULT_CACHE_TTL', 300.0)
+app.config.setdefault('RESULT_CACHE_MAX_BYTES', 16 * 1024 * 1024)
+
+# Running-sum session limits (TTL = idle seconds before a session expires)
+app.config.setdefault('SESSION_MAX_COUNT', 1000)
+app.config.setdefault('SESSION_TTL', 600.0)
+app.config.setdefault('SESSION_MAX_BYTES', 16 * 1024 * 1024)
+
+# Serve the session endpoints; sessions live in one process, so the pre-fork
+# launcher turns them off unless it runs a single worker (see src.server)
+app.config.setdefault('SESSIONS_ENABLED', True)
+
+# Numeric mode and fraction policy of the shared calculator (see src.numeric)
+app.config.setdefault('NUMERIC_MODE', 'bigint')
+app.config.setdefault('FRACTION_POLICY', 'skip')
+
+# Reject invalid tokens with their positions instead of skipping them
+app.config.setdefault('STRICT_MODE', False)
+
+# Number rules as NumberRules keyword arguments, e.g. {'max_value': 1000} (None = no rules)
+app.config.setdefault('NUMBER_RULES', None)
+
+# Request limits: body bytes (None = unlimited; the streaming endpoint is
+# exempt, as it never holds its body, but caps each NDJSON line at this
+# size instead), and numbers and CPU seconds per input
+app.config.setdefault('MAX_BODY_SIZE', 128 * 1024 * 1024)
+app.config.setdefault('MAX_NUMBER_COUNT', 50_000_000)
+app.config.setdefault('MAX_CPU_TIME', 10.0)
+
+# Most bytes a compressed raw body may decompress to
+app.config.setdefault('MAX_DECODED_BODY_SIZE', 1024 * 1024 * 1024)
+
+# Backpressure: requests with bodies of at least HEAVY_REQUEST_BYTES (or of
+# unknown length, or compressed) run at most MAX_HEAVY_REQUESTS at a time per process; the
+# rest are turned away with OVERLOAD_STATUS (429 or 503) and Retry-After
+app.config.setdefault('HEAVY_REQUEST_BYTES', 1024 * 1024)
+app.config.setdefault('MAX_HEAVY_REQUESTS', os.cpu_count() or 1)
+app.config.setdefault('OVERLOAD_STATUS', 503)
+app.config.setdefault('RETRY_AFTER', 1)
+
+# Serialize JSON with orjson when installed (see src.fast_json)
+app.config.setdefault('FAST_JSON', True)
+if app.config['FAST_JSON']:
+    app.json = FastJSONProvider(app)
+
+# Record request, error and per-phase metrics (toggle with set_metrics_enabled)
+app.config.setdefault('METRICS_ENABLED', True)
+
+# Metrics exposed on GET /api/metrics
+service_metrics = ServiceMetrics()
+
 # Create calculator instance
-calculator = StringCalculator()
+calculator = StringCalculator(
+    observer=service_metrics if app.config['METRICS_ENABLED'] else None,
+    numeric=app.config['NUMERIC_MODE'],
+    fraction_policy=app.config['FRACTION_POLICY'],
+    strict=app.config['STRICT_MODE'],
+    rules=NumberRules(**app.config['NUMBER_RULES']) if app.config['NUMBER_RULES'] else None,
+    max_numbers=app.config['MAX_NUMBER_COUNT'],
+    max_cpu_time=app.config['MAX_CPU_TIME']
+)
+
+# Slots for heavy requests in flight
+heavy_limiter = ConcurrencyLimiter(app.config['MAX_HEAVY_REQUESTS'])
+
+# Cache of results keyed by input hash, in front of calculator.add
+result_cache = ResultCache(
+    max_entries=app.config['RESULT_CACHE_MAX_ENTRIES'],
+    ttl=app.config['RESULT_CACHE_TTL'],
+    max_bytes=app.config['RESULT_CACHE_MAX_BYTES']
+)
+
+# Server-side running sums for clients that keep appending to one input
+session_store = SessionStore(
+    max_sessions=app.config['SESSION_MAX_COUNT'],
+    ttl=app.config['SESSION_TTL'],
+    max_bytes=app.config['SESSION_MAX_BYTES'],
+    calculator=calculator
+)
+
+
+@app.before_request
+def limit_body_size():
+    """Reject bodies over MAX_BODY_SIZE before they are read."""
+    limit = app.config['MAX_BODY_SIZE']
+    if limit is None or request.endpoint == 'add_numbers_stream':
+        return None
+    # Bodies without a Content-Length are cut off while being read instead
+    # (a per-request limit needs Flask 3.1, hence the requirements pin)
+    request.max_content_length = limit
+    if request.content_length is not None and request.content_length > limit:
+        return _body_too_large(None)
+    return None
+
+
+@app.errorhandler(RequestEntityTooLarge)
+def _body_too_large(error):
+    """413 response for a body over MAX_BODY_SIZE."""
+    return jsonify(body_too_large_payload()), 413
+
+
+def body_too_large_payload() -> dict:
+    """Count a body over MAX_BODY_SIZE and build its error body (shared with the ASGI app)."""
+    _count_error('body_too_large')
+    return {
+        'error': f"Request body too large (maximum {app.config['MAX_BODY_SIZE']} bytes)",
+        'success': False
+    }
+
+
+def _heavy_work(view):
+    """
+    Run a view under the heavy-request limiter.
+    
+    Requests with small bodies pass straight through. Others take a slot,
+    held until the response is sent (for streamed responses, until the
+    stream closes), or are rejected with OVERLOAD_STATUS and Retry-After.
+    """
+    @functools.wraps(view)
+    def limited(*args, **kwargs):
+        length = request.content_length
+        compressed = request.headers.get('Content-Encoding', 'identity').lower() != 'identity'
+        if length is not None and length < app.config['HEAVY_REQUEST_BYTES'] and not compressed:
+            return view(*args, **kwargs)
+        if not heavy_limiter.try_acquire():
+            _count_error('overloaded')
+            response = jsonify({
+                'error': 'Too many large requests in flight, retry later',
+                'success': False
+            })
+            response.headers['Retry-After'] = str(app.config['RETRY_AFTER'])
+            return response, app.config['OVERLOAD_STATUS']
+        try:
+            response = app.make_response(view(*args, **kwargs))
+        except BaseException:
+            heavy_limiter.release()
+            raise
+        if response.is_streamed:
+            response.call_on_close(heavy_limiter.release)
+        else:
+            heavy_limiter.release()
+        return response
+    
+    return limited
 
 
 @app.route('/api/add', methods=['POST'])
+@_heavy_work
 def add_numbers():
     """
     Add numbers endpoint for String Calculator.
@@ -45,71 +217,653 @@ def add_numbers():
         "input": "1,2,3",   // Original input
         "success": true     // Success status
     }
+    
+    Lean responses: with ?echo=false or a "Prefer: return=minimal" header
+    the input is not echoed back, so only result and success are sent.
+    
+    Response header X-Cache is HIT when the result came from the result cache.
+    
+    Limits: 413 for bodies over MAX_BODY_SIZE and for inputs over
+    MAX_NUMBER_COUNT numbers or MAX_CPU_TIME seconds; 503 (or 429) with
+    Retry-After while too many large requests are in flight.
     """
     try:
         # Validate request content type
         if not request.is_json:
+            _count_error('invalid_content_type')
             return jsonify({
                 'error': 'Content-Type must be application/json',
                 'success': False
             }), 400
         
         # Get JSON data
-        data = request.get_json()
+        started = time.perf_counter()
+        data = request.get_json(silent=True)
+        _observe_phase('json_decode', started)
         
-        # Validate required field
-        if 'numbers' not in data:
-            return jsonify({
-                'error': 'Missing required field: numbers',
-                'success': False
-            }), 400
+        echo = echo_requested(request.args.get('echo'), request.headers.get('Prefer'))
+        payload, status, cache_hit = add_payload(data, echo)
+        started = time.perf_counter()
+        response = jsonify(payload)
+        _observe_phase('serialize', started)
+        if cache_hit is not None:
+            response.headers['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+        if not echo and prefers_minimal(request.headers.get('Prefer')):
+            response.headers['Preference-Applied'] = 'return=minimal'
+        return response, status
+        
+    except RequestEntityTooLarge as e:
+        # A body without Content-Length ran past MAX_BODY_SIZE while being read
+        return _body_too_large(e)
+    except Exception as e:
+        # Handle unexpected errors
+        app.logger.error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
+        _count_error('internal')
+        return jsonify({
+            'error': 'Internal server error',
+            'success': False
+        }), 500
+
+
+@app.route('/api/add/raw', methods=['POST'])
+@_heavy_work
+def add_numbers_raw():
+    """
+    Raw add endpoint: the request body itself is the input, with no JSON.
+    
+    Content-Type text/plain (charset parameter honoured, UTF-8 by default)
+    or application/octet-stream (UTF-8). The body is parsed while it is
+    read, so it is never held as one string; it is never echoed or cached.
+    Content-Encoding gzip, or zstd when zstandard is installed, is
+    decompressed on the fly (415 for other encodings, 400 for corrupt data,
+    413 past MAX_DECODED_BODY_SIZE).
+    
+    JSON output:
+    {
+        "result": 6,
+        "success": true
+    }
+    """
+    if request.mimetype not in RAW_CONTENT_TYPES:
+        _count_error('invalid_content_type')
+        return jsonify({
+            'error': 'Content-Type must be text/plain or application/octet-stream',
+            'success': False
+        }), 415
+    
+    charset = request.mimetype_params.get('charset', 'utf-8') if request.mimetype == 'text/plain' else 'utf-8'
+    try:
+        payload, status = raw_add_payload(request.stream, request.headers.get('Content-Encoding'), charset)
+    except RequestEntityTooLarge as e:
+        return _body_too_large(e)
+    return jsonify(payload), status
+
+
+def add_payload(data, echo: bool = True) -> tuple[dict, int, Optional[bool]]:
+    """
+    Evaluate a decoded /api/add request body.
+    
+    Shared by the Flask and ASGI applications so both return identical
+    responses. Unexpected errors propagate to the caller.
+    
+    Args:
+        data: Decoded JSON request body (None if it was not valid JSON)
+        echo: Whether the payload echoes the input back
         
-        numbers_input = data['numbers']
+    Returns:
+        Tuple of (response payload, HTTP status, cache hit or None if not evaluated)
+    """
+    # Validate required field
+    if not isinstance(data, dict) or 'numbers' not in data:
+        _count_error('missing_field')
+        return {
+            'error': 'Missing required field: numbers',
+            'success': False
+        }, 400, None
+    
+    numbers_input = data['numbers']
+    if not isinstance(numbers_input, str):
+        _count_error('invalid_field')
+        return {
+            'error': 'Field numbers must be a string',
+            'success': False
+        }, 400, None
+    
+    try:
+        # Calculate result using our String Calculator (repeats come from the cache)
+        result, cache_hit = result_cache.get_or_compute(numbers_input, calculator.add)
+    except _CALCULATION_ERRORS as e:
+        payload, status = _calculation_error(e)
+        return payload, status, None
+    
+    if not echo:
+        return {'result': result, 'success': True}, 200, cache_hit
+    return {
+        'result': result,
+        'input': numbers_input,
+        'success': True
+    }, 200, cache_hit
+
+
+def echo_requested(echo: Optional[str], prefer: Optional[str]) -> bool:
+    """
+    Decide whether a response echoes its input.
+    
+    Args:
+        echo: Value of the echo query parameter, if given (it takes precedence)
+        prefer: Value of the Prefer request header, if given
         
-        # Calculate result using our String Calculator
-        result = calculator.add(numbers_input)
+    Returns:
+        False for echo=false/0/no, or for "Prefer: return=minimal" without echo
+    """
+    if echo is not None:
+        return echo.lower() not in ('false', '0', 'no')
+    return not prefers_minimal(prefer)
+
+
+def prefers_minimal(prefer: Optional[str]) -> bool:
+    """Whether a Prefer header (RFC 7240) asks for return=minimal."""
+    if not prefer:
+        return False
+    preferences = (item.split(';')[0].replace(' ', '').lower() for item in prefer.split(','))
+    return 'return=minimal' in preferences
+
+
+def raw_add_payload(stream, content_encoding: Optional[str] = None, charset: str = 'utf-8') -> tuple[dict, int]:
+    """
+    Evaluate a raw /api/add request body, decompressing and parsing it as it is read.
+    
+    Args:
+        stream: Binary stream of the request body
+        content_encoding: Content-Encoding header value (None = identity)
+        charset: Text encoding of the decompressed body
         
-        # Return success response
+    Returns:
+        Tuple of (response payload, HTTP status)
+    """
+    try:
+        reader = open_body(stream, content_encoding)
+    except ValueError as e:
+        _count_error('unsupported_encoding')
+        return {'error': str(e), 'success': False}, 415
+    
+    chunks = iter_body(reader, app.config['STREAM_CHUNK_SIZE'], app.config['MAX_DECODED_BODY_SIZE'])
+    try:
+        result = calculator.add_iter(chunks, charset)
+    except _CALCULATION_ERRORS + (InvalidBodyError,) as e:
+        return _calculation_error(e)
+    except UnicodeDecodeError:
+        _count_error('invalid_body')
+        return {'error': f'Body is not valid {charset} text', 'success': False}, 400
+    except LookupError:
+        _count_error('unsupported_charset')
+        return {'error': f'Unsupported charset: {charset}', 'success': False}, 415
+    
+    return {'result': result, 'success': True}, 200
+
+
+# Errors a calculation can end with, turned into responses by _calculation_error
+_CALCULATION_ERRORS = (NegativeNumberError, InvalidTokenError, InvalidDelimiterError, LimitExceededError,
+                       NumericOverflowError)
+
+
+def _calculation_error(error) -> tuple[dict, int]:
+    """Count a failed calculation and build its error body and HTTP status."""
+    if isinstance(error, (NegativeNumberError, InvalidTokenError)):
+        # Negative numbers and, in strict mode, invalid tokens
+        return _rejected_input_payload(error), 400
+    if isinstance(error, LimitExceededError):
+        return _limit_exceeded_payload(error), 413
+    if isinstance(error, NumericOverflowError):
+        _count_error('numeric_overflow')
+        return {'error': str(error), 'success': False}, 422
+    _count_error('invalid_delimiter' if isinstance(error, InvalidDelimiterError) else 'invalid_body')
+    return {'error': str(error), 'success': False}, 400
+
+
+@app.route('/api/add/batch', methods=['POST'])
+@_heavy_work
+def add_numbers_batch():
+    """
+    Batch add endpoint: evaluate many inputs in one request.
+    
+    Expected JSON input:
+    {
+        "inputs": ["1,2", "//;\\n1;2"]   // Strings with numbers and delimiters
+    }
+    
+    JSON output (one entry per input, in order):
+    {
+        "results": [
+            {"result": 3, "success": true},
+            {"error": "...", "success": false}
+        ],
+        "count": 2,
+        "success": true
+    }
+    """
+    if not request.is_json:
+        _count_error('invalid_content_type')
         return jsonify({
-            'result': result,
-            'input': numbers_input,
-            'success': True
-        }), 200
-        
-    except NegativeNumberError as e:
-        # Handle negative numbers error
+            'error': 'Content-Type must be application/json',
+            'success': False
+        }), 400
+    
+    data = request.get_json(silent=True)
+    inputs = data.get('inputs') if isinstance(data, dict) else None
+    
+    if not isinstance(inputs, list):
+        _count_error('missing_field')
         return jsonify({
-            'error': str(e),
+            'error': 'Missing required field: inputs (must be a list)',
             'success': False
         }), 400
+    
+    max_batch_size = app.config['MAX_BATCH_SIZE']
+    if len(inputs) > max_batch_size:
+        _count_error('batch_too_large')
+        return jsonify({
+            'error': f'Batch too large: {len(inputs)} inputs (maximum {max_batch_size})',
+            'success': False
+        }), 413
+    
+    results = [_evaluate_item(numbers_input) for numbers_input in inputs]
+    return jsonify({
+        'results': results,
+        'count': len(results),
+        'success': True
+    }), 200
+
+
+def _evaluate_item(numbers_input) -> dict:
+    """Evaluate one input, turning failures into a per-item error."""
+    if not isinstance(numbers_input, str):
+        return {'error': 'Each input must be a string', 'success': False}
+    
+    try:
+        return {'result': calculator.add(numbers_input), 'success': True}
+    except (NegativeNumberError, InvalidTokenError) as e:
+        return _rejected_input_payload(e)
+    except InvalidDelimiterError as e:
+        _count_error('invalid_delimiter')
+        return {'error': str(e), 'success': False}
+    except LimitExceededError as e:
+        return _limit_exceeded_payload(e)
+    except NumericOverflowError as e:
+        _count_error('numeric_overflow')
+        return {'error': str(e), 'success': False}
+    except Exception as e:
+        app.logger.error(f"Unexpected error in item: {str(e)}\n{traceback.format_exc()}")
+        _count_error('internal')
+        return {'error': 'Internal server error', 'success': False}
+
+
+@app.route('/api/add/stream', methods=['POST'])
+@_heavy_work
+def add_numbers_stream():
+    """
+    Streaming add endpoint: evaluate records as the request body arrives.
+    
+    Request body, by Content-Type:
+    - application/x-ndjson: one record per line, either {"numbers": "1,2"}
+      or a bare JSON string "1,2"; a line over MAX_BODY_SIZE bytes is
+      skipped with an error item (limit "line_size")
+    - text/plain: the whole body is a single input, parsed incrementally
+    
+    Response (application/x-ndjson, streamed): one line per record
+    {"line": 1, "result": 3, "input": "1,2", "success": true}
+    
+    Query parameters:
+    - echo=false: omit the "input" field (raw text input is never echoed);
+      a "Prefer: return=minimal" header does the same
+    """
+    echo = echo_requested(request.args.get('echo'), request.headers.get('Prefer'))
+    content_type = request.mimetype
+    
+    if content_type == 'text/plain':
+        generate = _stream_raw_text
+    elif content_type in ('application/x-ndjson', 'application/jsonl'):
+        generate = _stream_ndjson
+    else:
+        return jsonify({
+            'error': 'Content-Type must be application/x-ndjson or text/plain',
+            'success': False
+        }), 415
+    
+    return Response(stream_with_context(generate(echo)), mimetype='application/x-ndjson')
+
+
+def _stream_ndjson(echo: bool):
+    """Yield one NDJSON result per record line of the request body."""
+    limit = app.config['MAX_BODY_SIZE']
+    stream = request.stream
+    line_number = 0
+    while True:
+        # Each line is held in full for json.loads, so its length is capped
+        raw_line = stream.readline() if limit is None else stream.readline(limit + 1)
+        if not raw_line:
+            return
+        line_number += 1
+        if limit is not None and len(raw_line) > limit and not raw_line.endswith(b'\n'):
+            _skip_line(stream)
+            _count_error('line_too_large')
+            yield _ndjson_line({'line': line_number, 'error': f'Line too large (maximum {limit} bytes)',
+                                'limit': 'line_size', 'success': False})
+            continue
+        if not raw_line.strip():
+            continue
+        
+        try:
+            record = json.loads(raw_line)
+        except ValueError:
+            yield _ndjson_line({'line': line_number, 'error': 'Invalid JSON', 'success': False})
+            continue
         
+        numbers_input = record.get('numbers') if isinstance(record, dict) else record
+        if not isinstance(numbers_input, str):
+            yield _ndjson_line({'line': line_number, 'error': 'Missing required field: numbers', 'success': False})
+            continue
+        
+        item = {'line': line_number, **_evaluate_item(numbers_input)}
+        if echo:
+            item['input'] = numbers_input
+        yield _ndjson_line(item)
+
+
+def _skip_line(stream) -> None:
+    """Discard the rest of the current line, one bounded read at a time."""
+    chunk_size = app.config['STREAM_CHUNK_SIZE']
+    while True:
+        rest = stream.readline(chunk_size)
+        if not rest or rest.endswith(b'\n'):
+            return
+
+
+def _stream_raw_text(echo: bool):
+    """Yield a single NDJSON result for a raw text body, read in chunks."""
+    chunk_size = app.config['STREAM_CHUNK_SIZE']
+    
+    def read_chunks():
+        while True:
+            chunk = request.stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    
+    try:
+        item = {'line': 1, 'result': calculator.add_iter(read_chunks()), 'success': True}
+    except (NegativeNumberError, InvalidTokenError) as e:
+        item = {'line': 1, **_rejected_input_payload(e)}
+    except LimitExceededError as e:
+        item = {'line': 1, **_limit_exceeded_payload(e)}
+    except (InvalidDelimiterError, NumericOverflowError) as e:
+        item = {'line': 1, 'error': str(e), 'success': False}
     except Exception as e:
-        # Handle unexpected errors
         app.logger.error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
+        item = {'line': 1, 'error': 'Internal server error', 'success': False}
+    yield _ndjson_line(item)
+
+
+def _rejected_input_payload(error) -> dict:
+    """
+    Count a rejected input and build its error body.
+    
+    The body lists what was reported: negatives, or invalid tokens with
+    their byte offset, line and column, plus how many the input held.
+    """
+    if isinstance(error, InvalidTokenError):
+        _count_error('invalid_tokens')
+        return {
+            'error': str(error),
+            'invalid_tokens': [token._asdict() for token in error.errors],
+            'invalid_count': error.count,
+            'success': False
+        }
+    _count_error('negative_numbers')
+    return {
+        'error': str(error),
+        'negatives': error.negatives,
+        'negative_count': error.count,
+        'success': False
+    }
+
+
+def _limit_exceeded_payload(error: LimitExceededError) -> dict:
+    """Count an input that ran out of its work budget and build its error body."""
+    _count_error('limit_exceeded')
+    return {
+        'error': str(error),
+        'limit': error.limit,
+        'success': False
+    }
+
+
+def _ndjson_line(item: dict) -> str:
+    """Serialize one result as an NDJSON line."""
+    return app.json.dumps(item) + '\n'
+
+
+def _sessions_enabled(view):
+    """Answer 501 instead of running a session view while SESSIONS_ENABLED is off."""
+    @functools.wraps(view)
+    def guarded(*args, **kwargs):
+        if not app.config['SESSIONS_ENABLED']:
+            _count_error('sessions_disabled')
+            return jsonify({
+                'error': 'Sessions are disabled: they need a single server worker (run_api.py --sessions)',
+                'success': False
+            }), 501
+        return view(*args, **kwargs)
+    
+    return guarded
+
+
+@app.route('/api/sessions', methods=['POST'])
+@_sessions_enabled
+@_heavy_work
+def open_session():
+    """
+    Open a running-sum session.
+    
+    Expected JSON input (numbers is optional; its header, if any, is fixed
+    for the whole session):
+    {
+        "numbers": "//;\\n1;2"
+    }
+    
+    JSON output (201):
+    {
+        "session_id": "...",
+        "result": 3,
+        "length": 3,              // Characters in the numbers section so far
+        "delimiters": [";"],
+        "success": true
+    }
+    """
+    if not request.is_json:
+        _count_error('invalid_content_type')
         return jsonify({
-            'error': 'Internal server error',
+            'error': 'Content-Type must be application/json',
             'success': False
-        }), 500
+        }), 400
+    
+    data = request.get_json(silent=True)
+    numbers_input = data.get('numbers', '') if isinstance(data, dict) else None
+    if not isinstance(numbers_input, str):
+        _count_error('missing_field')
+        return jsonify({
+            'error': 'Field numbers must be a string',
+            'success': False
+        }), 400
+    
+    try:
+        session = session_store.open(numbers_input)
+    except InvalidDelimiterError as e:
+        _count_error('invalid_delimiter')
+        return jsonify({
+            'error': str(e),
+            'success': False
+        }), 400
+    except LimitExceededError as e:
+        return jsonify(_limit_exceeded_payload(e)), 413
+    try:
+        return jsonify({**session.describe(), 'success': True}), 201
+    except _CALCULATION_ERRORS as e:
+        return _session_rejected_input(session, e)
+
+
+@app.route('/api/sessions/<session_id>', methods=['GET', 'DELETE'])
+@_sessions_enabled
+def session_state(session_id):
+    """Get a session's running sum (GET) or close the session (DELETE)."""
+    try:
+        if request.method == 'DELETE':
+            session = session_store.close(session_id)
+        else:
+            session = session_store.get(session_id)
+    except SessionNotFoundError as e:
+        return _session_not_found(e)
+    try:
+        return jsonify({**session.describe(), 'success': True}), 200
+    except _CALCULATION_ERRORS as e:
+        return _session_rejected_input(session, e)
+
+
+@app.route('/api/sessions/<session_id>/append', methods=['POST'])
+@_sessions_enabled
+@_heavy_work
+def append_to_session(session_id):
+    """
+    Append a fragment to a session; only the new text is parsed.
+    
+    Expected JSON input:
+    {
+        "numbers": ";3;4"    // Text added to the end of the input
+    }
+    
+    JSON output: same shape as opening a session, with the updated result.
+    A fragment over the work limits answers 413 and closes the session.
+    """
+    if not request.is_json:
+        _count_error('invalid_content_type')
+        return jsonify({
+            'error': 'Content-Type must be application/json',
+            'success': False
+        }), 400
+    
+    data = request.get_json(silent=True)
+    fragment = data.get('numbers') if isinstance(data, dict) else None
+    if not isinstance(fragment, str):
+        _count_error('missing_field')
+        return jsonify({
+            'error': 'Missing required field: numbers',
+            'success': False
+        }), 400
+    
+    try:
+        session = session_store.append(session_id, fragment)
+    except SessionNotFoundError as e:
+        return _session_not_found(e)
+    except LimitExceededError as e:
+        return jsonify(_limit_exceeded_payload(e)), 413
+    try:
+        return jsonify({**session.describe(), 'success': True}), 200
+    except _CALCULATION_ERRORS as e:
+        return _session_rejected_input(session, e)
+
+
+def _session_rejected_input(session, error):
+    """Error response for a session whose input is rejected; it stays open until closed."""
+    payload, status = _calculation_error(error)
+    return jsonify({**payload, 'session_id': session.session_id}), status
+
+
+def _session_not_found(error: SessionNotFoundError):
+    """404 response for an unknown or expired session."""
+    _count_error('session_not_found')
+    return jsonify({
+        'error': str(error),
+        'success': False
+    }), 404
+
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Metrics endpoint in the Prometheus text exposition format (this process only)."""
+    return Response(service_metrics.render(), content_type=METRICS_CONTENT_TYPE)
+
+
+@app.after_request
+def count_request(response):
+    """Count every handled request by route, method and status."""
+    if app.config['METRICS_ENABLED']:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        service_metrics.count_request(endpoint, request.method, response.status_code)
+    return response
+
+
+def set_metrics_enabled(enabled: bool) -> None:
+    """
+    Turn metrics collection on or off at runtime.
+    
+    Args:
+        enabled: Whether requests and calculator phases are recorded
+    """
+    app.config['METRICS_ENABLED'] = enabled
+    calculator.observer = service_metrics if enabled else None
+
+
+def _observe_phase(phase: str, started: float) -> None:
+    """Record the time since ``started`` for a request phase."""
+    if app.config['METRICS_ENABLED']:
+        service_metrics.observe_phase(phase, time.perf_counter() - started)
+
+
+def _count_error(error_type: str) -> None:
+    """Count a failed request or item by error type."""
+    if app.config['METRICS_ENABLED']:
+        service_metrics.count_error(error_type)
 
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'String Calculator API',
-        'version': '1.0.0'
-    }), 200
+    return jsonify(health_payload()), 200
 
 
 @app.route('/', methods=['GET'])
 def root():
     """Root endpoint with API information."""
-    return jsonify({
+    return jsonify(info_payload()), 200
+
+
+def health_payload() -> dict:
+    """Build the health check response body."""
+    return {
+        'status': 'healthy',
+        'service': 'String Calculator API',
+        'version': '1.0.0',
+        'cache': result_cache.stats(),
+        'sessions': session_store.stats(),
+        'heavy_requests': heavy_limiter.stats()
+    }
+
+
+def info_payload() -> dict:
+    """Build the API information response body."""
+    return {
         'message': 'String Calculator API',
         'version': '1.0.0',
         'endpoints': {
             'POST /api/add': 'Add numbers with various delimiters',
+            'POST /api/add/raw': 'Add numbers from a raw text body, optionally gzip/zstd compressed',
+            'POST /api/add/batch': 'Add numbers for a list of inputs in one request',
+            'POST /api/add/stream': 'Stream NDJSON (or raw text) in, NDJSON results out',
+            'POST /api/sessions': 'Open a running-sum session',
+            'POST /api/sessions/<id>/append': 'Append to a session and get the updated sum',
+            'GET /api/sessions/<id>': 'Current sum of a session',
+            'DELETE /api/sessions/<id>': 'Close a session',
+            'GET /api/metrics': 'Prometheus metrics for this process',
             'GET /api/health': 'Health check',
             'GET /': 'This information'
         },
@@ -117,19 +871,28 @@ def root():
             'basic': 'POST {"numbers": "1,2,3"} -> {"result": 6}',
             'custom_delimiter': 'POST {"numbers": "//;\\n1;2;3"} -> {"result": 6}',
             'multi_char': 'POST {"numbers": "//[***]\\n1***2***3"} -> {"result": 6}',
-            'multiple_delimiters': 'POST {"numbers": "//[*][%]\\n1*2%3"} -> {"result": 6}'
+            'multiple_delimiters': 'POST {"numbers": "//[*][%]\\n1*2%3"} -> {"result": 6}',
+            'lean': 'POST /api/add?echo=false {"numbers": "1,2,3"} -> {"result": 6, "success": true}'
+        },
+        'json_encoder': encoder_name() if isinstance(app.json, FastJSONProvider) else 'stdlib',
+        'sessions_enabled': app.config['SESSIONS_ENABLED'],
+        'content_encodings': ['identity'] + supported_encodings(),
+        'limits': {
+            'max_body_size': app.config['MAX_BODY_SIZE'],
+            'max_decoded_body_size': app.config['MAX_DECODED_BODY_SIZE'],
+            'max_number_count': calculator.max_numbers,
+            'max_cpu_time': calculator.max_cpu_time,
+            'max_header_length': calculator.max_header_length,
+            'max_delimiters': calculator.max_delimiters,
+            'heavy_request_bytes': app.config['HEAVY_REQUEST_BYTES'],
+            'max_heavy_requests': heavy_limiter.capacity,
+            'overload_status': app.config['OVERLOAD_STATUS'],
+            'retry_after': app.config['RETRY_AFTER']
         }
-    }), 200
+    }
 
 
 if __name__ == '__main__':
-    print("🚀 Starting String Calculator API Server...")
-    print("📍 Server running at: http://localhost:5000")
-    print("🏥 Health check: http://localhost:5000/api/health")
-    print("📚 API docs: http://localhost:5000/")
-    print("🔗 Frontend should run at: http://localhost:3000")
-    print("\n🧮 String Calculator API is ready!")
-    print("Press Ctrl+C to stop the server")
-    print("-" * 50)
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Serve with the pre-fork production launcher (pass --dev for the debug server)
+    from src.server import main
+    main()
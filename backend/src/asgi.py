@@ -0,0 +1,180 @@
+"""
+Native asyncio ASGI application for String Calculator.
+
+Serves the same /api/add, /api/health and / contract as the Flask app in
+api.py, sharing its calculator, result cache and JSON encoder so response
+bodies are byte-for-byte identical. Bodies at or above OFFLOAD_THRESHOLD
+bytes are decoded and evaluated in an executor, keeping the event loop free
+for other requests, and bodies over the app's MAX_BODY_SIZE are refused
+with 413 before they are buffered. Serve with any ASGI server, e.g.
+``uvicorn src.asgi:app``.
+"""
+import asyncio
+import json
+import traceback
+from urllib.parse import parse_qs
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, Optional
+
+from . import api
+
+
+Scope = dict
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+
+
+class CalculatorASGIApp:
+    """ASGI 3 application exposing the String Calculator API."""
+
+    # Bodies at least this long (in bytes) are decoded and evaluated off the event loop
+    OFFLOAD_THRESHOLD = 64 * 1024
+
+    def __init__(self, offload_threshold: int = OFFLOAD_THRESHOLD, executor: Optional[Executor] = None) -> None:
+        """
+        Initialize the application.
+
+        Args:
+            offload_threshold: Body length from which decoding and evaluation run in the executor
+            executor: Executor for large inputs (the loop's default executor if omitted)
+        """
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+        self._routes = {
+            ('POST', '/api/add'): self._add_numbers,
+            ('GET', '/api/health'): self._health_check,
+            ('GET', '/'): self._root,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection."""
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+        method = scope['method']
+        path = scope['path']
+
+        if method == 'OPTIONS':
+            await self._send(send, 200, b'', headers, {
+                'access-control-allow-methods': 'GET, POST, OPTIONS',
+                'access-control-allow-headers': headers.get('access-control-request-headers', '*'),
+            })
+            return
+
+        handler = self._routes.get((method, path))
+        if handler is None:
+            known_path = any(route_path == path for _, route_path in self._routes)
+            status, error = (405, 'Method not allowed') if known_path else (404, 'Not found')
+            await self._send_json(send, {'error': error, 'success': False}, status, headers)
+            return
+
+        body = await self._read_body(receive, headers, api.app.config['MAX_BODY_SIZE'])
+        if body is None:
+            await self._send_json(send, api.body_too_large_payload(), 413, headers)
+            return
+        query = {name: values[-1] for name, values in parse_qs(scope.get('query_string', b'').decode('latin-1')).items()}
+        try:
+            payload, status, extra = await handler(headers, body, query)
+        except Exception as e:
+            api.app.logger.error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
+            payload, status, extra = {'error': 'Internal server error', 'success': False}, 500, {}
+        await self._send_json(send, payload, status, headers, extra)
+
+    async def _add_numbers(self, headers: dict, body: bytes, query: dict) -> tuple[dict, int, dict]:
+        """POST /api/add - same validation and payloads as the Flask endpoint."""
+        mimetype = headers.get('content-type', '').split(';')[0].strip().lower()
+        if not (mimetype == 'application/json' or (mimetype.startswith('application/') and mimetype.endswith('+json'))):
+            return {'error': 'Content-Type must be application/json', 'success': False}, 400, {}
+
+        echo = api.echo_requested(query.get('echo'), headers.get('prefer'))
+        if len(body) >= self.offload_threshold:
+            loop = asyncio.get_running_loop()
+            payload, status, cache_hit = await loop.run_in_executor(self.executor, self._evaluate, body, echo)
+        else:
+            payload, status, cache_hit = self._evaluate(body, echo)
+
+        extra = {} if cache_hit is None else {'x-cache': 'HIT' if cache_hit else 'MISS'}
+        if not echo and api.prefers_minimal(headers.get('prefer')):
+            extra['preference-applied'] = 'return=minimal'
+        return payload, status, extra
+
+    @staticmethod
+    def _evaluate(body: bytes, echo: bool) -> tuple[dict, int, Optional[bool]]:
+        """Decode a /api/add body and build its payload; large bodies run this in the executor."""
+        try:
+            data = json.loads(body)
+        except ValueError:
+            # Malformed JSON or UTF-8, like get_json(silent=True) in the Flask endpoint
+            data = None
+        return api.add_payload(data, echo)
+
+    async def _health_check(self, headers: dict, body: bytes, query: dict) -> tuple[dict, int, dict]:
+        """GET /api/health"""
+        return api.health_payload(), 200, {}
+
+    async def _root(self, headers: dict, body: bytes, query: dict) -> tuple[dict, int, dict]:
+        """GET /"""
+        return api.info_payload(), 200, {}
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Acknowledge lifespan startup and shutdown events."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def _read_body(receive: Receive, headers: dict, max_size: Optional[int]) -> Optional[bytes]:
+        """Collect the full request body, or None once it is known to exceed max_size bytes."""
+        if max_size is not None and int(headers.get('content-length') or 0) > max_size:
+            return None
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                break
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                return None
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                break
+        return b''.join(chunks)
+
+    async def _send_json(self, send: Send, payload: dict, status: int, request_headers: dict,
+                         extra: Optional[dict] = None) -> None:
+        """Serialize with Flask's JSON provider, exactly like jsonify, and send."""
+        body = api.app.json.response(payload).get_data()
+        headers = {'content-type': 'application/json'}
+        headers.update(extra or {})
+        await self._send(send, status, body, request_headers, headers)
+
+    @staticmethod
+    async def _send(send: Send, status: int, body: bytes, request_headers: dict, headers: dict) -> None:
+        """Send a complete response, adding CORS headers like flask-cors."""
+        origin = request_headers.get('origin')
+        response_headers = dict(headers)
+        response_headers['content-length'] = str(len(body))
+        response_headers['access-control-allow-origin'] = origin or '*'
+        if origin:
+            response_headers['vary'] = 'Origin'
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(name.encode('latin-1'), value.encode('latin-1')) for name, value in response_headers.items()],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+
+# Default application instance for ASGI servers
+app = CalculatorASGIApp()
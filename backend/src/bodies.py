@@ -0,0 +1,123 @@
+"""
+Raw and compressed request bodies for String Calculator API.
+
+Plain text bodies skip JSON entirely: the body is read in chunks and fed
+to the calculator's incremental parser, so a huge input is never held as
+one string. A Content-Encoding of gzip (standard library) or zstd (when
+the optional ``zstandard`` package is installed) is decompressed on the
+fly, one bounded chunk at a time, and the decompressed size is capped to
+defuse compression bombs.
+"""
+import gzip
+import zlib
+from typing import IO, Iterator, Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+from .exceptions import InvalidBodyError, LimitExceededError
+
+
+# Content types read as raw calculator input
+RAW_CONTENT_TYPES = ('text/plain', 'application/octet-stream')
+
+# Errors raised by the decompressors on corrupt or truncated data
+_DECODING_ERRORS = (OSError, EOFError, zlib.error) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+
+def supported_encodings() -> list[str]:
+    """Content-Encoding values accepted by open_body, besides identity."""
+    return ['gzip', 'zstd'] if zstandard is not None else ['gzip']
+
+
+def open_body(stream: IO[bytes], content_encoding: Optional[str] = None) -> IO[bytes]:
+    """
+    Wrap a request body stream so reads return decompressed bytes.
+
+    Args:
+        stream: Binary stream of the request body
+        content_encoding: Content-Encoding header value (None = identity)
+
+    Returns:
+        Readable binary file-like object
+
+    Raises:
+        ValueError: If the encoding is unknown or its decompressor is not installed
+    """
+    encoding = (content_encoding or 'identity').strip().lower()
+    if encoding == 'identity':
+        return stream
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.GzipFile(fileobj=stream, mode='rb')
+    if encoding == 'zstd' and zstandard is not None:
+        return _ZstdReader(stream)
+    raise ValueError(f"Unsupported Content-Encoding: {content_encoding!r} "
+                     f"(expected one of identity, {', '.join(supported_encodings())})")
+
+
+class _ZstdReader:
+    """
+    Incremental zstd decoding that rejects truncated frames.
+
+    ``ZstdDecompressor.stream_reader`` ends silently when the input stops
+    mid-frame, which would sum a partial body. Compressed input is fed in
+    small pieces instead, so a single call cannot expand without bound, and
+    running out of input before the frame ends is an error.
+    """
+
+    # Compressed bytes fed per step; zstd expands at most ~32768x
+    FEED_SIZE = 256
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+        self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+        self._pending = b''
+        self._input = b''
+        self._offset = 0
+
+    def read(self, size: int) -> bytes:
+        parts, length = [self._pending], len(self._pending)
+        while length < size and not self._decompressor.eof:
+            if self._offset >= len(self._input):
+                self._input, self._offset = self._stream.read(max(size, self.FEED_SIZE)), 0
+                if not self._input:
+                    raise EOFError("compressed body ended before the end of the zstd frame")
+            piece = self._input[self._offset:self._offset + self.FEED_SIZE]
+            self._offset += self.FEED_SIZE
+            parts.append(self._decompressor.decompress(piece))
+            length += len(parts[-1])
+        data = b''.join(parts)
+        chunk, self._pending = data[:size], data[size:]
+        return chunk
+
+
+def iter_body(reader: IO[bytes], chunk_size: int, max_size: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Yield a body in chunks of at most chunk_size bytes.
+
+    Args:
+        reader: Binary file-like object, e.g. from open_body
+        chunk_size: Bytes per read
+        max_size: Most bytes yielded in total (None = unlimited)
+
+    Yields:
+        Successive chunks of the body
+
+    Raises:
+        InvalidBodyError: If the compressed data is corrupt or truncated
+        LimitExceededError: If the body decodes to more than max_size bytes
+    """
+    size = 0
+    while True:
+        try:
+            chunk = reader.read(chunk_size)
+        except _DECODING_ERRORS as e:
+            raise InvalidBodyError(f"invalid compressed body: {e}") from e
+        if not chunk:
+            return
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise LimitExceededError('decoded_body_size', max_size)
+        yield chunk
@@ -0,0 +1,118 @@
+"""
+Trie-compiled delimiter patterns for String Calculator.
+
+A flat alternation ``d1|d2|...|dN`` makes the regex engine try every
+delimiter in turn at each position, so splitting slows down as tenants
+define more (and more similar) multi-character delimiters. Here the
+delimiter set is first folded into a prefix tree, and the tree is emitted
+as a regex in which every shared prefix is matched once and every branch
+point dispatches on a single character. A position is then rejected or
+matched after at most one step per character of the longest delimiter,
+whatever the number of delimiters.
+
+Precedence is exactly that of the flat alternation: at each position the
+delimiter listed first among those that match wins. Since every delimiter
+matching at a position is a prefix of the next one on the same path, that
+rule prunes the tree statically: a delimiter is dropped when a prefix of it
+is listed earlier (it could never win), and the remaining longer branches
+are tried before the shorter delimiter they extend.
+"""
+import re
+from typing import Optional, Union
+
+Delimiter = Union[str, bytes]
+
+# Deepest nesting of delimiters that extend one another emitted as a trie;
+# deeper sets fall back to a flat alternation, as the regex compiler recurses
+MAX_TRIE_NESTING = 100
+
+
+class _Node:
+    """Prefix tree node; ``priority`` is the index of the delimiter ending here."""
+
+    __slots__ = ('children', 'priority')
+
+    def __init__(self) -> None:
+        self.children: dict = {}
+        self.priority: Optional[int] = None
+
+
+def build_trie(delimiters: list[Delimiter]) -> _Node:
+    """
+    Fold delimiters into a prefix tree, dropping those that can never win.
+
+    Args:
+        delimiters: Non-empty delimiter strings (or bytes), in precedence order
+
+    Returns:
+        Root node of the tree
+    """
+    root = _Node()
+    for priority, delimiter in enumerate(delimiters):
+        node = root
+        for index in range(len(delimiter)):
+            if node.priority is not None:
+                # A prefix listed earlier matches wherever this one does
+                break
+            node = node.children.setdefault(delimiter[index:index + 1], _Node())
+        else:
+            if node.priority is None:
+                node.priority = priority
+    return root
+
+
+def trie_pattern(delimiters: list[Delimiter]) -> Delimiter:
+    """
+    Build the regex source matching any delimiter with alternation precedence.
+
+    Args:
+        delimiters: Non-empty delimiter strings (or bytes), in precedence order
+
+    Returns:
+        Pattern source of the same type as the delimiters
+    """
+    empty = delimiters[0][:0]
+    root = build_trie(delimiters)
+    if _nesting(root) > MAX_TRIE_NESTING:
+        return _join(empty, '|').join(re.escape(delimiter) for delimiter in delimiters)
+    return _emit(root, empty)
+
+
+def _emit(node: _Node, empty: Delimiter) -> Delimiter:
+    """Pattern for the subtree below ``node``, one branch per distinct next character."""
+    branches = []
+    for unit, child in node.children.items():
+        # Collapse chains without branches or delimiter ends into one literal
+        run = [unit]
+        while child.priority is None and len(child.children) == 1:
+            (unit, child), = child.children.items()
+            run.append(unit)
+        branch = re.escape(empty.join(run))
+        if child.children:
+            rest = _emit(child, empty)
+            if child.priority is not None:
+                # Longer delimiters here were listed earlier: try them first
+                rest = _join(empty, '(?:') + rest + _join(empty, ')?')
+            branch += rest
+        branches.append(branch)
+    if len(branches) == 1:
+        return branches[0]
+    return _join(empty, '(?:') + _join(empty, '|').join(branches) + _join(empty, ')')
+
+
+def _nesting(root: _Node) -> int:
+    """Greatest number of nested groups the emitted pattern would hold."""
+    deepest = 0
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if len(node.children) > 1 or node.priority is not None:
+            depth += 1
+        deepest = max(deepest, depth)
+        stack.extend((child, depth) for child in node.children.values())
+    return deepest
+
+
+def _join(empty: Delimiter, text: str) -> Delimiter:
+    """Regex syntax as str or bytes, matching the delimiters."""
+    return text.encode('ascii') if isinstance(empty, bytes) else text
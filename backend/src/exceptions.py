@@ -1,4 +1,5 @@
 """Custom exceptions for String Calculator."""
+from typing import Optional
 
 
 class StringCalculatorError(Exception):
@@ -9,13 +10,84 @@ class StringCalculatorError(Exception):
 class NegativeNumberError(StringCalculatorError):
     """Exception raised when negative numbers are provided."""
     
-    def __init__(self, negatives: list[int]) -> None:
-        """Initialize with list of negative numbers."""
+    def __init__(self, negatives: list[int], count: Optional[int] = None) -> None:
+        """
+        Initialize with the negative numbers found.
+        
+        Args:
+            negatives: Negative numbers to report (possibly only the first ones)
+            count: How many negative numbers the input held (defaults to len(negatives))
+        """
         self.negatives = negatives
+        self.count = len(negatives) if count is None else count
         negative_list = ", ".join(map(str, negatives))
-        super().__init__(f"negative numbers not allowed: {negative_list}")
+        omitted = self.count - len(negatives)
+        suffix = f" (and {omitted} more)" if omitted > 0 else ""
+        super().__init__(f"negative numbers not allowed: {negative_list}{suffix}")
 
 
 class InvalidDelimiterError(StringCalculatorError):
     """Exception raised when delimiter format is invalid."""
     pass
+
+
+class SessionNotFoundError(StringCalculatorError):
+    """Exception raised when a running-sum session is unknown or expired."""
+    
+    def __init__(self, session_id: str) -> None:
+        """Initialize with the requested session id."""
+        self.session_id = session_id
+        super().__init__(f"session not found: {session_id}")
+
+
+class NumericOverflowError(StringCalculatorError):
+    """Exception raised when a sum does not fit the configured numeric mode."""
+    
+    def __init__(self, total: int, numeric: str, subject: str = 'sum') -> None:
+        """Initialize with the exact total, the numeric mode it overflowed and what was summed."""
+        self.total = total
+        self.numeric = numeric
+        super().__init__(f"{subject} {total} overflows the {numeric} numeric mode")
+
+
+class InvalidTokenError(StringCalculatorError):
+    """Exception raised in strict mode when tokens are not valid numbers."""
+    
+    def __init__(self, errors: list, count: Optional[int] = None) -> None:
+        """
+        Initialize with the invalid tokens found.
+        
+        Args:
+            errors: Located tokens (validation.TokenError) to report, in input order
+            count: How many invalid tokens the input held (defaults to len(errors))
+        """
+        self.errors = errors
+        self.count = len(errors) if count is None else count
+        details = "; ".join(
+            f"{error.token!r} at line {error.line}, column {error.column} (byte {error.offset})"
+            for error in errors
+        )
+        omitted = self.count - len(errors)
+        suffix = f" (and {omitted} more)" if omitted > 0 else ""
+        super().__init__(f"invalid tokens: {details}{suffix}")
+
+
+class LimitExceededError(StringCalculatorError):
+    """Exception raised when an input needs more work than a configured limit allows."""
+    
+    def __init__(self, limit: str, value) -> None:
+        """
+        Initialize with the limit that was hit.
+        
+        Args:
+            limit: Name of the limit ("numbers" or "cpu_time")
+            value: Configured value of the limit
+        """
+        self.limit = limit
+        self.value = value
+        super().__init__(f"input exceeds the {limit} limit of {value}")
+
+
+class InvalidBodyError(StringCalculatorError):
+    """Exception raised when a compressed request body cannot be decoded."""
+    pass
@@ -0,0 +1,74 @@
+"""
+Fast JSON serialization for String Calculator API.
+
+Flask's default provider runs every response through the standard library
+encoder, which for a large echoed input costs about as much as the
+calculation itself. FastJSONProvider serializes with ``orjson`` when that
+optional package is installed and falls back to the standard library
+otherwise, or whenever orjson cannot encode a value (integers beyond 64
+bits in bigint mode, non-string keys), so every response stays valid.
+
+Payloads decode to the same JSON values either way: keys are sorted and
+values orjson has no native encoding for (Decimal results, dates) go
+through Flask's own ``default``. Only the bytes differ, as orjson writes
+non-ASCII characters as UTF-8 rather than ``\\uXXXX`` escapes.
+"""
+from typing import Any, Optional
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def encoder_name() -> str:
+    """Name of the encoder FastJSONProvider serializes with."""
+    return 'orjson' if orjson is not None else 'stdlib'
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider serializing with orjson when it is installed."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize obj to a JSON string.
+
+        Args:
+            obj: Value to serialize
+            **kwargs: json.dumps arguments; any given means the standard library is used
+
+        Returns:
+            JSON text (compact when orjson encodes it)
+        """
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        encoded = self._encode(obj, 0)
+        return encoded.decode('utf-8') if encoded is not None else super().dumps(obj)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the arguments as a JSON response, like jsonify.
+
+        Pretty-printed output (debug mode or compact = False) is left to the
+        standard library.
+        """
+        if orjson is None or (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        encoded = self._encode(obj, orjson.OPT_APPEND_NEWLINE)
+        if encoded is None:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(encoded, mimetype=self.mimetype)
+
+    def _encode(self, obj: Any, option: int) -> Optional[bytes]:
+        """orjson bytes for obj, or None if orjson cannot encode it."""
+        option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return None
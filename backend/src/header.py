@@ -0,0 +1,103 @@
+"""
+Bounded custom delimiter header parsing for String Calculator.
+
+Headers take two forms: ``//<char>\\n`` (any single character, newline
+included) and ``//[d1][d2]...\\n``. The parser reads only the first line
+of the input, with plain string searches and no backtracking, and never
+looks further than the configured header length. Worst-case cost is
+therefore bounded by the header, not by the input, however malformed the
+header is.
+
+A bracket header runs from ``//[`` to the first newline and must end with
+``]``. Each delimiter is the text between a ``[`` and the next ``]`` at
+least one character later, so ``[]]`` defines ``]``. Inputs whose first
+line is not a valid header use the default delimiters, as before.
+"""
+from typing import NamedTuple, Optional
+
+from .exceptions import InvalidDelimiterError
+
+
+# Longest header accepted, in characters between "//" and the newline
+MAX_HEADER_LENGTH = 4096
+
+# Most delimiters a bracket header may define
+MAX_DELIMITERS = 256
+
+HEADER_PREFIX = '//'
+
+
+class HeaderMatch(NamedTuple):
+    """A parsed header: its delimiters and where the numbers section starts."""
+    delimiters: list[str]
+    end: int
+
+
+def parse_header(text: str, max_length: int = MAX_HEADER_LENGTH,
+                 max_delimiters: int = MAX_DELIMITERS) -> Optional[HeaderMatch]:
+    """
+    Parse the custom delimiter header at the start of an input, if any.
+
+    Args:
+        text: Full input, or at least its first max_length + 4 characters
+        max_length: Longest header accepted, in characters between "//" and the newline
+        max_delimiters: Most delimiters a bracket header may define
+
+    Returns:
+        The parsed header, or None if the input has none
+
+    Raises:
+        InvalidDelimiterError: If a bracket header runs past max_length
+            characters or defines more than max_delimiters delimiters
+    """
+    if not text.startswith(HEADER_PREFIX):
+        return None
+
+    start = len(HEADER_PREFIX)
+    newline = text.find('\n', start, start + max_length + 1)
+    if newline == -1:
+        if text.startswith('[', start) and len(text) > start + max_length:
+            raise InvalidDelimiterError(f"delimiter header longer than {max_length} characters")
+    elif newline - start >= 3 and text[start] == '[' and text[newline - 1] == ']':
+        return HeaderMatch(_bracketed(text, start, newline, max_delimiters), newline + 1)
+
+    # Single character form; the character itself may be a newline
+    if text.startswith('\n', start + 1):
+        return HeaderMatch([text[start]], start + 2)
+    return None
+
+
+def header_complete(head: str, max_length: int = MAX_HEADER_LENGTH) -> bool:
+    """
+    Check whether an input prefix is long enough for parse_header to decide.
+
+    Args:
+        head: First characters of an input
+        max_length: Longest header accepted, as passed to parse_header
+
+    Returns:
+        True if parsing more of the input could not change the result
+    """
+    if not head.startswith(HEADER_PREFIX):
+        return len(head) >= 2 or (head != '' and head != '/')
+    start = len(HEADER_PREFIX)
+    newline = head.find('\n', start)
+    return (newline != -1 and len(head) > max(newline, start + 1)) or len(head) > start + max_length
+
+
+def _bracketed(text: str, start: int, end: int, max_delimiters: int) -> list[str]:
+    """Extract the delimiters of the bracket header ``text[start:end]``."""
+    delimiters = []
+    pos = start
+    while True:
+        opening = text.find('[', pos, end)
+        if opening == -1:
+            break
+        closing = text.find(']', opening + 2, end)
+        if closing == -1:
+            break
+        if len(delimiters) == max_delimiters:
+            raise InvalidDelimiterError(f"delimiter header defines more than {max_delimiters} delimiters")
+        delimiters.append(text[opening + 1:closing])
+        pos = closing + 1
+    return delimiters
@@ -0,0 +1,92 @@
+"""
+Work limits and backpressure for String Calculator.
+
+A WorkBudget caps the work spent on one input: the engines charge it with
+the numbers of each window they split, so an input with too many numbers,
+or one that has used up its CPU time, is abandoned between windows instead
+of running to completion. CPU time is measured per thread, so concurrent
+requests do not consume each other's allowance.
+
+A ConcurrencyLimiter bounds how many heavy requests run at once; requests
+beyond its capacity are turned away immediately rather than queued, which
+keeps one burst of large inputs from starving everything else.
+"""
+import threading
+import time
+from typing import Optional
+
+from .exceptions import LimitExceededError
+
+
+class WorkBudget:
+    """Allowance of numbers and CPU time for one input."""
+
+    def __init__(self, max_numbers: Optional[int] = None, max_cpu_time: Optional[float] = None) -> None:
+        """
+        Start the allowance; the CPU clock starts now.
+
+        Args:
+            max_numbers: Most numbers the input may hold (None = unlimited)
+            max_cpu_time: Most CPU seconds spent parsing it (None = unlimited)
+        """
+        self.max_numbers = max_numbers
+        self.max_cpu_time = max_cpu_time
+        self.numbers = 0
+        self._deadline = time.thread_time() + max_cpu_time if max_cpu_time is not None else None
+
+    def charge(self, count: int) -> None:
+        """
+        Account for ``count`` more numbers and check both limits.
+
+        Raises:
+            LimitExceededError: If either limit has been exceeded
+        """
+        self.numbers += count
+        if self.max_numbers is not None and self.numbers > self.max_numbers:
+            raise LimitExceededError('numbers', self.max_numbers)
+        if self._deadline is not None and time.thread_time() > self._deadline:
+            raise LimitExceededError('cpu_time', self.max_cpu_time)
+
+
+class ConcurrencyLimiter:
+    """Thread-safe cap on the number of heavy requests in flight."""
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize an idle limiter.
+
+        Args:
+            capacity: Most heavy requests allowed to run at once
+
+        Raises:
+            ValueError: If capacity is smaller than 1
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.in_flight = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free; count a rejection otherwise."""
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """Give back a slot taken by try_acquire()."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self) -> dict:
+        """Return current load and counters as a JSON-friendly dict."""
+        with self._lock:
+            return {
+                'capacity': self.capacity,
+                'in_flight': self.in_flight,
+                'rejected': self.rejected
+            }
@@ -0,0 +1,293 @@
+"""
+Load generator for the String Calculator API.
+
+Fires synthetic POST /api/add requests, mixing every delimiter form and a
+range of input sizes, at a running server (e.g. ``python run_api.py``) or
+at one started in-process, and reports throughput, latency percentiles
+and how many responses came from the server's result cache (X-Cache).
+
+A fixed pool of inputs is cycled, so after the first pass most requests hit
+the result cache and the run measures cache lookups. Pass --salt to append
+a distinct number to every request instead, so each one is parsed.
+
+    python -m src.loadgen --url http://127.0.0.1:5000 --concurrency 16 --duration 30 --salt
+    python -m src.loadgen --in-process --duration 5 --json
+"""
+import argparse
+import http.client
+import json
+import math
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from .string_calculator import StringCalculator
+from .workloads import STYLES, generate_input
+
+
+class WorkItem(NamedTuple):
+    """One prepared request: JSON body and the result the server should return."""
+    body: bytes
+    expected: int
+    size: int
+    # JSON-escaped delimiter of the input, used to append a salt number
+    separator: bytes = b','
+
+    def salted(self, salt: int) -> tuple[bytes, int]:
+        """Body with ``salt`` appended as one more number, and the matching result."""
+        # The body ends with the closing '"}' of {"numbers": "..."}
+        return self.body[:-2] + self.separator + str(salt).encode('ascii') + b'"}', self.expected + salt
+
+
+class LoadReport(NamedTuple):
+    """Outcome of a load run; latencies in milliseconds."""
+    requests: int
+    errors: dict
+    mismatches: int
+    duration: float
+    input_bytes: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    cache_hits: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Successful requests per second."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of successful requests answered from the result cache."""
+        return self.cache_hits / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> dict:
+        """Report as a JSON-friendly dict."""
+        return {**self._asdict(), 'throughput': self.throughput, 'cache_hit_ratio': self.cache_hit_ratio}
+
+    def format(self) -> str:
+        """Human-readable summary."""
+        lines = [
+            f"Requests:    {self.requests} in {self.duration:.2f}s ({self.throughput:.1f} req/s, "
+            f"{self.input_bytes / self.duration / 1e6 if self.duration else 0:.2f} MB/s of input)",
+            f"Latency ms:  p50 {self.p50:.2f}  p95 {self.p95:.2f}  p99 {self.p99:.2f}  max {self.max:.2f}",
+            f"Cache hits:  {self.cache_hits} ({self.cache_hit_ratio:.1%})",
+            f"Errors:      {sum(self.errors.values())} {self.errors or ''}".rstrip(),
+            f"Mismatches:  {self.mismatches}",
+        ]
+        return '\n'.join(lines)
+
+
+def build_workload(count: int = 500, min_size: int = 10, max_size: int = 100_000,
+                   styles: Optional[list[str]] = None, seed: int = 0) -> list[WorkItem]:
+    """
+    Prepare a reproducible mix of requests.
+
+    Sizes are drawn log-uniformly between min_size and max_size, so small
+    inputs dominate while large ones still appear; styles are drawn evenly.
+
+    Args:
+        count: Number of distinct requests
+        min_size: Smallest input in characters
+        max_size: Largest input in characters
+        styles: Delimiter forms to mix (all of workloads.STYLES if omitted)
+        seed: Seed for sizes, styles and numbers
+
+    Returns:
+        Prepared requests with their expected results
+    """
+    rng = random.Random(seed)
+    styles = styles or list(STYLES)
+    calculator = StringCalculator(engine='scan')
+    items = []
+    for _ in range(count):
+        size = int(round(min_size * (max_size / min_size) ** rng.random()))
+        style = rng.choice(styles)
+        numbers = generate_input(style, size, rng=rng)
+        body = json.dumps({'numbers': numbers}).encode('utf-8')
+        separator = json.dumps(STYLES[style][1][0])[1:-1].encode('ascii')
+        items.append(WorkItem(body, calculator.add(numbers), len(numbers), separator))
+    return items
+
+
+def run_load(url: str, workload: list[WorkItem], concurrency: int = 8, duration: float = 10.0,
+             max_requests: Optional[int] = None, timeout: float = 30.0, salt: bool = False) -> LoadReport:
+    """
+    Drive POST /api/add with concurrent keep-alive clients.
+
+    Args:
+        url: Base URL of the server, e.g. http://127.0.0.1:5000
+        workload: Requests to cycle through
+        concurrency: Number of client threads
+        duration: Seconds to run
+        max_requests: Stop after this many requests in total (None = no limit)
+        timeout: Socket timeout per request in seconds
+        salt: Append a distinct number to every request so none can be
+            answered from the server's result cache
+
+    Returns:
+        Aggregated report
+    """
+    target = urlsplit(url)
+    path = (target.path.rstrip('/') or '') + '/api/add'
+    headers = {'Content-Type': 'application/json'}
+    lock = threading.Lock()
+    latencies: list[float] = []
+    errors: dict[str, int] = {}
+    totals = {'issued': 0, 'mismatches': 0, 'bytes': 0, 'cache_hits': 0}
+    deadline = time.monotonic() + duration
+
+    def claim() -> Optional[int]:
+        """Take the next request number, or None once max_requests were issued."""
+        with lock:
+            if max_requests is not None and totals['issued'] >= max_requests:
+                return None
+            totals['issued'] += 1
+            return totals['issued']
+
+    def client(index: int) -> None:
+        connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=timeout)
+        position = index
+        while time.monotonic() < deadline:
+            number = claim()
+            if number is None:
+                break
+            item = workload[position % len(workload)]
+            position += concurrency
+            body, expected = item.salted(number) if salt else (item.body, item.expected)
+            started = time.perf_counter()
+            try:
+                connection.request('POST', path, body=body, headers=headers)
+                response = connection.getresponse()
+                payload = response.read()
+                elapsed = (time.perf_counter() - started) * 1000
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                with lock:
+                    errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                continue
+
+            with lock:
+                if response.status != 200:
+                    errors[f'HTTP {response.status}'] = errors.get(f'HTTP {response.status}', 0) + 1
+                    continue
+                latencies.append(elapsed)
+                totals['bytes'] += item.size
+                if response.getheader('X-Cache') == 'HIT':
+                    totals['cache_hits'] += 1
+                if json.loads(payload).get('result') != expected:
+                    totals['mismatches'] += 1
+        connection.close()
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=client, args=(index,), daemon=True) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return LoadReport(
+        requests=len(latencies),
+        errors=errors,
+        mismatches=totals['mismatches'],
+        duration=elapsed,
+        input_bytes=totals['bytes'],
+        p50=percentile(latencies, 0.50),
+        p95=percentile(latencies, 0.95),
+        p99=percentile(latencies, 0.99),
+        max=latencies[-1] if latencies else 0.0,
+        cache_hits=totals['cache_hits'],
+    )
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list.
+
+    Args:
+        ordered: Values sorted ascending
+        fraction: Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        The percentile value, or 0.0 for an empty list
+    """
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@contextmanager
+def serve_in_process(host: str = '127.0.0.1', port: int = 0) -> Iterator[str]:
+    """
+    Serve the Flask app from a background thread for the duration of the block.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+
+    Yields:
+        Base URL of the running server
+    """
+    from werkzeug.serving import make_server
+
+    from .api import app
+
+    server = make_server(host, port, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://{host}:{server.server_port}'
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit status: 0, or 1 if any request failed or returned a wrong result
+    """
+    parser = argparse.ArgumentParser(description='Load-test the String Calculator API.')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', default='http://127.0.0.1:5000', help='server base URL (default: %(default)s)')
+    target.add_argument('--in-process', action='store_true', help='start the API in this process instead')
+    parser.add_argument('--concurrency', type=int, default=8, help='client threads (default: %(default)s)')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds to run (default: %(default)s)')
+    parser.add_argument('--requests', type=int, default=None, help='stop after this many requests')
+    parser.add_argument('--unique', type=int, default=500, help='distinct inputs to cycle through (default: %(default)s)')
+    parser.add_argument('--min-size', type=int, default=10, help='smallest input in characters (default: %(default)s)')
+    parser.add_argument('--max-size', type=int, default=100_000, help='largest input in characters (default: %(default)s)')
+    parser.add_argument('--styles', nargs='+', choices=list(STYLES), help='delimiter forms to mix (default: all)')
+    parser.add_argument('--seed', type=int, default=0, help='workload seed (default: %(default)s)')
+    parser.add_argument('--salt', action='store_true',
+                        help='make every request unique so the result cache cannot answer it')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    workload = build_workload(args.unique, args.min_size, args.max_size, args.styles, args.seed)
+
+    if args.in_process:
+        with serve_in_process() as url:
+            report = run_load(url, workload, args.concurrency, args.duration, args.requests, salt=args.salt)
+    else:
+        report = run_load(args.url, workload, args.concurrency, args.duration, args.requests, salt=args.salt)
+
+    print(json.dumps(report.as_dict(), indent=2) if args.json else report.format())
+    return 1 if report.errors or report.mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Prometheus-style metrics for String Calculator.
+
+A small, dependency-free registry of counters and histograms rendered in
+the Prometheus text exposition format (version 0.0.4). Values live in the
+current process; under the pre-fork server each worker reports its own.
+"""
+import bisect
+import math
+import threading
+from typing import Iterable, Optional
+
+from .observers import CalculatorObserver
+
+
+# Content-Type of the text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Phase latency buckets in seconds (10 µs .. 10 s)
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Input size buckets in characters (10 .. 100M)
+SIZE_BUCKETS = (10, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        """
+        Initialize the counter.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labelnames: Label names, matched positionally by inc()
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Increase the series for the given label values."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Current value of one series (0 if never incremented)."""
+        return self._values.get(labels, 0)
+
+    def samples(self) -> list[str]:
+        """Exposition lines for every series."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in items]
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets and optional labels."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, buckets: Iterable[float],
+                 labelnames: Iterable[str] = ()) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            buckets: Upper bounds, without +Inf
+            labelnames: Label names, matched positionally by observe()
+        """
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = tuple(labelnames)
+        # Per series: one count per bucket, then +Inf, then the running sum
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for the given label values."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        """Number of observations in one series."""
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> list[str]:
+        """Exposition lines (buckets, sum, count) for every series."""
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+
+        lines = []
+        for labels, series in items:
+            cumulative = 0
+            for bound, observed in zip(self.buckets + (math.inf,), series):
+                cumulative += observed
+                bucket_labels = _labels(self.labelnames + ('le',), labels + (_number(bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {_number(cumulative)}")
+            series_labels = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{series_labels} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{series_labels} {_number(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: list = []
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, buckets: Iterable[float],
+                  labelnames: Iterable[str] = ()) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(Histogram(name, documentation, buckets, labelnames))
+
+    def render(self) -> str:
+        """
+        Render every registered metric.
+
+        Returns:
+            Metrics in the Prometheus text exposition format
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+    def _register(self, metric):
+        if any(existing.name == metric.name for existing in self._metrics):
+            raise ValueError(f"Duplicate metric name: {metric.name}")
+        self._metrics.append(metric)
+        return metric
+
+
+class ServiceMetrics(CalculatorObserver):
+    """
+    Metrics for the calculator service.
+
+    Doubles as a StringCalculator observer: attach it as
+    ``calculator.observer`` to record input sizes and phase latencies
+    (header, delimiters, split, parse, sum; "scan" for fused engines).
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        """
+        Initialize and register the service metrics.
+
+        Args:
+            registry: Registry to add the metrics to (a new one if omitted)
+        """
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.requests = self.registry.counter(
+            'calculator_requests_total', 'HTTP requests handled, by endpoint, method and status.',
+            ('endpoint', 'method', 'status'))
+        self.errors = self.registry.counter(
+            'calculator_errors_total', 'Failed requests, by error type.', ('type',))
+        self.input_size = self.registry.histogram(
+            'calculator_input_chars', 'Size of calculator inputs in characters.', SIZE_BUCKETS)
+        self.phase_seconds = self.registry.histogram(
+            'calculator_phase_seconds', 'Time spent per processing phase in seconds.', LATENCY_BUCKETS, ('phase',))
+
+    def observe_input(self, size: int) -> None:
+        """Record the size of one calculator input."""
+        self.input_size.observe(size)
+
+    def observe_phase(self, phase: str, seconds: float) -> None:
+        """Record the duration of one processing phase."""
+        self.phase_seconds.observe(seconds, phase)
+
+    def header_parsed(self, input_size: int, header_length: int, seconds: float) -> None:
+        self.observe_input(input_size)
+        self.observe_phase('header', seconds)
+
+    def delimiters_resolved(self, delimiters: list[str], seconds: float) -> None:
+        self.observe_phase('delimiters', seconds)
+
+    def parts_split(self, parts: int, seconds: float) -> None:
+        self.observe_phase('split', seconds)
+
+    def numbers_parsed(self, numbers: int, rejected: int, seconds: float) -> None:
+        self.observe_phase('parse', seconds)
+
+    def sum_finished(self, total: int, seconds: float, engine: str) -> None:
+        self.observe_phase('sum' if engine == 'regex' else 'scan', seconds)
+
+    def count_request(self, endpoint: str, method: str, status: int) -> None:
+        """Count one handled HTTP request."""
+        self.requests.inc(endpoint, method, str(status))
+
+    def count_error(self, error_type: str) -> None:
+        """Count one failed request."""
+        self.errors.inc(error_type)
+
+    def render(self) -> str:
+        """Render the registry in the Prometheus text format."""
+        return self.registry.render()
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """Format a label set, escaping values as the text format requires."""
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+def _number(value: float) -> str:
+    """Format a sample value or bucket bound."""
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
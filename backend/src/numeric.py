@@ -0,0 +1,154 @@
+"""
+Numeric modes for String Calculator.
+
+The calculator sums integers with Python's arbitrary-precision ``int`` by
+default ("bigint"). The other modes are:
+
+- "int64": signed 64-bit integers. NumericOverflowError is raised when a
+  token, or the sum of the positive or of the negative tokens, does not
+  fit, so "99999999999999999999999,-99999999999999999999990" is rejected
+  like any input an int64 accumulator would overflow on. The engines
+  still sum exactly and report every negative token they meet, and the
+  check bounds each token by those two sums, so no token is range-checked
+  on its own. The mode is not faster by itself; its speed comes from
+  defaulting to the "auto" engine, which bigint calculators get too with
+  engine="auto".
+- "decimal": tokens are read as ``decimal.Decimal`` ("1.5", "2e3"); the sum
+  follows the active decimal context (28 significant digits by default).
+- "float": tokens are read as binary floats.
+
+In the integer modes, a fraction policy decides what happens to tokens that
+are valid decimals but not integers: "skip" treats them as invalid (the
+historical behaviour), "truncate" drops the fraction, "round" rounds half to
+even. Non-finite values (nan, inf) are always invalid. Converters return
+None for invalid tokens, which are recognised by shape without raising.
+"""
+import math
+import re
+from decimal import ROUND_DOWN, ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import Callable, Optional, Union
+
+from .exceptions import NumericOverflowError
+from .scanner import integer_value
+
+
+# Available numeric modes; the first one is the default
+NUMERIC_MODES = ('bigint', 'int64', 'decimal', 'float')
+
+# What the integer modes do with non-integral tokens; the first one is the default
+FRACTION_POLICIES = ('skip', 'truncate', 'round')
+
+# Signed 64-bit range
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# Integral values with more digits are invalid, like int() strings over the default limit
+MAX_INTEGER_DIGITS = 4300
+
+Number = Union[int, Decimal, float]
+
+# Finite decimal literals as Decimal() and float() accept them, after stripping
+_DIGITS = r'\d+(?:_\d+)*'
+DECIMAL_TOKEN = re.compile(rf'[+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?')
+
+_ROUNDING = {'truncate': ROUND_DOWN, 'round': ROUND_HALF_EVEN}
+
+
+def validate_mode(numeric: str, fraction_policy: str) -> None:
+    """
+    Check a numeric mode and fraction policy.
+
+    Raises:
+        ValueError: If either name is unknown
+    """
+    if numeric not in NUMERIC_MODES:
+        raise ValueError(f"Unknown numeric mode: {numeric!r} (expected one of {', '.join(NUMERIC_MODES)})")
+    if fraction_policy not in FRACTION_POLICIES:
+        raise ValueError(f"Unknown fraction policy: {fraction_policy!r} "
+                         f"(expected one of {', '.join(FRACTION_POLICIES)})")
+
+
+def token_converter(numeric: str, fraction_policy: str = 'skip') -> Optional[Callable[[Union[str, bytes]], Number]]:
+    """
+    Build the per-token conversion for a numeric mode.
+
+    Args:
+        numeric: Numeric mode, one of NUMERIC_MODES
+        fraction_policy: Fraction policy, one of FRACTION_POLICIES
+
+    Returns:
+        A function mapping one token to its value (None when invalid), or
+        None when the mode uses the engines' built-in integer rules
+    """
+    if numeric == 'decimal':
+        return decimal_value
+    if numeric == 'float':
+        return float_value
+    if fraction_policy == 'skip':
+        return None
+
+    rounding = _ROUNDING[fraction_policy]
+
+    def integral_value(token: Union[str, bytes]) -> Optional[int]:
+        value = integer_value(token)
+        if value is not None:
+            return value
+        value = decimal_value(token)
+        if value is None or value.adjusted() >= MAX_INTEGER_DIGITS:
+            return None
+        return int(value.to_integral_value(rounding=rounding))
+
+    return integral_value
+
+
+def check_int64(total: int, negative_total: int = 0) -> int:
+    """
+    Ensure a sum and every token in it fit a signed 64-bit integer.
+
+    Each token lies between the sum of the negative tokens and the sum of
+    the positive ones, so checking both sums covers every token too.
+
+    Args:
+        total: Exact sum of all tokens
+        negative_total: Exact sum of the negative tokens
+
+    Returns:
+        The total, unchanged
+
+    Raises:
+        NumericOverflowError: If either sum does not fit
+    """
+    if negative_total < INT64_MIN:
+        raise NumericOverflowError(negative_total, 'int64', 'sum of negative numbers')
+    if total - negative_total > INT64_MAX:
+        subject = 'sum of positive numbers' if negative_total else 'sum'
+        raise NumericOverflowError(total - negative_total, 'int64', subject)
+    return total
+
+
+def decimal_value(token: Union[str, bytes]) -> Optional[Decimal]:
+    """Convert one token to a Decimal; None if it is not a finite decimal literal."""
+    token = _text(token)
+    if DECIMAL_TOKEN.fullmatch(token) is None:
+        return None
+    try:
+        return Decimal(token)
+    except InvalidOperation:
+        return None
+
+
+def float_value(token: Union[str, bytes]) -> Optional[float]:
+    """Convert one token to a float; None if it is not a finite decimal literal."""
+    token = _text(token)
+    if DECIMAL_TOKEN.fullmatch(token) is None:
+        return None
+    value = float(token)
+    # Literals beyond the float range overflow to infinity
+    return value if math.isfinite(value) else None
+
+
+def _text(token: Union[str, bytes]) -> str:
+    """Decode and strip a token like the integer rules do."""
+    if isinstance(token, (bytes, bytearray)):
+        token = token.decode('utf-8', errors='replace')
+    return token.strip()
@@ -0,0 +1,100 @@
+"""
+Profiling hooks for String Calculator.
+
+Attach a CalculatorObserver to ``StringCalculator.observer`` to receive a
+callback after each phase of add(), with its duration and counts. With no
+observer attached, add() runs its normal path and pays a single ``is None``
+check.
+"""
+
+
+class CalculatorObserver:
+    """
+    Base class for add() observers; every callback defaults to a no-op.
+
+    Engines that split, parse and sum in one fused pass ("scan", "numpy",
+    "parallel") report only header_parsed, delimiters_resolved and
+    sum_finished, whose duration then covers the whole numbers section.
+    """
+
+    def header_parsed(self, input_size: int, header_length: int, seconds: float) -> None:
+        """
+        Called once the optional custom delimiter header has been matched.
+
+        Args:
+            input_size: Length of the whole input in characters
+            header_length: Characters taken by the header (0 if none)
+            seconds: Time spent matching the header
+        """
+
+    def delimiters_resolved(self, delimiters: list[str], seconds: float) -> None:
+        """
+        Called once the delimiter list has been extracted from the header.
+
+        Args:
+            delimiters: Delimiters in precedence order
+            seconds: Time spent extracting them
+        """
+
+    def parts_split(self, parts: int, seconds: float) -> None:
+        """
+        Called after the numbers section has been split into tokens.
+
+        Args:
+            parts: Number of tokens produced
+            seconds: Time spent splitting
+        """
+
+    def numbers_parsed(self, numbers: int, rejected: int, seconds: float) -> None:
+        """
+        Called after the tokens have been converted to integers.
+
+        Args:
+            numbers: Number of tokens converted
+            rejected: Tokens int() rejected as-is (blank or invalid), which
+                sent the conversion down the slow per-token path
+            seconds: Time spent converting
+        """
+
+    def sum_finished(self, total: int, seconds: float, engine: str) -> None:
+        """
+        Called with the final result of add().
+
+        Args:
+            total: Sum returned by add()
+            seconds: Time spent summing (the whole section for fused engines)
+            engine: Engine that produced the sum: regex, scan, numpy or parallel
+        """
+
+
+class MultiObserver(CalculatorObserver):
+    """Fan every callback out to several observers, in order."""
+
+    def __init__(self, *observers: CalculatorObserver) -> None:
+        """
+        Initialize the group.
+
+        Args:
+            observers: Observers receiving each callback
+        """
+        self.observers = list(observers)
+
+    def header_parsed(self, input_size: int, header_length: int, seconds: float) -> None:
+        for observer in self.observers:
+            observer.header_parsed(input_size, header_length, seconds)
+
+    def delimiters_resolved(self, delimiters: list[str], seconds: float) -> None:
+        for observer in self.observers:
+            observer.delimiters_resolved(delimiters, seconds)
+
+    def parts_split(self, parts: int, seconds: float) -> None:
+        for observer in self.observers:
+            observer.parts_split(parts, seconds)
+
+    def numbers_parsed(self, numbers: int, rejected: int, seconds: float) -> None:
+        for observer in self.observers:
+            observer.numbers_parsed(numbers, rejected, seconds)
+
+    def sum_finished(self, total: int, seconds: float, engine: str) -> None:
+        for observer in self.observers:
+            observer.sum_finished(total, seconds, engine)
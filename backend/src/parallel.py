@@ -0,0 +1,112 @@
+"""
+Parallel chunked summation for String Calculator.
+
+Cuts a large numbers section into delimiter-aligned spans, sums them in a
+process pool and adds up the partial sums. Each worker runs the scanning
+engine on its span, so results are identical to a serial scan.
+"""
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Union
+
+from .scanner import aligned_spans, scan_sum
+from .validation import NegativeCollector
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Turn a worker setting into a concrete process count.
+
+    Args:
+        workers: Requested worker count, or None for one per CPU
+
+    Returns:
+        Number of worker processes to use (at least 1)
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def parallel_sum(text: str, delimiters: list[str], start: int, workers: int,
+                 negatives: Optional[NegativeCollector] = None) -> int:
+    """
+    Sum the numbers section of an in-memory string across worker processes.
+
+    Args:
+        text: Full input string
+        delimiters: Resolved delimiters, in precedence order
+        start: Index where the numbers section begins
+        workers: Number of worker processes
+        negatives: Collector that records negative numbers, merged in span order
+
+    Returns:
+        Sum of all valid numbers
+    """
+    spans = aligned_spans(text, delimiters, start, len(text), workers)
+    if len(spans) == 1:
+        return scan_sum(text, delimiters, start, negatives=negatives)
+
+    with ProcessPoolExecutor(max_workers=len(spans)) as pool:
+        futures = [pool.submit(_sum_span, text[low:high], delimiters, _fresh(negatives)) for low, high in spans]
+        return _gather(futures, negatives)
+
+
+def parallel_file_sum(path: Union[str, os.PathLike], mapped: mmap.mmap, delimiters: list[bytes],
+                      start: int, workers: int, negatives: Optional[NegativeCollector] = None) -> int:
+    """
+    Sum the numbers section of a memory-mapped file across worker processes.
+
+    Only span offsets cross the process boundary; each worker maps the file
+    itself, so no file data is pickled.
+
+    Args:
+        path: Path of the mapped file, reopened by each worker
+        mapped: Parent's mapping, used to find span boundaries
+        delimiters: UTF-8 encoded delimiters, in precedence order
+        start: Byte offset where the numbers section begins
+        workers: Number of worker processes
+        negatives: Collector that records negative numbers, merged in span order
+
+    Returns:
+        Sum of all valid numbers
+    """
+    spans = aligned_spans(mapped, delimiters, start, len(mapped), workers)
+    if len(spans) == 1:
+        return scan_sum(mapped, delimiters, start, negatives=negatives)
+
+    with ProcessPoolExecutor(max_workers=len(spans)) as pool:
+        futures = [pool.submit(_sum_file_span, os.fspath(path), delimiters, low, high, _fresh(negatives))
+                   for low, high in spans]
+        return _gather(futures, negatives)
+
+
+def _sum_span(text: str, delimiters: list[str],
+              negatives: Optional[NegativeCollector]) -> tuple[int, Optional[NegativeCollector]]:
+    """Worker entry point: scan one span, returning its collector with the sum."""
+    return scan_sum(text, delimiters, negatives=negatives), negatives
+
+
+def _sum_file_span(path: str, delimiters: list[bytes], start: int, end: int,
+                   negatives: Optional[NegativeCollector]) -> tuple[int, Optional[NegativeCollector]]:
+    """Worker entry point: map the file and scan one span of it."""
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return scan_sum(mapped, delimiters, start, end, negatives=negatives), negatives
+
+
+def _fresh(negatives: Optional[NegativeCollector]) -> Optional[NegativeCollector]:
+    """Empty collector with the same limit for one worker, or None."""
+    return NegativeCollector(negatives.limit, negatives.reject) if negatives is not None else None
+
+
+def _gather(futures: list, negatives: Optional[NegativeCollector]) -> int:
+    """Add up worker sums and merge their collectors in span order."""
+    total = 0
+    for future in futures:
+        partial, collected = future.result()
+        total += partial
+        if negatives is not None:
+            negatives.merge(collected)
+    return total
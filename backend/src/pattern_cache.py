@@ -0,0 +1,115 @@
+"""
+Compiled delimiter-pattern cache for String Calculator.
+
+Keeps the split pattern for each delimiter set compiled and ready, so inputs
+that reuse the same custom delimiter header never pay compilation cost.
+Patterns are compiled from a prefix tree of the delimiters (see
+delimiter_trie), so matching cost does not grow with the delimiter count.
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from .delimiter_trie import trie_pattern
+
+
+class CacheInfo(NamedTuple):
+    """Snapshot of pattern cache statistics."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PatternCache:
+    """
+    Bounded, thread-safe LRU cache of compiled delimiter split patterns.
+
+    Patterns are keyed on the delimiter tuple in precedence order, because
+    the order of alternatives decides which delimiter wins on overlap.
+    """
+
+    DEFAULT_MAXSIZE = 128
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of compiled patterns kept
+
+        Raises:
+            ValueError: If maxsize is smaller than 1
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._patterns: OrderedDict[tuple[str, ...], re.Pattern] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of compiled patterns kept."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        """Resize the cache, evicting least recently used patterns if needed."""
+        if value < 1:
+            raise ValueError("maxsize must be at least 1")
+        with self._lock:
+            self._maxsize = value
+            while len(self._patterns) > value:
+                self._patterns.popitem(last=False)
+
+    def get(self, delimiters: list[str]) -> re.Pattern:
+        """
+        Return the compiled split pattern for a delimiter set.
+
+        Args:
+            delimiters: Delimiter strings (or bytes), in precedence order
+
+        Returns:
+            Compiled pattern matching the delimiters with alternation precedence
+        """
+        key = tuple(delimiters)
+        with self._lock:
+            pattern = self._patterns.get(key)
+            if pattern is not None:
+                self._patterns.move_to_end(key)
+                self.hits += 1
+                return pattern
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss just compiles twice
+        pattern = re.compile(trie_pattern(list(key)))
+
+        with self._lock:
+            self._patterns[key] = pattern
+            self._patterns.move_to_end(key)
+            while len(self._patterns) > self._maxsize:
+                self._patterns.popitem(last=False)
+        return pattern
+
+    def clear(self) -> None:
+        """Drop all cached patterns and reset the counters."""
+        with self._lock:
+            self._patterns.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return current hit/miss counters and size."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._patterns))
+
+    def __len__(self) -> int:
+        """Number of patterns currently cached."""
+        return len(self._patterns)
+
+
+# Shared cache used by every calculator unless one is passed explicitly
+default_pattern_cache = PatternCache()
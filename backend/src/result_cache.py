@@ -0,0 +1,152 @@
+"""
+Result cache for String Calculator API.
+
+Remembers the sum computed for each input, keyed by a hash of the input
+string, so repeated requests skip parsing entirely. Entries expire after a
+TTL and the least recently used ones are evicted to respect both an entry
+limit and a byte budget.
+"""
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class ResultCache:
+    """Thread-safe LRU/TTL cache of calculator results with a byte cap."""
+
+    # Approximate per-entry bookkeeping cost (dict slot, tuple, floats)
+    ENTRY_OVERHEAD = 128
+
+    def __init__(self, max_entries: int = 10000, ttl: Optional[float] = 300.0,
+                 max_bytes: int = 16 * 1024 * 1024, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            ttl: Seconds an entry stays valid (None = never expires)
+            max_bytes: Maximum estimated memory used by entries
+            clock: Monotonic time source, injectable for tests
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[int, float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_for(numbers_input: str) -> bytes:
+        """
+        Hash an input string into a fixed-size cache key.
+
+        Args:
+            numbers_input: Raw calculator input
+
+        Returns:
+            128-bit BLAKE2b digest of the UTF-8 encoded input
+        """
+        return hashlib.blake2b(numbers_input.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[int]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from key_for()
+
+        Returns:
+            Cached result, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires, size = entry
+                if expires >= self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                self._remove(key, size)
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, result: int) -> None:
+        """
+        Store a result, evicting old entries to stay within limits.
+
+        Args:
+            key: Cache key from key_for()
+            result: Calculator result for that input
+        """
+        size = len(key) + sys.getsizeof(result) + self.ENTRY_OVERHEAD
+        if size > self.max_bytes or self.max_entries < 1:
+            return
+        expires = self._clock() + self.ttl if self.ttl is not None else float('inf')
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (result, expires, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest, (_, _, oldest_size) = next(iter(self._entries.items()))
+                self._remove(oldest, oldest_size)
+                self.evictions += 1
+
+    def get_or_compute(self, numbers_input: str, compute: Callable[[str], int]) -> tuple[int, bool]:
+        """
+        Return the cached result for an input, computing it on a miss.
+
+        Args:
+            numbers_input: Raw calculator input
+            compute: Function producing the result on a miss
+
+        Returns:
+            Tuple of (result, whether it was a cache hit)
+        """
+        key = self.key_for(numbers_input)
+        result = self.get(key)
+        if result is not None:
+            return result, True
+        result = compute(numbers_input)
+        self.put(key, result)
+        return result, False
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return counters and current size as a JSON-friendly dict."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def _remove(self, key: bytes, size: int) -> None:
+        """Remove one entry; caller holds the lock."""
+        del self._entries[key]
+        self._bytes -= size
@@ -0,0 +1,133 @@
+"""
+Configurable number rules for String Calculator.
+
+A rule set constrains which tokens count and how they are read:
+
+- max_value / min_value: numbers outside the range are ignored (they add 0
+  and are not errors), e.g. the kata rule "numbers bigger than 1000 are
+  ignored" is ``NumberRules(max_value=1000)``.
+- signs: the leading signs a token may carry ("+-" by default); a token
+  with any other sign is invalid.
+- digit_grouping: the character allowed between digit groups ("_" by
+  default, as in "1_000"); None forbids grouping, another character such
+  as "'" reads "1'000" as 1000 instead.
+
+Rules are compiled once into a per-token converter that the parser loops
+call as they go, so nothing is filtered after parsing. Calculators without
+rules keep their plain integer fast path.
+"""
+from typing import Callable, Optional, Union
+
+from .numeric import INT64_MAX, INT64_MIN, Number
+from .scanner import integer_value
+
+
+# Signs a token may carry
+SIGNS = '+-'
+
+# Digit grouping separator Python's int() accepts
+DEFAULT_GROUPING = '_'
+
+
+class NumberRules:
+    """Value range and token syntax constraints applied while parsing."""
+
+    def __init__(self, max_value: Optional[Number] = None, min_value: Optional[Number] = None,
+                 signs: str = SIGNS, digit_grouping: Optional[str] = DEFAULT_GROUPING) -> None:
+        """
+        Initialize a rule set.
+
+        Args:
+            max_value: Numbers above it are ignored (None = no limit)
+            min_value: Numbers below it are ignored (None = no limit)
+            signs: Leading signs a token may carry, any of "+-" ("" = none)
+            digit_grouping: Character allowed between digit groups (None = none)
+
+        Raises:
+            ValueError: If the range is empty, a sign is unknown or the
+                grouping character could be read as part of a number
+        """
+        if max_value is not None and min_value is not None and min_value > max_value:
+            raise ValueError(f"min_value {min_value!r} is above max_value {max_value!r}")
+        unknown = set(signs) - set(SIGNS)
+        if unknown:
+            raise ValueError(f"Unknown signs: {''.join(sorted(unknown))!r} (expected any of {SIGNS!r})")
+        if digit_grouping is not None and (len(digit_grouping) != 1 or digit_grouping.isdigit()
+                                           or digit_grouping.isspace() or digit_grouping in SIGNS + '.'):
+            raise ValueError(f"Invalid digit grouping character: {digit_grouping!r}")
+        self.max_value = max_value
+        self.min_value = min_value
+        self.signs = signs
+        self.digit_grouping = digit_grouping
+        self._syntax = set(signs) != set(SIGNS) or digit_grouping != DEFAULT_GROUPING
+        # Precompiled integer conversion, also used by the NumPy engine
+        self.value = self.converter()
+
+    @property
+    def active(self) -> bool:
+        """Whether any rule differs from plain integer parsing."""
+        return self._syntax or self.max_value is not None or self.min_value is not None
+
+    def bounds(self) -> tuple[int, int]:
+        """Value range clamped to int64, for comparisons inside NumPy arrays."""
+        low = INT64_MIN if self.min_value is None else min(max(self.min_value, INT64_MIN), INT64_MAX)
+        high = INT64_MAX if self.max_value is None else min(max(self.max_value, INT64_MIN), INT64_MAX)
+        return low, high
+
+    def converter(self, base: Optional[Callable[[Union[str, bytes]], Optional[Number]]] = None
+                  ) -> Callable[[Union[str, bytes]], Optional[Number]]:
+        """
+        Build a per-token conversion enforcing these rules.
+
+        Args:
+            base: Conversion applied once the syntax rules pass (see
+                numeric.token_converter; None = the integer rules)
+
+        Returns:
+            A function mapping one token to its value, 0 when the value is
+            out of range, or None when the token is invalid
+        """
+        parse = base if base is not None else integer_value
+        if self._syntax:
+            parse = self._syntax_check(parse)
+
+        low, high = self.min_value, self.max_value
+        if low is None and high is None:
+            return parse
+        if low is None:
+            def ranged(token: Union[str, bytes]) -> Optional[Number]:
+                value = parse(token)
+                return 0 if value is not None and value > high else value
+        elif high is None:
+            def ranged(token: Union[str, bytes]) -> Optional[Number]:
+                value = parse(token)
+                return 0 if value is not None and value < low else value
+        else:
+            def ranged(token: Union[str, bytes]) -> Optional[Number]:
+                value = parse(token)
+                if value is None or low <= value <= high:
+                    return value
+                return 0
+        return ranged
+
+    def _syntax_check(self, parse: Callable[[str], Optional[Number]]) -> Callable[[Union[str, bytes]], Optional[Number]]:
+        """Wrap a conversion with the sign and digit grouping rules."""
+        rejected_signs = ''.join(sign for sign in SIGNS if sign not in self.signs)
+        grouping = self.digit_grouping
+
+        def checked(token: Union[str, bytes]) -> Optional[Number]:
+            if not isinstance(token, str) or not token.isdecimal():
+                if isinstance(token, (bytes, bytearray)):
+                    token = token.decode('utf-8', errors='replace')
+                token = token.strip()
+                if token[:1] and token[:1] in rejected_signs:
+                    return None
+                if grouping != DEFAULT_GROUPING:
+                    if DEFAULT_GROUPING in token:
+                        return None
+                    if grouping is not None:
+                        # int() and Decimal() then enforce digits on both sides
+                        token = token.replace(grouping, DEFAULT_GROUPING)
+            return parse(token)
+
+        return checked
@@ -0,0 +1,461 @@
+"""
+Single-pass scanning tokenizer for String Calculator.
+
+Walks the numbers section once, front to back, in bounded windows whose edges
+sit on delimiter matches, and accumulates the sum as it goes. Only one window
+of tokens exists at a time, so memory stays flat however large the input is.
+
+The scanner works on ``str`` as well as UTF-8 ``bytes``-like objects such as
+``mmap``; delimiters must then be UTF-8 encoded bytes too.
+
+Invalid tokens are recognised by their shape rather than by catching
+int()'s ValueError, so dirty input costs no exception per bad token. In
+strict mode they are handed to an InvalidTokenCollector with their position.
+"""
+import itertools
+import re
+from typing import Callable, Iterator, Optional, Union
+
+from .limits import WorkBudget
+from .pattern_cache import PatternCache, default_pattern_cache
+from .validation import InvalidTokenCollector, NegativeCollector
+
+
+# Characters per window; each window ends on a delimiter match
+WINDOW_SIZE = 1 << 16
+
+# What int() accepts once surrounding whitespace is stripped
+INTEGER_TOKEN = re.compile(r'[+-]?\d+(?:_\d+)*')
+
+
+def scan_sum(text: str, delimiters: list[str], start: int = 0, end: Optional[int] = None,
+             window_size: int = WINDOW_SIZE, pattern_cache: PatternCache = default_pattern_cache,
+             convert: Optional[Callable] = None, negatives: Optional[NegativeCollector] = None,
+             invalid: Optional[InvalidTokenCollector] = None, budget: Optional[WorkBudget] = None) -> int:
+    """
+    Sum the numbers found in ``text[start:end]`` using the given delimiters.
+
+    Produces exactly the same result as splitting with a regex alternation of
+    the delimiters: at each position the earliest match wins, and ties go to
+    the delimiter listed first.
+
+    Args:
+        text: String (or UTF-8 bytes/mmap) holding the numbers section
+        delimiters: Non-empty delimiter strings, in precedence order
+        start: Index where the numbers section begins
+        end: Index where the numbers section ends (defaults to len(text))
+        window_size: Approximate number of characters handled per window
+        pattern_cache: Cache supplying compiled split patterns
+        convert: Token conversion replacing the integer rules (see numeric)
+        negatives: Collector that records negative numbers as they are parsed
+        invalid: Collector that records invalid tokens with their positions
+            (strict mode; None skips invalid tokens)
+        budget: Work limits charged window by window (None = unlimited)
+
+    Returns:
+        Sum of all valid numbers
+
+    Raises:
+        LimitExceededError: If the budget runs out
+    """
+    if end is None:
+        end = len(text)
+    pattern = _split_pattern(delimiters, pattern_cache)
+
+    total = 0
+    for low, high in iter_windows(text, delimiters, start, end, window_size):
+        window = text[low:high]
+        value = _window_sum(window, delimiters, pattern, convert, negatives, invalid is not None, budget)
+        if value is None:
+            # Strict mode: walk the window again, keeping token positions
+            value = _located_sum(text, low, high, pattern_cache.get(delimiters),
+                                 convert or integer_value, negatives, invalid)
+        total += value
+    return total
+
+
+def iter_windows(text: str, delimiters: list[str], start: int, end: int,
+                 window_size: int = WINDOW_SIZE) -> Iterator[tuple[int, int]]:
+    """
+    Yield consecutive windows of ``text[start:end]`` that end on delimiters.
+
+    Args:
+        text: String (or UTF-8 bytes/mmap) holding the numbers section
+        delimiters: Non-empty delimiter strings, in precedence order
+        start: Index where the numbers section begins
+        end: Index where the numbers section ends
+        window_size: Approximate number of characters per window
+
+    Yields:
+        (start, end) index pairs; the delimiter between windows is excluded,
+        and a section ending on a delimiter ends with an empty window
+    """
+    pos = start
+    while pos < end:
+        boundary, length = _next_boundary(text, delimiters, pos, min(pos + window_size, end), end)
+        if boundary == -1:
+            yield pos, end
+            return
+        yield pos, boundary
+        pos = boundary + length
+        if pos == end:
+            # The empty token after a final delimiter, as a whole-section split sees it
+            yield end, end
+
+
+class StreamScanner:
+    """
+    Incremental scanner that sums a numbers section fed in arbitrary chunks.
+
+    Only the text after the last safe delimiter match is carried between
+    chunks, so numbers and multi-character delimiters may straddle chunk
+    boundaries and memory stays proportional to the chunk size.
+
+    With collectors attached, current() and close() raise InvalidTokenError
+    or NegativeNumberError once an invalid token or a negative number has
+    been seen; invalid token positions count from the collector's origin.
+    """
+
+    def __init__(self, delimiters: list[str], window_size: int = WINDOW_SIZE,
+                 pattern_cache: PatternCache = default_pattern_cache, convert: Optional[Callable] = None,
+                 negatives: Optional[NegativeCollector] = None,
+                 invalid: Optional[InvalidTokenCollector] = None, budget: Optional[WorkBudget] = None) -> None:
+        """
+        Initialize the scanner.
+
+        Args:
+            delimiters: Non-empty delimiter strings, in precedence order
+            window_size: Approximate number of characters handled per window
+            pattern_cache: Cache supplying compiled split patterns
+            convert: Token conversion replacing the integer rules (see numeric)
+            negatives: Collector that records negative numbers (None = allow them)
+            invalid: Collector that records invalid tokens (None = skip them)
+            budget: Work limits charged as text is consumed; current() does
+                not consume, so it never charges (None = unlimited)
+        """
+        self.delimiters = list(delimiters)
+        self.window_size = window_size
+        self.pattern_cache = pattern_cache
+        self.convert = convert
+        self.negatives = negatives
+        self.invalid = invalid
+        self.budget = budget
+        self.total = 0
+        self._longest = max(len(delimiter) for delimiter in self.delimiters)
+        self._tail = ''
+        # Whether the carried tail follows a consumed delimiter
+        self._delimited = False
+
+    def feed(self, chunk: str) -> int:
+        """
+        Consume the next chunk of the numbers section.
+
+        Args:
+            chunk: Next piece of text
+
+        Returns:
+            Running sum of every number completed so far
+        """
+        buffer = self._tail + chunk if self._tail else chunk
+        # A match is only final once every delimiter could be seen in full there
+        boundary, length = _last_boundary(buffer, self.delimiters, len(buffer) - self._longest)
+        if boundary == -1:
+            self._tail = buffer
+            return self.total
+
+        self.total += scan_sum(buffer, self.delimiters, 0, boundary,
+                               window_size=self.window_size, pattern_cache=self.pattern_cache,
+                               convert=self.convert, negatives=self.negatives, invalid=self.invalid,
+                               budget=self.budget)
+        if self.invalid is not None:
+            if boundary == 0:
+                # An empty section still holds one (empty) token before the delimiter
+                self.invalid.add(buffer, 0, buffer[:0])
+            self.invalid.rebase(buffer, boundary + length)
+        self._tail = buffer[boundary + length:]
+        self._delimited = True
+        return self.total
+
+    def current(self) -> int:
+        """
+        Sum so far including the carried tail, without consuming it.
+
+        Returns:
+            What close() would return if no more chunks arrived
+
+        Raises:
+            InvalidTokenError: If invalid tokens are collected and any was seen
+            NegativeNumberError: If negatives are collected and any was seen
+        """
+        return self.snapshot()[0]
+
+    def snapshot(self) -> tuple[int, Optional[NegativeCollector]]:
+        """
+        Like current(), also returning the negatives collected so far.
+
+        Returns:
+            Tuple of (sum so far, copy of the negative collector or None)
+        """
+        negatives = self.negatives.copy() if self.negatives is not None else None
+        invalid = self.invalid.copy() if self.invalid is not None else None
+        total = self.total + scan_sum(self._tail, self.delimiters, window_size=self.window_size,
+                                      pattern_cache=self.pattern_cache, convert=self.convert,
+                                      negatives=negatives, invalid=invalid)
+        self._report_empty_tail(self._tail, invalid)
+        _raise_collected(negatives, invalid)
+        return total, negatives
+
+    @property
+    def pending(self) -> int:
+        """Number of characters carried over to the next chunk."""
+        return len(self._tail)
+
+    def close(self) -> int:
+        """
+        Flush the carried tail and return the final sum.
+
+        Returns:
+            Sum of all valid numbers fed to the scanner
+
+        Raises:
+            InvalidTokenError: If invalid tokens are collected and any was seen
+            NegativeNumberError: If negatives are collected and any was seen
+        """
+        tail, self._tail = self._tail, ''
+        self.total += scan_sum(tail, self.delimiters, window_size=self.window_size,
+                               pattern_cache=self.pattern_cache, convert=self.convert,
+                               negatives=self.negatives, invalid=self.invalid, budget=self.budget)
+        self._report_empty_tail(tail, self.invalid)
+        _raise_collected(self.negatives, self.invalid)
+        return self.total
+
+    def _report_empty_tail(self, tail: str, invalid: Optional[InvalidTokenCollector]) -> None:
+        """Record the empty final token of a section whose last chunk ended on a delimiter."""
+        if invalid is not None and self._delimited and not tail:
+            invalid.add(tail, 0, tail)
+
+
+def _raise_collected(negatives: Optional[NegativeCollector], invalid: Optional[InvalidTokenCollector]) -> None:
+    """Raise for collected invalid tokens first, then for negatives."""
+    if invalid is not None:
+        invalid.raise_if_any()
+    if negatives is not None:
+        negatives.raise_if_any()
+
+
+def aligned_spans(text: str, delimiters: list[str], start: int, end: int, count: int) -> list[tuple[int, int]]:
+    """
+    Cut ``text[start:end]`` into up to ``count`` independently summable spans.
+
+    Every cut sits on a delimiter match that a front-to-back split would also
+    make, so summing the spans separately gives the same total as one scan.
+
+    Args:
+        text: String (or UTF-8 bytes/mmap) holding the numbers section
+        delimiters: Non-empty delimiter strings, in precedence order
+        start: Index where the numbers section begins
+        end: Index where the numbers section ends
+        count: Desired number of spans
+
+    Returns:
+        List of (start, end) index pairs covering the section in order
+    """
+    spans = []
+    pos = start
+    step = max(1, (end - start) // max(1, count))
+    while pos < end and len(spans) < count - 1:
+        boundary, length = _next_boundary(text, delimiters, pos, min(pos + step, end), end)
+        if boundary == -1:
+            break
+        spans.append((pos, boundary))
+        pos = boundary + length
+    spans.append((pos, end))
+    return spans
+
+
+def split_tokens(text: str, delimiters: list[str], pattern: Optional[re.Pattern] = None) -> list[str]:
+    """
+    Split ``text`` into tokens exactly like a regex alternation split would.
+
+    Args:
+        text: Text to split
+        delimiters: Non-empty delimiter strings, in precedence order
+        pattern: Precompiled alternation, used when delimiters can overlap
+
+    Returns:
+        List of tokens between delimiter matches
+    """
+    if len(delimiters) == 1:
+        return text.split(delimiters[0])
+
+    if all(len(delimiter) == 1 for delimiter in delimiters):
+        # Single characters never overlap, so fold them all onto the first one
+        first = delimiters[0]
+        if isinstance(first, bytes):
+            table = bytes.maketrans(b''.join(delimiters[1:]), first * (len(delimiters) - 1))
+        else:
+            table = {ord(delimiter): first for delimiter in delimiters[1:]}
+        return text.translate(table).split(first)
+
+    # Overlapping multi-character delimiters: let the regex engine arbitrate
+    if pattern is None:
+        pattern = default_pattern_cache.get(delimiters)
+    return pattern.split(text)
+
+
+def _split_pattern(delimiters: list[str], pattern_cache: PatternCache) -> Optional[re.Pattern]:
+    """Fetch the compiled pattern only for delimiter sets that need one."""
+    if len(delimiters) == 1 or all(len(delimiter) == 1 for delimiter in delimiters):
+        return None
+    return pattern_cache.get(delimiters)
+
+
+def _window_sum(window: str, delimiters: list[str], pattern: Optional[re.Pattern],
+                convert: Optional[Callable] = None, negatives: Optional[NegativeCollector] = None,
+                strict: bool = False, budget: Optional[WorkBudget] = None) -> Optional[int]:
+    """
+    Sum one window, converting tokens at C speed when they are all clean.
+
+    Returns:
+        The window's sum, or None in strict mode when the window needs the
+        located walk (a token is invalid, or tokens need checking one by one)
+    """
+    tokens = split_tokens(window, delimiters, pattern)
+    if budget is not None:
+        budget.charge(len(tokens))
+    # A negative value needs a minus sign, so only such windows pay for the check
+    if convert is None and (negatives is None or (b'-' if isinstance(window, bytes) else '-') not in window):
+        try:
+            return sum(map(int, tokens))
+        except ValueError:
+            if not strict and negatives is None:
+                return sum(map(token_value, tokens))
+    if strict:
+        return None
+
+    parse = convert if convert is not None else integer_value
+    total = 0
+    for token in tokens:
+        value = parse(token)
+        if value is None:
+            continue
+        if negatives is not None and value < 0:
+            negatives.add(value)
+        total += value
+    return total
+
+
+def _located_sum(text: str, low: int, high: int, pattern: re.Pattern, parse: Callable,
+                 negatives: Optional[NegativeCollector], invalid: InvalidTokenCollector) -> int:
+    """Sum ``text[low:high]`` token by token, reporting invalid tokens with their offsets."""
+    total = 0
+    start = low
+    for match in itertools.chain(pattern.finditer(text, low, high), (None,)):
+        end = match.start() if match is not None else high
+        token = text[start:end]
+        value = parse(token)
+        if value is None:
+            invalid.add(text, start, token)
+        else:
+            if negatives is not None and value < 0:
+                negatives.add(value)
+            total += value
+        if match is not None:
+            start = match.end()
+    return total
+
+
+def _next_boundary(text: str, delimiters: list[str], floor: int, pos: int, end: int) -> tuple[int, int]:
+    """
+    Find the first delimiter match at or after ``pos`` that a front-to-back
+    split starting at ``floor`` is guaranteed to make.
+
+    A match is safe when no other delimiter occurrence starts before it and
+    runs into it; otherwise the sequential split might consume that other
+    occurrence instead and land somewhere else.
+
+    Returns:
+        Tuple of (match position, delimiter length), or (-1, 0) if none
+    """
+    while True:
+        hit, chosen = _earliest([text.find(delimiter, pos, end) for delimiter in delimiters])
+        if hit == -1:
+            return -1, 0
+        if _is_aligned(text, delimiters, floor, hit):
+            return hit, len(delimiters[chosen])
+        pos = hit + 1
+
+
+def _last_boundary(text: str, delimiters: list[str], limit: int) -> tuple[int, int]:
+    """
+    Find the last safe delimiter match starting at or before ``limit``.
+
+    Returns:
+        Tuple of (match position, delimiter length), or (-1, 0) if none
+    """
+    while limit >= 0:
+        # rfind gives each delimiter's last start; ties go to the first listed
+        hit = -1
+        chosen = 0
+        for index, delimiter in enumerate(delimiters):
+            position = text.rfind(delimiter, 0, limit + len(delimiter))
+            if position > hit:
+                hit = position
+                chosen = index
+        if hit == -1:
+            return -1, 0
+        if _is_aligned(text, delimiters, 0, hit):
+            return hit, len(delimiters[chosen])
+        limit = hit - 1
+    return -1, 0
+
+
+def _is_aligned(text: str, delimiters: list[str], floor: int, hit: int) -> bool:
+    """Check that no delimiter occurrence straddles ``hit`` from the left."""
+    for delimiter in delimiters:
+        size = len(delimiter)
+        if size == 1:
+            continue
+        found = text.find(delimiter, max(hit - size + 1, floor), hit + size - 1)
+        if found != -1 and found < hit:
+            return False
+    return True
+
+
+def _earliest(positions: list[int]) -> tuple[int, int]:
+    """Return (position, index) of the earliest hit; ties go to the lowest index."""
+    hit = -1
+    chosen = 0
+    for index, position in enumerate(positions):
+        if position != -1 and (hit == -1 or position < hit):
+            hit = position
+            chosen = index
+    return hit, chosen
+
+
+def token_value(token: Union[str, bytes]) -> int:
+    """Convert one token to its integer value, treating invalid tokens as 0."""
+    value = integer_value(token)
+    return 0 if value is None else value
+
+
+def integer_value(token: Union[str, bytes]) -> Optional[int]:
+    """
+    Convert one token to its integer value without raising for bad tokens.
+
+    Returns:
+        The value, or None if the token is not a valid integer
+    """
+    if isinstance(token, (bytes, bytearray)):
+        # Decode so whitespace and digits follow the same rules as str input;
+        # undecodable bytes become U+FFFD, which no integer contains
+        token = token.decode('utf-8', errors='replace')
+    if not token.isdecimal():
+        token = token.strip()
+        if INTEGER_TOKEN.fullmatch(token) is None:
+            return None
+    try:
+        return int(token)
+    except ValueError:
+        # Only numbers past the interpreter's digit limit get here
+        return None
@@ -0,0 +1,419 @@
+"""
+Production server launcher for String Calculator API.
+
+Runs the Flask app in N pre-forked worker processes that share one
+listening socket. Each worker warms up (imports, pattern compilation, a
+round trip through the app) before it accepts traffic, serves one request
+at a time with a hard per-request timeout, and keeps idle HTTP/1.1
+connections open for a short keep-alive window.
+
+Signals (master process):
+- SIGTERM / SIGINT: graceful shutdown; workers finish their current request
+- SIGHUP: graceful restart; a fresh, warmed-up set of workers replaces the old one
+
+Platforms without os.fork fall back to a single threaded process.
+
+Running-sum sessions live in one process, so they are served only by a
+single worker: --sessions forces one, and with several workers the launcher
+turns the session endpoints off (SESSIONS_ENABLED).
+"""
+import argparse
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Callable, Optional
+
+from werkzeug.exceptions import InternalServerError
+from werkzeug.serving import WSGIRequestHandler, make_server, run_simple
+from werkzeug.wsgi import LimitedStream
+
+
+logger = logging.getLogger(__name__)
+
+# Inputs covering every delimiter form, used to warm up each worker
+WARMUP_INPUTS = [
+    '1,2,3',
+    '1\n2,3',
+    '//;\n1;2;3',
+    '//[***]\n1***2***3',
+    '//[*][%]\n1*2%3',
+]
+
+
+class RequestTimeout(BaseException):
+    """Raised inside a worker when one request runs past its timeout.
+
+    Derives from BaseException so the app's own ``except Exception`` blocks
+    cannot swallow it.
+    """
+
+
+def warm_up(app) -> None:
+    """
+    Prepare a worker before it accepts traffic.
+
+    Compiles the delimiter patterns for every header form, exercises the
+    calculator engines and makes one round trip through the WSGI app so
+    routing and JSON handling are initialized.
+
+    Args:
+        app: Flask application to warm up
+    """
+    from .api import calculator
+
+    for sample in WARMUP_INPUTS:
+        calculator.add(sample)
+    app.test_client().get('/api/health')
+
+
+class PreforkServer:
+    """Pre-fork WSGI server: one master, N single-request worker processes."""
+
+    def __init__(self, app, host: str = '0.0.0.0', port: int = 5000, workers: Optional[int] = None,
+                 timeout: float = 30.0, keepalive: float = 2.0, graceful_timeout: float = 30.0,
+                 backlog: int = 2048, warmup: Optional[Callable] = warm_up) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            app: WSGI application to serve
+            host: Interface to bind
+            port: TCP port to bind (0 picks a free port)
+            workers: Worker processes (one per CPU if omitted)
+            timeout: Maximum seconds to read and handle one request
+            keepalive: Seconds an idle keep-alive connection is held open
+            graceful_timeout: Seconds workers get to finish before being killed
+            backlog: Listen queue length of the shared socket
+            warmup: Called with the app in each worker before it serves traffic
+
+        Raises:
+            ValueError: If several workers would serve an app with sessions enabled
+        """
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers > 1 and getattr(app, 'config', {}).get('SESSIONS_ENABLED'):
+            raise ValueError("Sessions live in one process: serve them with a single worker "
+                             "or set SESSIONS_ENABLED to False")
+        self.timeout = timeout
+        self.keepalive = keepalive
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+        self.warmup = warmup
+        self.socket: Optional[socket.socket] = None
+        self._children: set[int] = set()
+        self._stopping = False
+        self._reloading = False
+
+    def bind(self) -> int:
+        """
+        Open the shared listening socket.
+
+        Returns:
+            Port actually bound
+        """
+        self.socket = socket.create_server((self.host, self.port), backlog=self.backlog)
+        self.socket.set_inheritable(True)
+        self.port = self.socket.getsockname()[1]
+        return self.port
+
+    def run(self) -> None:
+        """Start the workers and supervise them until shutdown."""
+        if self.socket is None:
+            self.bind()
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_reload)
+
+        for _ in range(self.workers):
+            self._spawn()
+
+        try:
+            while not self._stopping:
+                if self._reloading:
+                    self._reloading = False
+                    self._restart_workers()
+                self._reap(respawn=True)
+                time.sleep(0.1)
+        finally:
+            self._stop_workers(self._children)
+            self.socket.close()
+
+    def _spawn(self) -> int:
+        """Fork one worker process."""
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self._worker_main()
+                exit_code = 0
+            except BaseException:
+                logger.exception("Worker %s crashed", os.getpid())
+            finally:
+                os._exit(exit_code)
+        self._children.add(pid)
+        return pid
+
+    def _worker_main(self) -> None:
+        """Worker loop: warm up, then serve one connection at a time."""
+        alive = True
+
+        def stop(signum, frame):
+            nonlocal alive
+            alive = False
+
+        def expire(signum, frame):
+            raise RequestTimeout()
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGALRM, expire)
+
+        if self.warmup is not None:
+            self.warmup(self.app)
+
+        handler = type('RequestHandler', (_KeepAliveRequestHandler,), {
+            'timeout': self.keepalive,
+            'request_timeout': self.timeout,
+        })
+        server = make_server(self.host, self.port, self.app, request_handler=handler, fd=self.socket.fileno())
+        server.timeout = 0.5  # Poll interval for the shutdown flag
+
+        while alive:
+            server.handle_request()
+
+    def _restart_workers(self) -> None:
+        """Bring up a fresh set of workers, then retire the old ones."""
+        old = set(self._children)
+        for _ in range(self.workers):
+            self._spawn()
+        self._stop_workers(old)
+
+    def _stop_workers(self, pids: set[int]) -> None:
+        """Ask workers to finish, killing any still running after the grace period."""
+        for pid in list(pids):
+            self._signal(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.graceful_timeout
+        while pids & self._children and time.monotonic() < deadline:
+            self._reap(respawn=False)
+            time.sleep(0.05)
+
+        for pid in list(pids & self._children):
+            self._signal(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            self._children.discard(pid)
+
+    def _reap(self, respawn: bool) -> None:
+        """Collect exited workers, replacing unexpected exits when asked."""
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if pid == 0:
+                return
+            if pid in self._children:
+                self._children.discard(pid)
+                if respawn and not self._stopping:
+                    logger.warning("Worker %s exited with status %s; respawning", pid, status)
+                    self._spawn()
+
+    @staticmethod
+    def _signal(pid: int, signum: int) -> None:
+        """Send a signal, ignoring workers that already exited."""
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _handle_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _handle_reload(self, signum, frame) -> None:
+        self._reloading = True
+
+
+class _KeepAliveRequestHandler(WSGIRequestHandler):
+    """
+    HTTP/1.1 WSGI handler with keep-alive and a hard per-request timeout.
+
+    Werkzeug's handler closes every connection after one response, so this
+    one frames responses itself: Content-Length when the app provides it,
+    chunked encoding otherwise. Request bodies the app leaves unread are
+    drained so the next request on the connection starts cleanly.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    request_timeout = 30.0
+    disable_nagle_algorithm = True
+
+    def run_wsgi(self) -> None:
+        # A sync worker holding an idle keep-alive connection starves queued
+        # clients, so only keep the connection while nobody else is waiting
+        if self.request_version != 'HTTP/1.1' or self._clients_waiting():
+            self.close_connection = True
+        signal.setitimer(signal.ITIMER_REAL, self.request_timeout)
+        try:
+            self._serve_request()
+        except RequestTimeout:
+            self.log_error("Request timed out after %ss", self.request_timeout)
+            self.close_connection = True
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    def _clients_waiting(self) -> bool:
+        """Check whether connections are queued on the shared listening socket."""
+        readable, _, _ = select.select([self.server.socket], [], [], 0)
+        return bool(readable)
+
+    def _serve_request(self) -> None:
+        """Run the app for one request and write a keep-alive safe response."""
+        if self.headers.get('Expect', '').lower().strip(' \t') == '100-continue':
+            self.wfile.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+
+        self.environ = environ = self.make_environ()
+        if not environ.get('wsgi.input_terminated'):
+            try:
+                length = max(int(environ.get('CONTENT_LENGTH') or 0), 0)
+            except ValueError:
+                self.send_error(400, 'Invalid Content-Length')
+                return
+            environ['wsgi.input'] = LimitedStream(self.rfile, length)
+
+        state = {'status': None, 'headers': None, 'sent': False, 'chunked': False}
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info and state['sent']:
+                raise exc_info[1].with_traceback(exc_info[2])
+            state['status'], state['headers'] = status, headers
+            return write
+
+        def write(data: bytes) -> None:
+            if not state['sent']:
+                self._send_headers(state)
+            if data and state['chunked']:
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+            elif data:
+                self.wfile.write(data)
+
+        try:
+            self._execute(self.server.app, environ, start_response, write, state)
+        except (ConnectionError, socket.timeout):
+            self.close_connection = True
+            return
+        except Exception:
+            self.server.log('error', f"Error on request:\n{traceback.format_exc()}")
+            if state['sent']:
+                self.close_connection = True
+                return
+            self._execute(InternalServerError(), environ, start_response, write, state)
+
+        # Discard whatever part of the body the app did not read
+        body = environ['wsgi.input']
+        while body.read(64 * 1024):
+            pass
+
+    def _execute(self, app, environ, start_response, write, state) -> None:
+        """Call the app and stream its output."""
+        iterable = app(environ, start_response)
+        try:
+            for data in iterable:
+                write(data)
+            if not state['sent']:
+                write(b'')
+            if state['chunked']:
+                self.wfile.write(b'0\r\n\r\n')
+            self.wfile.flush()
+        finally:
+            if hasattr(iterable, 'close'):
+                iterable.close()
+
+    def _send_headers(self, state: dict) -> None:
+        """Send status line and headers, choosing the body framing."""
+        code, _, message = state['status'].partition(' ')
+        code = int(code)
+        self.send_response(code, message)
+        names = set()
+        for name, value in state['headers']:
+            self.send_header(name, value)
+            names.add(name.lower())
+
+        # Without a length, HTTP/1.1 clients get chunks; others read until close
+        framed = 'content-length' in names or self.command == 'HEAD' or code < 200 or code in (204, 304)
+        if not framed and not self.close_connection:
+            state['chunked'] = True
+            self.send_header('Transfer-Encoding', 'chunked')
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        state['sent'] = True
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Command-line entry point for the production server.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description='Run the String Calculator API.')
+    parser.add_argument('--host', default='0.0.0.0', help='interface to bind (default: 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=5000, help='port to bind (default: 5000)')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: one per CPU)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='seconds allowed per request (default: 30)')
+    parser.add_argument('--keepalive', type=float, default=2.0, help='idle keep-alive seconds (default: 2)')
+    parser.add_argument('--graceful-timeout', type=float, default=30.0,
+                        help='seconds workers get to finish on shutdown or restart (default: 30)')
+    parser.add_argument('--sessions', action='store_true',
+                        help='serve running-sum sessions from a single worker (disabled with more workers)')
+    parser.add_argument('--dev', action='store_true', help='run the single-process debug server instead')
+    args = parser.parse_args(argv)
+    if args.sessions and args.workers not in (None, 1):
+        parser.error('--sessions needs a single worker')
+
+    from .api import app
+
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s in %(module)s: %(message)s')
+
+    if args.dev:
+        app.run(debug=True, host=args.host, port=args.port)
+        return
+
+    if not hasattr(os, 'fork'):
+        logger.warning("os.fork is unavailable; serving from a single threaded process")
+        warm_up(app)
+        run_simple(args.host, args.port, app, threaded=True)
+        return
+
+    workers = 1 if args.sessions else args.workers or os.cpu_count() or 1
+    if workers > 1:
+        # Sessions opened on one worker would be missing on the others
+        app.config['SESSIONS_ENABLED'] = False
+        logger.info("Session endpoints disabled with %s workers; start with --sessions to serve them", workers)
+
+    server = PreforkServer(app, host=args.host, port=args.port, workers=workers, timeout=args.timeout,
+                           keepalive=args.keepalive, graceful_timeout=args.graceful_timeout)
+    server.bind()
+    print("🚀 Starting String Calculator API Server...")
+    print(f"📍 Server running at: http://localhost:{server.port} ({server.workers} workers, pid {os.getpid()})")
+    print(f"🏥 Health check: http://localhost:{server.port}/api/health")
+    print(f"📚 API docs: http://localhost:{server.port}/")
+    print("\n🧮 String Calculator API is ready!")
+    print("Send SIGHUP for a graceful restart, SIGTERM or Ctrl+C to stop")
+    print("-" * 50)
+    sys.stdout.flush()
+    server.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+Running-sum sessions for String Calculator API.
+
+A session keeps the state of one growing input on the server: the
+delimiter header is resolved once, from the fragment the session is opened
+with, and every appended fragment is scanned on its own, so a client that
+keeps typing never has its whole input reparsed. Only the carried tail of
+each session (the text after its last complete delimiter) is held in
+memory. Idle sessions expire, and the least recently used ones are evicted
+to respect a session count and a byte budget.
+
+Fragments are scanned under the session's own lock, so the store-wide lock
+is held only to look sessions up, account for their memory and evict. Each
+fragment is scanned under a fresh work budget from the session's
+calculator; a fragment that runs out of it closes the session, whose
+partly scanned state can no longer be trusted.
+
+Sessions live in the process that opened them, so the API serves them only
+from a single process: the pre-fork launcher disables them unless started
+with --sessions (or --workers 1), and refuses to fork several workers while
+they are enabled.
+"""
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from .exceptions import SessionNotFoundError
+from .numeric import Number
+from .string_calculator import StringCalculator
+
+
+class Session:
+    """State of one running sum."""
+
+    def __init__(self, session_id: str, delimiters: list[str], now: float,
+                 calculator: Optional[StringCalculator] = None, header: str = '') -> None:
+        """
+        Initialize an empty session.
+
+        Args:
+            session_id: Public identifier
+            delimiters: Delimiters fixed for the session's lifetime
+            now: Creation time on the store's clock
+            calculator: Calculator whose parsing settings the session follows
+            header: Header the session was opened with, so strict mode
+                positions count from the start of the input
+        """
+        self.session_id = session_id
+        self.delimiters = delimiters
+        self.calculator = calculator if calculator is not None else StringCalculator()
+        self.scanner = self.calculator._make_scanner(delimiters, header)
+        self.length = 0
+        self.last_used = now
+        self.size = 0
+        # Serializes scans of this session; the store's lock is not held meanwhile
+        self.lock = threading.Lock()
+
+    def append(self, fragment: str) -> None:
+        """
+        Scan a new fragment of the numbers section.
+
+        Raises:
+            LimitExceededError: If the fragment needs more work than the limits allow
+        """
+        with self.lock:
+            self.scanner.budget = self.calculator._work_budget()
+            self.scanner.feed(fragment)
+            self.length += len(fragment)
+
+    def result(self) -> Number:
+        """
+        Sum of the input so far, as if it ended here.
+
+        Raises:
+            InvalidTokenError: In strict mode, if the input holds invalid tokens
+            NegativeNumberError: If negatives are rejected and the input holds any
+            NumericOverflowError: If the sum does not fit the numeric mode
+        """
+        with self.lock:
+            return self.calculator._check_result(*self.scanner.snapshot())
+
+    def describe(self) -> dict:
+        """
+        Session state as a JSON-friendly dict.
+
+        Raises:
+            InvalidTokenError: In strict mode, if the input holds invalid tokens
+            NegativeNumberError: If negatives are rejected and the input holds any
+        """
+        return {
+            'session_id': self.session_id,
+            'result': self.result(),
+            'length': self.length,
+            'delimiters': self.delimiters
+        }
+
+
+class SessionStore:
+    """Thread-safe store of running-sum sessions with idle expiry and memory caps."""
+
+    # Approximate per-session bookkeeping cost in bytes (objects, dict slot, scanner);
+    # the carried tail is added at one byte per character
+    SESSION_OVERHEAD = 1024
+
+    def __init__(self, max_sessions: int = 1000, ttl: float = 600.0, max_bytes: int = 16 * 1024 * 1024,
+                 calculator: Optional[StringCalculator] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            max_sessions: Maximum number of live sessions
+            ttl: Seconds a session may stay idle before it expires
+            max_bytes: Maximum estimated memory held by all sessions
+            calculator: Calculator whose header rules open sessions
+            clock: Monotonic time source, injectable for tests
+        """
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.calculator = calculator if calculator is not None else StringCalculator()
+        self._clock = clock
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.expired = 0
+        self.evicted = 0
+
+    def open(self, numbers: str = '') -> Session:
+        """
+        Start a session from its first fragment.
+
+        The header is resolved from this fragment alone and stays fixed;
+        anything after it is the start of the numbers section.
+
+        Args:
+            numbers: Opening fragment, optionally starting with a header
+
+        Returns:
+            The new session
+
+        Raises:
+            LimitExceededError: If the fragment needs more work than the limits allow
+        """
+        delimiters, offset = self.calculator._parse_header(numbers)
+        session = Session(secrets.token_urlsafe(16), delimiters, self._clock(), self.calculator, numbers[:offset])
+        session.append(numbers[offset:] if offset else numbers)
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            session.last_used = now
+            self._sessions[session.session_id] = session
+            self._account(session)
+            self._evict()
+            return session
+
+    def append(self, session_id: str, fragment: str) -> Session:
+        """
+        Add a fragment to the end of a session's input.
+
+        Args:
+            session_id: Session to extend
+            fragment: Text appended to the input
+
+        Returns:
+            The updated session
+
+        Raises:
+            LimitExceededError: If the fragment needs more work than the
+                limits allow; the session is closed
+            SessionNotFoundError: If the session is unknown or expired
+        """
+        with self._lock:
+            session = self._touch(session_id)
+        try:
+            session.append(fragment)
+        except BaseException:
+            with self._lock:
+                self._discard(session)
+            raise
+        with self._lock:
+            # Closed or evicted while scanning: nothing left to account for
+            if self._sessions.get(session_id) is session:
+                self._account(session)
+                self._evict()
+            return session
+
+    def get(self, session_id: str) -> Session:
+        """
+        Look up a live session.
+
+        Raises:
+            SessionNotFoundError: If the session is unknown or expired
+        """
+        with self._lock:
+            return self._touch(session_id)
+
+    def close(self, session_id: str) -> Session:
+        """
+        End a session and release its memory.
+
+        Raises:
+            SessionNotFoundError: If the session is unknown or expired
+        """
+        with self._lock:
+            session = self._touch(session_id)
+            self._remove(session)
+            return session
+
+    def stats(self) -> dict:
+        """Return counters and current size as a JSON-friendly dict."""
+        with self._lock:
+            self._expire(self._clock())
+            return {
+                'sessions': len(self._sessions),
+                'bytes': self._bytes,
+                'max_sessions': self.max_sessions,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'expired': self.expired,
+                'evicted': self.evicted
+            }
+
+    def _touch(self, session_id: str) -> Session:
+        """Return a live session and mark it used; caller holds the lock."""
+        now = self._clock()
+        self._expire(now)
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise SessionNotFoundError(session_id)
+        session.last_used = now
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def _account(self, session: Session) -> None:
+        """Refresh a session's memory estimate; caller holds the lock."""
+        size = session.scanner.pending + self.SESSION_OVERHEAD
+        self._bytes += size - session.size
+        session.size = size
+
+    def _expire(self, now: float) -> None:
+        """Drop sessions idle for longer than the TTL; caller holds the lock."""
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if now - oldest.last_used <= self.ttl:
+                return
+            self._remove(oldest)
+            self.expired += 1
+
+    def _evict(self) -> None:
+        """Evict least recently used sessions beyond the caps; caller holds the lock."""
+        while self._sessions and (len(self._sessions) > self.max_sessions or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._sessions.values())))
+            self.evicted += 1
+
+    def _remove(self, session: Session) -> None:
+        """Remove one session; caller holds the lock."""
+        del self._sessions[session.session_id]
+        self._bytes -= session.size
+
+    def _discard(self, session: Session) -> None:
+        """Remove a session unless it is already gone; caller holds the lock."""
+        if self._sessions.get(session.session_id) is session:
+            self._remove(session)
@@ -3,7 +3,22 @@ String Calculator implementation following TDD principles.
 
 GREEN PHASE - TDD Cycle 8: Add multiple custom delimiter support.
 """
-import re
+import codecs
+import mmap
+import os
+import time
+from typing import IO, Iterable, Optional, Union
+
+from .parallel import parallel_file_sum, parallel_sum, resolve_workers
+from .numeric import Number, check_int64, token_converter, validate_mode
+from .observers import CalculatorObserver
+from .header import MAX_DELIMITERS, MAX_HEADER_LENGTH, HeaderMatch, header_complete, parse_header
+from .limits import WorkBudget
+from .pattern_cache import PatternCache, default_pattern_cache
+from .rules import NumberRules
+from .scanner import StreamScanner, integer_value, scan_sum
+from .validation import INVALID_REPORT_LIMIT, NEGATIVE_REPORT_LIMIT, InvalidTokenCollector, NegativeCollector
+from .vectorized import is_supported as numpy_supported, numpy_sum
 
 
 class StringCalculator:
@@ -17,17 +32,136 @@ class StringCalculator:
     - Custom single character delimiters: //[delimiter]\\n[numbers...]
     - Custom multi-character delimiters: //[delimiter]\\n[numbers...]
     - Multiple custom delimiters: //[delim1][delim2]\\n[numbers...] ✅ (GREEN phase)
+    - Headers are read from the first line only (see the header module);
+      one longer than max_header_length characters or defining more than
+      max_delimiters delimiters raises InvalidDelimiterError
+    - Negative numbers raise NegativeNumberError listing them (up to
+      negative_report_limit, plus a count); allow_negatives=True sums them
+    - Invalid tokens are skipped; with strict=True they raise
+      InvalidTokenError locating the first invalid_report_limit of them by
+      byte offset, line and column (strict parsing runs on the scanner)
+    
+    Parsing engines:
+    - "regex": split the numbers section with a regex alternation (default)
+    - "scan": single-pass scanner that sums in place without building lists
+    - "numpy": vectorized byte-array summation when NumPy is installed and
+      every delimiter is a single ASCII character; falls back to "scan"
+    - "auto": picks per numbers section by size: "regex" for tiny ones,
+      "scan", then "numpy" for large ones
+    
+    With workers > 1, numbers sections of at least parallel_threshold
+    characters (bytes for files) are summed in a process pool instead.
+    
+    Numeric modes (see the numeric module):
+    - "bigint": arbitrary-precision integers (default)
+    - "int64": NumericOverflowError is raised when a token, or the sum of
+      the positive or of the negative tokens, does not fit a signed 64-bit
+      integer. Unless an engine is given, the "auto" engine is used, which
+      is where the mode's speed comes from
+    - "decimal" / "float": tokens such as "1.5" or "2e3" are summed as
+      Decimal or float
+    fraction_policy ("skip", "truncate", "round") decides what the integer
+    modes do with non-integral tokens; "skip" keeps them invalid.
+    
+    Number rules (see the rules module): values outside [min_value,
+    max_value] are ignored, e.g. NumberRules(max_value=1000), and tokens can
+    be limited in the signs and digit grouping they use. Rules are checked
+    token by token inside the parse loops ("scan", or a vectorized mask with
+    "numpy"); ignored negatives are not reported. Without rules the plain
+    integer fast paths are used unchanged.
+    
+    Work limits: with max_numbers or max_cpu_time set, every input gets a
+    WorkBudget that the engines charge window by window, raising
+    LimitExceededError as soon as it runs out. Limited calculators keep
+    the "regex" engine for tiny sections only and never use the process
+    pool, so no section is summed without checkpoints.
+    
+    Profiling: while ``observer`` is set, add() reports each phase (header
+    parsed, delimiters resolved, parts split, numbers parsed, sum finished)
+    to it with timings and counts; see CalculatorObserver. Set it to None
+    to detach; the unobserved path is unchanged.
     """
     
     # Default supported delimiters
     DEFAULT_DELIMITERS = [',', '\n']
     
-    # Custom delimiter patterns
-    SINGLE_CHAR_DELIMITER_PATTERN = r"^//(.)\n(.*)$"
-    MULTIPLE_DELIMITERS_PATTERN = r"^//((?:\[.+?\])+)\n(.*)$"
-    BRACKET_DELIMITER_EXTRACT = r"\[(.+?)\]"
+    # Available parsing engines
+    ENGINES = ('regex', 'scan', 'numpy', 'auto')
+    
+    # "auto" engine: smallest sections handed to the scanner and to NumPy
+    AUTO_SCAN_THRESHOLD = 128
+    AUTO_NUMPY_THRESHOLD = 4096
+    
+    # Streaming: read size
+    STREAM_CHUNK_SIZE = 1 << 16
+    
+    # Parallel mode: smallest numbers section worth shipping to a process pool
+    PARALLEL_THRESHOLD = 8 << 20
+    
+    def __init__(self, engine: Optional[str] = None, pattern_cache: Optional[PatternCache] = None,
+                 workers: Optional[int] = 1, parallel_threshold: int = PARALLEL_THRESHOLD,
+                 observer: Optional[CalculatorObserver] = None, numeric: str = 'bigint',
+                 fraction_policy: str = 'skip', allow_negatives: bool = False,
+                 negative_report_limit: int = NEGATIVE_REPORT_LIMIT, strict: bool = False,
+                 invalid_report_limit: int = INVALID_REPORT_LIMIT, rules: Optional[NumberRules] = None,
+                 max_header_length: int = MAX_HEADER_LENGTH, max_delimiters: int = MAX_DELIMITERS,
+                 max_numbers: Optional[int] = None, max_cpu_time: Optional[float] = None) -> None:
+        """
+        Initialize the calculator.
+        
+        Args:
+            engine: Parsing engine to use, one of ENGINES (None = "regex", or
+                "auto" in int64 mode)
+            pattern_cache: Cache of compiled delimiter patterns (shared default if omitted)
+            workers: Worker processes for large inputs (1 = serial, None = one per CPU)
+            parallel_threshold: Minimum numbers-section size for the parallel path
+            observer: Receives per-phase callbacks from add() (None = off)
+            numeric: Numeric mode, one of numeric.NUMERIC_MODES
+            fraction_policy: Handling of non-integral tokens in integer modes,
+                one of numeric.FRACTION_POLICIES
+            allow_negatives: Sum negative numbers instead of rejecting them
+            negative_report_limit: Most negative numbers listed in NegativeNumberError
+            strict: Raise InvalidTokenError for invalid tokens instead of skipping them
+            invalid_report_limit: Most invalid tokens located in InvalidTokenError
+            rules: Number rules applied while parsing (None = plain integers)
+            max_header_length: Longest custom delimiter header accepted, in characters
+            max_delimiters: Most delimiters a header may define
+            max_numbers: Most numbers one input may hold (None = unlimited)
+            max_cpu_time: Most CPU seconds spent on one input (None = unlimited)
+            
+        Raises:
+            ValueError: If the engine name, numeric mode or fraction policy is unknown
+        """
+        validate_mode(numeric, fraction_policy)
+        if engine is None:
+            engine = 'auto' if numeric == 'int64' else 'regex'
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {engine!r} (expected one of {', '.join(self.ENGINES)})")
+        self.engine = engine
+        self.pattern_cache = pattern_cache if pattern_cache is not None else default_pattern_cache
+        self.workers = resolve_workers(workers)
+        self.parallel_threshold = parallel_threshold
+        self.observer = observer
+        self.numeric = numeric
+        self.fraction_policy = fraction_policy
+        convert = token_converter(numeric, fraction_policy)
+        self.rules = rules if rules is not None and rules.active else None
+        self._numpy_rules = None
+        if self.rules is not None:
+            # Integer-only rule sets are also vectorized by the NumPy engine
+            self._numpy_rules = self.rules if convert is None else None
+            convert = self.rules.converter(convert)
+        self._convert = convert
+        self.max_header_length = max_header_length
+        self.max_delimiters = max_delimiters
+        self.max_numbers = max_numbers
+        self.max_cpu_time = max_cpu_time
+        self.allow_negatives = allow_negatives
+        self.negative_report_limit = negative_report_limit
+        self.strict = strict
+        self.invalid_report_limit = invalid_report_limit
     
-    def add(self, numbers: str) -> int:
+    def add(self, numbers: str) -> Number:
         """
         Add numbers from a string with comprehensive delimiter support.
         
@@ -37,6 +171,13 @@ class StringCalculator:
         Returns:
             Sum of all valid numbers
             
+        Raises:
+            InvalidDelimiterError: If the header exceeds the configured limits
+            InvalidTokenError: In strict mode, if any token is not a valid number
+            LimitExceededError: If the input needs more work than the limits allow
+            NegativeNumberError: If negatives are not allowed and the input has any
+            NumericOverflowError: If the sum does not fit the numeric mode
+            
         Examples:
             >>> calc = StringCalculator()
             >>> calc.add("//;\\n1;2")
@@ -48,12 +189,285 @@ class StringCalculator:
         """
         if not numbers:
             return 0
+        negatives = self._negative_collector()
+        invalid = self._invalid_collector()
+        budget = self._work_budget()
+        if self.observer is not None:
+            total = self._add_observed(numbers, self.observer, negatives, invalid, budget)
+            return self._check_result(total, negatives, invalid)
+        
+        delimiters, offset = self._parse_header(numbers)
+        total = self._sum_section(numbers, delimiters, offset, negatives, invalid, budget)
+        return self._check_result(total, negatives, invalid)
+    
+    def add_iter(self, chunks: Iterable[Union[str, bytes]], encoding: str = 'utf-8') -> Number:
+        """
+        Add numbers from an input delivered as a sequence of chunks.
+        
+        Chunks are buffered only until the custom delimiter header (if any)
+        is complete; the rest is consumed incrementally, so numbers and
+        delimiters may straddle chunk boundaries.
+        
+        Args:
+            chunks: Iterable of str chunks (bytes chunks are decoded)
+            encoding: Encoding used for bytes chunks
+            
+        Returns:
+            Sum of all valid numbers
+            
+        Examples:
+            >>> calc = StringCalculator()
+            >>> calc.add_iter(["//[**", "*]\\n1**", "*2"])
+            3
+        """
+        decoder = None
+        head = ''
+        scanner = None
+        budget = self._work_budget()
+        
+        for chunk in chunks:
+            if isinstance(chunk, (bytes, bytearray)):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder(encoding)()
+                chunk = decoder.decode(chunk)
+            
+            if scanner is None:
+                head += chunk
+                if not header_complete(head, self.max_header_length):
+                    continue
+                delimiters, offset = self._parse_header(head)
+                scanner = self._make_scanner(delimiters, head[:offset], budget)
+                chunk = head[offset:]
+                head = ''
+            
+            scanner.feed(chunk)
+        
+        if decoder is not None:
+            remainder = decoder.decode(b'', final=True)
+            if scanner is None:
+                head += remainder
+            else:
+                scanner.feed(remainder)
+        
+        if scanner is None:
+            return self.add(head)
+        return self._check_result(scanner.close(), scanner.negatives)
+    
+    def add_stream(self, stream: IO, chunk_size: int = STREAM_CHUNK_SIZE, encoding: str = 'utf-8') -> Number:
+        """
+        Add numbers read from a file-like object in fixed-size chunks.
+        
+        Args:
+            stream: Text or binary file-like object with a read() method
+            chunk_size: Number of characters (or bytes) per read
+            encoding: Encoding used when the stream yields bytes
+            
+        Returns:
+            Sum of all valid numbers
+        """
+        def read_chunks():
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        
+        return self.add_iter(read_chunks(), encoding)
+    
+    def add_file(self, path: Union[str, os.PathLike]) -> Number:
+        """
+        Add numbers from a UTF-8 file by memory-mapping it.
         
-        delimiters, numbers_part = self._extract_delimiters_and_numbers(numbers)
-        number_list = self._parse_numbers_with_delimiters(numbers_part, delimiters)
+        Only the header prefix is decoded; the numbers part is scanned
+        straight from the mapped bytes, so the file is never copied into a
+        Python string. Header rules match add().
+        
+        Args:
+            path: Path of the file to sum
+            
+        Returns:
+            Sum of all valid numbers
+        """
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return 0
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                
+                # surrogateescape keeps a byte-exact round trip for the offset
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='surrogateescape')
+                # A header of max_header_length characters fits in four bytes per character
+                head = decoder.decode(mapped[:4 * (self.max_header_length + 4)])
+                delimiters, offset = self._parse_header(head)
+                start = len(head[:offset].encode('utf-8', errors='surrogateescape'))
+                
+                encoded = [delimiter.encode('utf-8', errors='surrogateescape') for delimiter in delimiters]
+                negatives = self._negative_collector()
+                invalid = self._invalid_collector()
+                budget = self._work_budget()
+                engine = self._section_engine(len(mapped) - start, encoded)
+                if engine == 'parallel':
+                    total = parallel_file_sum(path, mapped, encoded, start, self.workers, negatives)
+                elif engine == 'numpy':
+                    total = numpy_sum(mapped, encoded, start, negatives=negatives, rules=self.rules, budget=budget)
+                else:
+                    total = scan_sum(mapped, encoded, start, pattern_cache=self.pattern_cache,
+                                     convert=self._convert, negatives=negatives, invalid=invalid, budget=budget)
+                return self._check_result(total, negatives, invalid)
+    
+    def _sum_section(self, numbers: str, delimiters: list[str], offset: int,
+                     negatives: Optional[NegativeCollector] = None,
+                     invalid: Optional[InvalidTokenCollector] = None,
+                     budget: Optional[WorkBudget] = None) -> Number:
+        """Sum the numbers part of an input with the configured engine."""
+        engine = self._section_engine(len(numbers) - offset, delimiters)
+        if engine == 'parallel':
+            return parallel_sum(numbers, delimiters, offset, self.workers, negatives)
+        if engine == 'numpy':
+            return numpy_sum(numbers, delimiters, offset, negatives=negatives, rules=self.rules, budget=budget)
+        if engine == 'scan':
+            return scan_sum(numbers, delimiters, offset, pattern_cache=self.pattern_cache,
+                            convert=self._convert, negatives=negatives, invalid=invalid, budget=budget)
+        
+        numbers_part = numbers[offset:] if offset else numbers
+        number_list = self._parse_numbers_with_delimiters(numbers_part, delimiters, negatives, budget)
         
         return sum(number_list)
     
+    def _section_engine(self, size: int, delimiters: list[str]) -> str:
+        """Name the engine that sums a numbers section of this size."""
+        if self.strict or (self._convert is not None and self._numpy_rules is None):
+            # Only the scanner takes a custom token conversion and locates tokens
+            return 'scan'
+        limited = self.max_numbers is not None or self.max_cpu_time is not None
+        if self.rules is None and not limited and self._runs_parallel(size):
+            return 'parallel'
+        engine = self.engine
+        if engine == 'auto':
+            if size < self.AUTO_SCAN_THRESHOLD and self.rules is None:
+                return 'regex'
+            engine = 'numpy' if size >= self.AUTO_NUMPY_THRESHOLD else 'scan'
+        if engine == 'numpy' and numpy_supported(delimiters):
+            return 'numpy'
+        if engine == 'regex' and self.rules is None and not (limited and size >= self.AUTO_SCAN_THRESHOLD):
+            return 'regex'
+        return 'scan'
+    
+    def _add_observed(self, numbers: str, observer: CalculatorObserver,
+                      negatives: Optional[NegativeCollector] = None,
+                      invalid: Optional[InvalidTokenCollector] = None,
+                      budget: Optional[WorkBudget] = None) -> int:
+        """add() variant reporting each phase to the attached observer."""
+        clock = time.perf_counter
+        
+        started = clock()
+        match = self._match_header(numbers)
+        finished = clock()
+        observer.header_parsed(len(numbers), match.end if match else 0, finished - started)
+        
+        started = finished
+        delimiters, offset = self._resolve_delimiters(match)
+        finished = clock()
+        observer.delimiters_resolved(delimiters, finished - started)
+        
+        engine = self._section_engine(len(numbers) - offset, delimiters)
+        if engine != 'regex':
+            total = self._sum_section(numbers, delimiters, offset, negatives, invalid, budget)
+            observer.sum_finished(total, clock() - finished, engine)
+            return total
+        
+        # Same result as _parse_numbers_with_delimiters, one phase at a time
+        started = finished
+        numbers_part = numbers[offset:] if offset else numbers
+        parts = self.pattern_cache.get(delimiters).split(numbers_part)
+        if budget is not None:
+            budget.charge(len(parts))
+        finished = clock()
+        observer.parts_split(len(parts), finished - started)
+        
+        started = finished
+        rejected = 0
+        values = None
+        if negatives is None or '-' not in numbers_part:
+            try:
+                values = list(map(int, parts))
+            except ValueError:
+                pass
+        if values is None:
+            values = []
+            for part in parts:
+                try:
+                    value = int(part)
+                except ValueError:
+                    value = integer_value(part)
+                    if value is None:
+                        rejected += 1
+                        value = 0
+                if value < 0 and negatives is not None:
+                    negatives.add(value)
+                values.append(value)
+        finished = clock()
+        observer.numbers_parsed(len(values), rejected, finished - started)
+        
+        started = finished
+        total = sum(values)
+        observer.sum_finished(total, clock() - started, engine)
+        return total
+    
+    def _make_scanner(self, delimiters: list[str], header: str = '',
+                      budget: Optional[WorkBudget] = None) -> StreamScanner:
+        """
+        Create a stream scanner following this calculator's settings.
+        
+        Args:
+            delimiters: Resolved delimiters
+            header: Input preceding the numbers section, so strict mode
+                reports positions within the whole input
+            budget: Work limits for the input (None = unlimited)
+        """
+        invalid = self._invalid_collector()
+        if invalid is not None and header:
+            invalid.rebase(header, len(header))
+        return StreamScanner(delimiters, pattern_cache=self.pattern_cache, convert=self._convert,
+                             negatives=self._negative_collector(), invalid=invalid, budget=budget)
+    
+    def _negative_collector(self) -> Optional[NegativeCollector]:
+        """Fresh collector for one input, or None when negatives are allowed outside int64 mode."""
+        if self.allow_negatives:
+            if self.numeric != 'int64':
+                return None
+            # int64 mode bounds every token by the sum of the negatives
+            return NegativeCollector(self.negative_report_limit, reject=False)
+        return NegativeCollector(self.negative_report_limit)
+    
+    def _work_budget(self) -> Optional[WorkBudget]:
+        """Fresh budget for one input when limits are set, or None."""
+        if self.max_numbers is None and self.max_cpu_time is None:
+            return None
+        return WorkBudget(self.max_numbers, self.max_cpu_time)
+    
+    def _invalid_collector(self) -> Optional[InvalidTokenCollector]:
+        """Fresh collector for one input in strict mode, or None."""
+        if not self.strict:
+            return None
+        return InvalidTokenCollector(self.invalid_report_limit)
+    
+    def _check_result(self, total: Number, negatives: Optional[NegativeCollector] = None,
+                      invalid: Optional[InvalidTokenCollector] = None) -> Number:
+        """Reject collected tokens and enforce the numeric mode's range on a finished sum."""
+        if invalid is not None:
+            invalid.raise_if_any()
+        if negatives is not None:
+            negatives.raise_if_any()
+        if self.numeric == 'int64':
+            return check_int64(total, negatives.total if negatives is not None else 0)
+        return total
+    
+    def _runs_parallel(self, size: int) -> bool:
+        """Check whether a numbers section of this size goes to the process pool."""
+        return self.workers > 1 and size >= self.parallel_threshold
+    
     def _extract_delimiters_and_numbers(self, input_string: str) -> tuple[list[str], str]:
         """
         Extract delimiters and numbers part from input string.
@@ -64,46 +478,71 @@ class StringCalculator:
         Returns:
             Tuple of (delimiters_list, numbers_string)
         """
-        # GREEN PHASE: Check for multiple bracket-enclosed delimiters first
-        multiple_match = re.match(self.MULTIPLE_DELIMITERS_PATTERN, input_string, re.DOTALL)
-        if multiple_match:
-            delimiter_section = multiple_match.group(1)
-            numbers_part = multiple_match.group(2)
+        delimiters, offset = self._parse_header(input_string)
+        return delimiters, input_string[offset:] if offset else input_string
+    
+    def _parse_header(self, input_string: str) -> tuple[list[str], int]:
+        """
+        Resolve delimiters from an optional header without copying the input.
+        
+        Args:
+            input_string: Full input that may contain custom delimiter definition
             
-            # Extract all delimiters from bracket format
-            delimiters = re.findall(self.BRACKET_DELIMITER_EXTRACT, delimiter_section)
-            if delimiters:
-                return delimiters, numbers_part
-        
-        # Check for single character delimiter (no brackets)
-        single_match = re.match(self.SINGLE_CHAR_DELIMITER_PATTERN, input_string, re.DOTALL)
-        if single_match:
-            custom_delimiter = single_match.group(1)
-            numbers_part = single_match.group(2)
-            return [custom_delimiter], numbers_part
-        
-        # No custom delimiter, use defaults
-        return self.DEFAULT_DELIMITERS.copy(), input_string
-    
-    def _parse_numbers_with_delimiters(self, numbers_str: str, delimiters: list[str]) -> list[int]:
-        """Parse numbers from string using provided delimiters."""
+        Returns:
+            Tuple of (delimiters_list, offset where the numbers part starts)
+        """
+        return self._resolve_delimiters(self._match_header(input_string))
+    
+    def _match_header(self, input_string: str) -> Optional[HeaderMatch]:
+        """
+        Parse the custom delimiter header, if any, within this calculator's limits.
+        
+        Raises:
+            InvalidDelimiterError: If the header is too long or defines too many delimiters
+        """
+        return parse_header(input_string, self.max_header_length, self.max_delimiters)
+    
+    def _resolve_delimiters(self, match: Optional[HeaderMatch]) -> tuple[list[str], int]:
+        """
+        Extract the delimiter list from a parsed header.
+        
+        Returns:
+            Tuple of (delimiters_list, offset where the numbers part starts)
+        """
+        if match is None:
+            # No custom delimiter, use defaults
+            return self.DEFAULT_DELIMITERS.copy(), 0
+        return match.delimiters, match.end
+    
+    def _parse_numbers_with_delimiters(self, numbers_str: str, delimiters: list[str],
+                                       negatives: Optional[NegativeCollector] = None,
+                                       budget: Optional[WorkBudget] = None) -> list[int]:
+        """Parse numbers from string using provided delimiters, recording negatives as they appear."""
         if not numbers_str:
             return []
         
-        # Create regex pattern from all delimiters
-        escaped_delimiters = [re.escape(delimiter) for delimiter in delimiters]
-        pattern = '|'.join(escaped_delimiters)
-        
-        # Split using regex and parse numbers
-        parts = re.split(pattern, numbers_str)
+        # Split using the cached regex pattern for this delimiter set
+        parts = self.pattern_cache.get(delimiters).split(numbers_str)
+        if budget is not None:
+            budget.charge(len(parts))
+        # Clean parts convert at C speed; a negative needs a minus sign to be reported
+        if negatives is None or '-' not in numbers_str:
+            try:
+                return list(map(int, parts))
+            except ValueError:
+                pass
         result = []
         
         for part in parts:
-            cleaned_part = part.strip()
-            if cleaned_part:
-                try:
-                    result.append(int(cleaned_part))
-                except ValueError:
+            try:
+                value = int(part)
+            except ValueError:
+                # Empty, invalid or past the interpreter's digit limit
+                value = integer_value(part)
+                if value is None:
                     continue
+            if value < 0 and negatives is not None:
+                negatives.add(value)
+            result.append(value)
         
         return result
@@ -0,0 +1,189 @@
+"""
+Inline token validation for String Calculator.
+
+Engines report offending values to a collector while they parse, so
+validation never needs a second pass over the parsed numbers. Collectors
+keep a bounded sample of what they saw plus an exact count, which keeps
+error messages small however dirty the input is.
+
+In strict mode the scanner also reports invalid tokens, located by UTF-8
+byte offset, line and column. Positions are worked out only for the tokens
+that get reported, by counting forward from the previous one, so locating
+costs one pass over the text up to the last reported token at most.
+"""
+from typing import NamedTuple, Union
+
+from .exceptions import InvalidTokenError, NegativeNumberError
+
+
+# Default number of offending values kept for the error report
+NEGATIVE_REPORT_LIMIT = 100
+
+# Default number of invalid tokens located and reported in strict mode
+INVALID_REPORT_LIMIT = 10
+
+# Characters of an invalid token kept in its report
+TOKEN_PREVIEW = 64
+
+
+class NegativeCollector:
+    """
+    Bounded record of negative numbers met during a parse.
+
+    Besides the sample and the count it keeps the exact sum of the
+    negatives, which the int64 numeric mode uses to bound every token; a
+    collector created with reject=False only keeps that record.
+    """
+
+    def __init__(self, limit: int = NEGATIVE_REPORT_LIMIT, reject: bool = True) -> None:
+        """
+        Initialize an empty collector.
+
+        Args:
+            limit: Maximum number of values kept for the report
+            reject: Whether raise_if_any() fails once a negative was recorded
+        """
+        self.limit = limit
+        self.reject = reject
+        self.values: list = []
+        self.count = 0
+        self.total = 0
+
+    def add(self, value) -> None:
+        """Record one negative number."""
+        self.count += 1
+        self.total += value
+        if len(self.values) < self.limit:
+            self.values.append(value)
+
+    def merge(self, other: 'NegativeCollector') -> None:
+        """Append the record of a later section, e.g. from a worker process."""
+        self.count += other.count
+        self.total += other.total
+        room = self.limit - len(self.values)
+        if room > 0:
+            self.values.extend(other.values[:room])
+
+    def copy(self) -> 'NegativeCollector':
+        """Independent collector holding the same record."""
+        clone = NegativeCollector(self.limit, self.reject)
+        clone.values = list(self.values)
+        clone.count = self.count
+        clone.total = self.total
+        return clone
+
+    def raise_if_any(self) -> None:
+        """
+        Fail if any negative number was recorded and negatives are rejected.
+
+        Raises:
+            NegativeNumberError: With the kept values and the total count
+        """
+        if self.count and self.reject:
+            raise NegativeNumberError(self.values, self.count)
+
+
+class TokenError(NamedTuple):
+    """Location of one invalid token; line and column count from 1."""
+    token: str
+    offset: int
+    line: int
+    column: int
+
+
+class InvalidTokenCollector:
+    """
+    Bounded record of invalid tokens met during a strict parse.
+
+    Offsets passed to add() index the text being scanned; rebase() moves
+    the origin when a stream scanner drops consumed text, so reported
+    positions stay relative to the whole input.
+    """
+
+    def __init__(self, limit: int = INVALID_REPORT_LIMIT) -> None:
+        """
+        Initialize an empty collector.
+
+        Args:
+            limit: Maximum number of invalid tokens located and kept
+        """
+        self.limit = limit
+        self.errors: list[TokenError] = []
+        self.count = 0
+        # Where index 0 of the scanned text sits: byte offset, line, column
+        self._origin = (0, 1, 0)
+        # Last located point in the current text: index, byte offset, line, line start
+        self._text = None
+        self._cursor = (0, 0, 1, None)
+
+    def add(self, text: Union[str, bytes], offset: int, token: Union[str, bytes]) -> None:
+        """Record one invalid token starting at ``text[offset]``."""
+        self.count += 1
+        if len(self.errors) < self.limit:
+            byte, line, column = self._locate(text, offset)
+            if isinstance(token, (bytes, bytearray)):
+                token = bytes(token).decode('utf-8', errors='replace')
+            self.errors.append(TokenError(token[:TOKEN_PREVIEW], byte, line, column))
+
+    def rebase(self, text: Union[str, bytes], offset: int) -> None:
+        """Make ``text[offset]`` index 0 of the next text scanned."""
+        byte, line, column = self._locate(text, offset)
+        self._origin = (byte, line, column - 1)
+        self._text = None
+
+    def copy(self) -> 'InvalidTokenCollector':
+        """Independent collector holding the same record and origin."""
+        clone = InvalidTokenCollector(self.limit)
+        clone.errors = list(self.errors)
+        clone.count = self.count
+        clone._origin = self._origin
+        clone._text = self._text
+        clone._cursor = self._cursor
+        return clone
+
+    def raise_if_any(self) -> None:
+        """
+        Fail if any invalid token was recorded.
+
+        Raises:
+            InvalidTokenError: With the located tokens and the total count
+        """
+        if self.count:
+            raise InvalidTokenError(self.errors, self.count)
+
+    def _locate(self, text: Union[str, bytes], offset: int) -> tuple[int, int, int]:
+        """Byte offset, line and column of ``text[offset]``, counting on from the last call."""
+        origin_byte, origin_line, origin_column = self._origin
+        if text is not self._text or offset < self._cursor[0]:
+            self._text = text
+            self._cursor = (0, origin_byte, origin_line, None)
+        position, byte, line, line_start = self._cursor
+
+        segment = text[position:offset]
+        newline = b'\n' if isinstance(segment, bytes) else '\n'
+        newlines = segment.count(newline)
+        if newlines:
+            line += newlines
+            line_start = position + segment.rindex(newline) + 1
+        byte += _byte_length(segment)
+        self._cursor = (offset, byte, line, line_start)
+
+        if line_start is None:
+            column = origin_column + _char_length(text, 0, offset) + 1
+        else:
+            column = _char_length(text, line_start, offset) + 1
+        return byte, line, column
+
+
+def _byte_length(segment: Union[str, bytes]) -> int:
+    """UTF-8 length of a text segment."""
+    if isinstance(segment, bytes) or segment.isascii():
+        return len(segment)
+    return len(segment.encode('utf-8', errors='surrogatepass'))
+
+
+def _char_length(text: Union[str, bytes], start: int, end: int) -> int:
+    """Character length of ``text[start:end]``."""
+    if isinstance(text, str):
+        return end - start
+    return len(text[start:end].decode('utf-8', errors='replace'))
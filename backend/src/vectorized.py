@@ -0,0 +1,164 @@
+"""
+NumPy-vectorized parsing backend for String Calculator.
+
+For numbers sections split by single-byte ASCII delimiters, each window is
+viewed as a byte array and summed with array operations: digit and
+delimiter masks, digit runs per field, Horner's rule applied to all runs at
+once, and an overflow-free reduction. Fields holding anything but digits and
+whitespace (signs, underscores, non-ASCII) go through the scalar token
+rules, so results match the other engines exactly. Number rules (see the
+rules module) are applied as a mask on the whole window: digit-only fields
+pass any syntax rule, so only the value range needs checking. NumPy is
+optional; callers check ``is_supported`` first.
+"""
+from typing import Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+from .limits import WorkBudget
+from .rules import NumberRules
+from .scanner import iter_windows, token_value
+from .validation import NegativeCollector
+
+
+# Bytes per vectorized window; bounds the temporary arrays
+NUMPY_WINDOW_SIZE = 1 << 20
+
+# Longest digit run evaluated in int64; longer numbers use Python integers
+_MAX_RUN_DIGITS = 18
+
+# ASCII characters str.strip() treats as whitespace
+_ASCII_WHITESPACE = b'\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f '
+
+_SPACE_TABLE = None
+if np is not None:
+    _SPACE_TABLE = np.zeros(256, dtype=bool)
+    _SPACE_TABLE[list(_ASCII_WHITESPACE)] = True
+
+
+def is_supported(delimiters: list[Union[str, bytes]]) -> bool:
+    """
+    Check whether the vectorized backend can handle a delimiter set.
+
+    Args:
+        delimiters: Resolved delimiters (str or UTF-8 bytes)
+
+    Returns:
+        True if NumPy is installed and every delimiter is a single ASCII
+        byte other than a digit (digits are classified before delimiters)
+    """
+    if np is None:
+        return False
+    return all(len(delimiter) == 1 and ord(delimiter) < 128 and not 48 <= ord(delimiter) <= 57
+               for delimiter in delimiters)
+
+
+def numpy_sum(text: Union[str, bytes], delimiters: list[Union[str, bytes]], start: int = 0,
+              end: Optional[int] = None, window_size: int = NUMPY_WINDOW_SIZE,
+              negatives: Optional[NegativeCollector] = None, rules: Optional[NumberRules] = None,
+              budget: Optional[WorkBudget] = None) -> int:
+    """
+    Sum the numbers found in ``text[start:end]`` with vectorized operations.
+
+    Args:
+        text: String (or UTF-8 bytes/mmap) holding the numbers section
+        delimiters: Single-byte ASCII delimiters, in precedence order
+        start: Index where the numbers section begins
+        end: Index where the numbers section ends (defaults to len(text))
+        window_size: Approximate number of characters per window
+        negatives: Collector that records negative numbers as they are parsed
+        rules: Number rules applied to every value (None = plain integers)
+        budget: Work limits charged window by window (None = unlimited)
+
+    Returns:
+        Sum of all valid numbers
+
+    Raises:
+        LimitExceededError: If the budget runs out
+    """
+    if end is None:
+        end = len(text)
+    codes = [ord(delimiter) for delimiter in delimiters]
+
+    total = 0
+    for low, high in iter_windows(text, delimiters, start, end, window_size):
+        window = text[low:high]
+        if isinstance(window, str):
+            # UTF-8 keeps ASCII delimiters and digits as single bytes
+            window = window.encode('utf-8', errors='surrogatepass')
+        total += _window_sum(window, codes, negatives, rules, budget)
+    return total
+
+
+def _window_sum(data: bytes, codes: list[int], negatives: Optional[NegativeCollector] = None,
+                rules: Optional[NumberRules] = None, budget: Optional[WorkBudget] = None) -> int:
+    """Sum one window of bytes whose fields never straddle the window edge."""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if raw.size == 0:
+        return 0
+
+    is_delimiter = raw == codes[0]
+    for code in codes[1:]:
+        is_delimiter |= raw == code
+    is_digit = (raw - 48) < 10
+    is_other = ~(is_digit | is_delimiter | _SPACE_TABLE[raw])
+
+    previous_digit = np.zeros_like(is_digit)
+    previous_digit[1:] = is_digit[:-1]
+    next_digit = np.zeros_like(is_digit)
+    next_digit[:-1] = is_digit[1:]
+    starts = np.flatnonzero(is_digit & ~previous_digit)
+    lengths = np.flatnonzero(is_digit & ~next_digit) + 1 - starts
+
+    field = np.cumsum(is_delimiter, dtype=np.intp)
+    run_field = field[starts]
+    field_count = int(field[-1]) + 1
+    if budget is not None:
+        budget.charge(field_count)
+
+    # Fields with signs, underscores, non-ASCII bytes or numbers too long
+    # for int64 take the scalar path
+    irregular = np.zeros(field_count, dtype=bool)
+    irregular[field[is_other]] = True
+    irregular[run_field[lengths > _MAX_RUN_DIGITS]] = True
+
+    # Whitespace between digit runs ("1 2") makes int() reject the field
+    rejected = irregular.copy()
+    repeated = run_field[1:] == run_field[:-1]
+    rejected[run_field[1:][repeated]] = True
+
+    keep = ~rejected[run_field]
+    starts = starts[keep]
+    lengths = lengths[keep]
+
+    # Horner's rule across all runs at once, one digit column per step
+    values = np.zeros(starts.size, dtype=np.int64)
+    last = raw.size - 1
+    for column in range(int(lengths.max()) if lengths.size else 0):
+        digits = raw[np.minimum(starts + column, last)].astype(np.int64) - 48
+        values = np.where(lengths > column, values * 10 + digits, values)
+
+    if rules is not None:
+        low, high = rules.bounds()
+        values[(values < low) | (values > high)] = 0
+
+    # Split into 32-bit halves so neither partial sum can overflow int64
+    total = (int(np.sum(values >> 32)) << 32) + int(np.sum(values & 0xFFFFFFFF))
+
+    if irregular.any():
+        parse = token_value if rules is None else rules.value
+        bounds = np.flatnonzero(is_delimiter)
+        for index in np.flatnonzero(irregular):
+            low = int(bounds[index - 1]) + 1 if index > 0 else 0
+            high = int(bounds[index]) if index < bounds.size else len(data)
+            value = parse(data[low:high])
+            if value is None:
+                continue
+            # Signed fields are always irregular, so negatives surface only here
+            if value < 0 and negatives is not None:
+                negatives.add(value)
+            total += value
+    return total
@@ -0,0 +1,82 @@
+"""
+Synthetic calculator inputs for benchmarks and load tests.
+
+Generates reproducible inputs of a requested size in every delimiter form
+the calculator supports. Large inputs repeat one seeded block, so building
+even a 100 MB input stays fast.
+"""
+import random
+from typing import Optional
+
+
+# Delimiter forms: header and the delimiters used between numbers
+STYLES = {
+    'default': ('', [',', '\n']),
+    'single_char': ('//;\n', [';']),
+    'multi_char': ('//[***]\n', ['***']),
+    'multiple': ('//[*][%]\n', ['*', '%']),
+}
+
+# Characters in the repeated block of a generated input
+BLOCK_SIZE = 64 * 1024
+
+
+def generate_input(style: str = 'default', size: int = 1024, seed: int = 0, max_value: int = 1000,
+                   rng: Optional[random.Random] = None) -> str:
+    """
+    Build an input of about ``size`` characters in one delimiter form.
+
+    Args:
+        style: Delimiter form, one of STYLES
+        size: Target length in characters (the result never exceeds it, except
+            that the header and one number are always included)
+        seed: Seed for the numbers, ignored when rng is given
+        max_value: Largest number generated
+        rng: Random source to draw the numbers from
+
+    Returns:
+        Calculator input; every number is a valid non-negative integer
+
+    Raises:
+        ValueError: If the style is unknown
+    """
+    if style not in STYLES:
+        raise ValueError(f"Unknown style: {style!r} (expected one of {', '.join(STYLES)})")
+    header, delimiters = STYLES[style]
+    rng = rng if rng is not None else random.Random(seed)
+    budget = max(size - len(header), 1)
+
+    tokens = []
+    length = 0
+    while length < min(budget, BLOCK_SIZE):
+        number = str(rng.randint(0, max_value))
+        delimiter = delimiters[len(tokens) % len(delimiters)]
+        tokens.append(number + delimiter)
+        length += len(number) + len(delimiter)
+
+    block = ''.join(tokens)
+    repeats, remainder = divmod(budget, len(block))
+    body = block * repeats + _whole_tokens(tokens, remainder)
+    if not body:
+        body = tokens[0]
+    return header + _strip_delimiter(body, delimiters)
+
+
+def _whole_tokens(tokens: list[str], limit: int) -> str:
+    """Longest prefix of the block made of whole tokens within ``limit`` characters."""
+    prefix = []
+    length = 0
+    for token in tokens:
+        if length + len(token) > limit:
+            break
+        prefix.append(token)
+        length += len(token)
+    return ''.join(prefix)
+
+
+def _strip_delimiter(body: str, delimiters: list[str]) -> str:
+    """Drop the delimiter trailing the last number."""
+    for delimiter in delimiters:
+        if body.endswith(delimiter):
+            return body[:-len(delimiter)]
+    return body
@@ -93,3 +93,502 @@ class TestStringCalculatorAPI:
         data = json.loads(response.data)
         assert 'error' in data
         assert data['success'] is False
+        
+        # Non-string numbers are rejected before they reach the result cache
+        for numbers in (None, [], 123, {'a': 1}):
+            response = client.post('/api/add', json={'numbers': numbers})
+            assert response.status_code == 400
+            assert json.loads(response.data) == {'error': 'Field numbers must be a string', 'success': False}
+        
+        # Malformed JSON gets the same JSON error as a missing field
+        for body in ('{bad', '[1, 2]'):
+            response = client.post('/api/add', data=body, content_type='application/json')
+            assert response.status_code == 400
+            assert json.loads(response.data) == {'error': 'Missing required field: numbers', 'success': False}
+    
+    # ===== STEP 6: BATCH ENDPOINT =====
+    def test_api_batch_endpoint(self):
+        """Test: POST /api/add/batch evaluates every input in order"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        response = client.post('/api/add/batch',
+                             json={'inputs': ['1,2', '//;\n1;2;3', '', '//[***]\n1***2']})
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['success'] is True
+        assert data['count'] == 4
+        assert [item['result'] for item in data['results']] == [3, 6, 0, 3]
+        assert all(item['success'] for item in data['results'])
+    
+    def test_api_batch_per_item_errors(self):
+        """Test: A failing item does not fail the whole batch"""
+        from unittest.mock import patch
+        from src.api import app, calculator
+        from src.exceptions import NegativeNumberError
+        
+        client = app.test_client()
+        
+        def fake_add(numbers):
+            if numbers == 'bad':
+                raise NegativeNumberError([-1])
+            return 5
+        
+        with patch.object(calculator, 'add', side_effect=fake_add):
+            response = client.post('/api/add/batch', json={'inputs': ['ok', 'bad', 7]})
+        
+        assert response.status_code == 200
+        results = json.loads(response.data)['results']
+        assert results[0] == {'result': 5, 'success': True}
+        assert results[1]['success'] is False
+        assert 'negative numbers not allowed: -1' in results[1]['error']
+        assert results[2]['success'] is False
+    
+    def test_api_batch_validation(self):
+        """Test: Batch endpoint rejects malformed and oversized requests"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        response = client.post('/api/add/batch', json={'inputs': '1,2'})
+        assert response.status_code == 400
+        assert json.loads(response.data)['success'] is False
+        
+        response = client.post('/api/add/batch', data='1,2', content_type='text/plain')
+        assert response.status_code == 400
+        
+        response = client.post('/api/add/batch', data='{"inputs": [', content_type='application/json')
+        assert response.status_code == 400
+        assert json.loads(response.data)['error'] == 'Missing required field: inputs (must be a list)'
+        
+        original = app.config['MAX_BATCH_SIZE']
+        app.config['MAX_BATCH_SIZE'] = 2
+        try:
+            response = client.post('/api/add/batch', json={'inputs': ['1', '2', '3']})
+        finally:
+            app.config['MAX_BATCH_SIZE'] = original
+        assert response.status_code == 413
+        assert json.loads(response.data)['success'] is False
+    
+    # ===== STEP 7: NDJSON STREAMING ENDPOINT =====
+    def test_api_stream_ndjson(self):
+        """Test: NDJSON records are evaluated and streamed back line by line"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        body = '{"numbers": "1,2"}\n"//;\\n1;2;3"\n\nnot json\n{"other": 1}\n'
+        response = client.post('/api/add/stream', data=body, content_type='application/x-ndjson')
+        
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = [json.loads(line) for line in response.data.decode().splitlines()]
+        assert lines[0] == {'line': 1, 'result': 3, 'input': '1,2', 'success': True}
+        assert lines[1] == {'line': 2, 'result': 6, 'input': '//;\n1;2;3', 'success': True}
+        assert lines[2]['line'] == 4 and lines[2]['success'] is False
+        assert lines[3]['line'] == 5 and lines[3]['success'] is False
+        assert len(lines) == 4
+    
+    def test_api_stream_without_echo(self):
+        """Test: echo=false omits the input from streamed results"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        response = client.post('/api/add/stream?echo=false', data='"1,2,3"\n',
+                             content_type='application/x-ndjson')
+        
+        assert json.loads(response.data) == {'line': 1, 'result': 6, 'success': True}
+    
+    def test_api_stream_raw_text(self):
+        """Test: A raw text body is summed as one streamed input"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        original = app.config['STREAM_CHUNK_SIZE']
+        app.config['STREAM_CHUNK_SIZE'] = 4
+        try:
+            body = '//[***]\n' + '***'.join(str(i) for i in range(1000))
+            response = client.post('/api/add/stream', data=body, content_type='text/plain')
+        finally:
+            app.config['STREAM_CHUNK_SIZE'] = original
+        
+        assert response.status_code == 200
+        assert json.loads(response.data) == {'line': 1, 'result': sum(range(1000)), 'success': True}
+    
+    def test_api_stream_rejects_other_content_types(self):
+        """Test: Unsupported content types are rejected"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        response = client.post('/api/add/stream', json={'numbers': '1,2'})
+        assert response.status_code == 415
+        assert json.loads(response.data)['success'] is False
+    
+    # ===== STEP 8: METRICS ENDPOINT =====
+    def test_api_metrics_endpoint(self):
+        """Test: Requests, errors and per-phase latencies appear in Prometheus format"""
+        from src.api import app
+        
+        client = app.test_client()
+        client.post('/api/add', json={'numbers': '//;\n1;2'})
+        client.post('/api/add', json={'wrong': 'field'})
+        
+        response = client.get('/api/metrics')
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain; version=0.0.4')
+        
+        text = response.get_data(as_text=True)
+        assert '# TYPE calculator_phase_seconds histogram' in text
+        assert 'calculator_requests_total{endpoint="/api/add",method="POST",status="200"}' in text
+        assert 'calculator_errors_total{type="missing_field"}' in text
+        for phase in ('json_decode', 'serialize'):
+            assert f'calculator_phase_seconds_count{{phase="{phase}"}}' in text
+    
+    def test_api_metrics_can_be_disabled(self):
+        """Test: Disabled metrics stop counting requests"""
+        from src.api import app, service_metrics, set_metrics_enabled
+        
+        client = app.test_client()
+        set_metrics_enabled(False)
+        try:
+            before = service_metrics.requests.value('/api/health', 'GET', '200')
+            client.get('/api/health')
+            assert service_metrics.requests.value('/api/health', 'GET', '200') == before
+        finally:
+            set_metrics_enabled(True)
+    
+    # ===== STEP 9: RUNNING-SUM SESSIONS =====
+    def test_api_session_lifecycle(self):
+        """Test: Open, append, read and close a running-sum session"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        response = client.post('/api/sessions', json={'numbers': '//[***]\n1***2'})
+        assert response.status_code == 201
+        data = json.loads(response.data)
+        assert data['result'] == 3
+        assert data['delimiters'] == ['***']
+        session_id = data['session_id']
+        
+        response = client.post(f'/api/sessions/{session_id}/append', json={'numbers': '***3*'})
+        assert json.loads(response.data)['result'] == 3
+        response = client.post(f'/api/sessions/{session_id}/append', json={'numbers': '**4'})
+        assert json.loads(response.data)['result'] == 10
+        
+        assert json.loads(client.get(f'/api/sessions/{session_id}').data)['result'] == 10
+        assert client.delete(f'/api/sessions/{session_id}').status_code == 200
+        
+        response = client.get(f'/api/sessions/{session_id}')
+        assert response.status_code == 404
+        assert json.loads(response.data)['success'] is False
+    
+    def test_api_session_validation(self):
+        """Test: Bad bodies are rejected and unknown sessions are 404"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        assert client.post('/api/sessions', json={'numbers': 5}).status_code == 400
+        assert client.post('/api/sessions', data='1,2').status_code == 400
+        assert client.post('/api/sessions/unknown/append', json={'numbers': '1'}).status_code == 404
+        
+        session_id = json.loads(client.post('/api/sessions', json={}).data)['session_id']
+        assert client.post(f'/api/sessions/{session_id}/append', json={}).status_code == 400
+        
+        # Malformed JSON gets the JSON 400, not an HTML error page
+        for path in ('/api/sessions', f'/api/sessions/{session_id}/append'):
+            response = client.post(path, data='{bad', content_type='application/json')
+            assert response.status_code == 400
+            assert json.loads(response.data)['success'] is False
+    
+    def test_api_sessions_disabled(self, monkeypatch):
+        """Test: With SESSIONS_ENABLED off every session endpoint answers 501"""
+        from src import api
+        
+        monkeypatch.setitem(api.app.config, 'SESSIONS_ENABLED', False)
+        client = api.app.test_client()
+        
+        responses = [
+            client.post('/api/sessions', json={'numbers': '1,2'}),
+            client.post('/api/sessions/unknown/append', json={'numbers': '1'}),
+            client.get('/api/sessions/unknown'),
+            client.delete('/api/sessions/unknown'),
+        ]
+        for response in responses:
+            assert response.status_code == 501
+            assert json.loads(response.data)['success'] is False
+        assert json.loads(client.get('/').data)['sessions_enabled'] is False
+    
+    # ===== STEP 10: NUMERIC MODES =====
+    def test_api_numeric_overflow(self, monkeypatch):
+        """Test: An int64 calculator turns overflow into a 422 error"""
+        from src import api
+        from src.string_calculator import StringCalculator
+        
+        monkeypatch.setattr(api, 'calculator', StringCalculator(numeric='int64'))
+        client = api.app.test_client()
+        
+        response = client.post('/api/add', json={'numbers': '9223372036854775807,1,0'})
+        assert response.status_code == 422
+        data = json.loads(response.data)
+        assert data['success'] is False
+        assert 'overflows the int64 numeric mode' in data['error']
+        
+        response = client.post('/api/add/batch', json={'inputs': ['1,2', '9223372036854775807,2']})
+        results = json.loads(response.data)['results']
+        assert results[0] == {'result': 3, 'success': True}
+        assert results[1]['success'] is False
+    
+    # ===== STEP 11: NEGATIVE NUMBERS =====
+    def test_api_negative_numbers_structured(self):
+        """Test: Negative numbers are rejected with a structured list"""
+        from src.api import app
+        
+        client = app.test_client()
+        
+        response = client.post('/api/add', json={'numbers': '1,-2,3,-4'})
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['success'] is False
+        assert data['error'] == 'negative numbers not allowed: -2, -4'
+        assert data['negatives'] == [-2, -4]
+        assert data['negative_count'] == 2
+        
+        response = client.post('/api/add/batch', json={'inputs': ['1,2', '-1']})
+        results = json.loads(response.data)['results']
+        assert results[1]['negatives'] == [-1]
+        
+        response = client.post('/api/sessions', json={'numbers': '1,2'})
+        session_id = json.loads(response.data)['session_id']
+        response = client.post(f'/api/sessions/{session_id}/append', json={'numbers': ',-5,'})
+        assert response.status_code == 400
+        assert json.loads(response.data)['negatives'] == [-5]
+    
+    # ===== STEP 12: STRICT MODE =====
+    def test_api_strict_mode_locates_invalid_tokens(self, monkeypatch):
+        """Test: A strict calculator rejects invalid tokens with their positions"""
+        from src import api
+        from src.string_calculator import StringCalculator
+        
+        monkeypatch.setattr(api, 'calculator', StringCalculator(strict=True))
+        client = api.app.test_client()
+        
+        response = client.post('/api/add', json={'numbers': '1,2\n3;4'})
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['success'] is False
+        assert data['invalid_count'] == 1
+        assert data['invalid_tokens'] == [{'token': '3;4', 'offset': 4, 'line': 2, 'column': 1}]
+        
+        # A trailing delimiter leaves an empty token, whichever endpoint reads the body
+        trailing = {'token': '', 'offset': 4, 'line': 1, 'column': 5}
+        response = client.post('/api/add/raw', data='1,2,', content_type='text/plain')
+        assert json.loads(response.data)['invalid_tokens'] == [trailing]
+        response = client.post('/api/add/stream', data='1,2,', content_type='text/plain')
+        assert json.loads(response.get_data())['invalid_tokens'] == [trailing]
+    
+    # ===== STEP 13: HEADER LIMITS =====
+    def test_api_rejects_oversized_headers(self):
+        """Test: Headers beyond the configured limits are rejected as invalid delimiters"""
+        from src.api import app
+        
+        client = app.test_client()
+        oversized = '//[' + '*' * 10000 + ']\n1'
+        
+        response = client.post('/api/add', json={'numbers': oversized})
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['success'] is False
+        assert data['error'] == 'delimiter header longer than 4096 characters'
+        
+        response = client.post('/api/add/batch', json={'inputs': ['1,2', oversized]})
+        results = json.loads(response.data)['results']
+        assert results[1] == {'error': 'delimiter header longer than 4096 characters', 'success': False}
+        
+        response = client.post('/api/sessions', json={'numbers': oversized})
+        assert response.status_code == 400
+    
+    # ===== STEP 14: REQUEST LIMITS AND BACKPRESSURE =====
+    def test_api_request_limits(self, monkeypatch):
+        """Test: Oversized bodies and inputs with too many numbers are rejected with 413"""
+        from src import api
+        from src.string_calculator import StringCalculator
+        
+        client = api.app.test_client()
+        monkeypatch.setitem(api.app.config, 'MAX_BODY_SIZE', 64)
+        response = client.post('/api/add', json={'numbers': '1,' * 100})
+        assert response.status_code == 413
+        assert json.loads(response.data) == {'error': 'Request body too large (maximum 64 bytes)', 'success': False}
+        
+        # The streaming endpoint takes any body size but caps each NDJSON line
+        body = '"1,2"\n' + '"' + '1,' * 100 + '1"\n' + '"' + '1' * 200 + '"\n"3,4"\n'
+        response = client.post('/api/add/stream?echo=false', data=body, content_type='application/x-ndjson')
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert lines[0] == {'line': 1, 'result': 3, 'success': True}
+        assert lines[1] == {'line': 2, 'error': 'Line too large (maximum 64 bytes)', 'limit': 'line_size', 'success': False}
+        assert lines[2]['line'] == 3 and lines[2]['limit'] == 'line_size'
+        assert lines[3] == {'line': 4, 'result': 7, 'success': True}
+        monkeypatch.setitem(api.app.config, 'MAX_BODY_SIZE', None)
+        
+        monkeypatch.setattr(api, 'calculator', StringCalculator(max_numbers=5))
+        assert json.loads(client.post('/api/add', json={'numbers': '1,2,3,4,5'}).data)['result'] == 15
+        response = client.post('/api/add', json={'numbers': '1,2,3,4,5,6'})
+        assert response.status_code == 413
+        data = json.loads(response.data)
+        assert data['limit'] == 'numbers'
+        assert data['error'] == 'input exceeds the numbers limit of 5'
+        
+        results = json.loads(client.post('/api/add/batch', json={'inputs': ['1,2', '1,2,3,4,5,6']}).data)['results']
+        assert results[1]['limit'] == 'numbers'
+        
+        # Each session fragment gets its own budget; running out closes the session
+        monkeypatch.setattr(api.session_store, 'calculator', StringCalculator(max_numbers=5))
+        session_id = json.loads(client.post('/api/sessions', json={'numbers': '1,2,3'}).data)['session_id']
+        assert client.post(f'/api/sessions/{session_id}/append', json={'numbers': ',4,5'}).status_code == 200
+        response = client.post(f'/api/sessions/{session_id}/append', json={'numbers': ',6,7,8,9,10,11,'})
+        assert response.status_code == 413
+        assert json.loads(response.data)['limit'] == 'numbers'
+        assert client.get(f'/api/sessions/{session_id}').status_code == 404
+    
+    def test_api_heavy_requests_get_backpressure(self, monkeypatch):
+        """Test: Heavy requests beyond capacity get 503 with Retry-After; limits are published"""
+        from src import api
+        from src.limits import ConcurrencyLimiter
+        
+        client = api.app.test_client()
+        limiter = ConcurrencyLimiter(1)
+        monkeypatch.setattr(api, 'heavy_limiter', limiter)
+        monkeypatch.setitem(api.app.config, 'HEAVY_REQUEST_BYTES', 20)
+        
+        # Light requests are never limited
+        assert limiter.try_acquire()
+        assert client.post('/api/add', json={'numbers': '1'}).status_code == 200
+        
+        response = client.post('/api/add', json={'numbers': '1,2,3,4,5,6,7,8'})
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+        assert limiter.stats() == {'capacity': 1, 'in_flight': 1, 'rejected': 1}
+        assert client.post('/api/sessions', json={'numbers': '1,2,3,4,5,6,7,8'}).status_code == 503
+        assert client.post('/api/sessions/unknown/append', json={'numbers': '1,2,3,4,5,6,7,8'}).status_code == 503
+        
+        limiter.release()
+        response = client.post('/api/add', json={'numbers': '1,2,3,4,5,6,7,8'})
+        assert json.loads(response.data)['result'] == 36
+        response = client.post('/api/add/stream', data='1,2,3,4,5,6,7,8', content_type='text/plain')
+        assert json.loads(response.get_data())['result'] == 36
+        response.close()
+        assert limiter.in_flight == 0
+        
+        limits = json.loads(client.get('/').data)['limits']
+        assert limits['max_heavy_requests'] == 1
+        assert limits['heavy_request_bytes'] == 20
+        assert {'max_body_size', 'max_number_count', 'max_cpu_time', 'retry_after'} <= set(limits)
+    
+    # ===== STEP 15: RAW AND COMPRESSED BODIES =====
+    def test_api_raw_bodies(self):
+        """Test: Raw text and octet-stream bodies are parsed without JSON"""
+        from src.api import app
+        
+        client = app.test_client()
+        body = "//[***]\n" + "***".join(["12"] * 10000)
+        
+        for content_type in ('text/plain', 'text/plain; charset=utf-8', 'application/octet-stream'):
+            response = client.post('/api/add/raw', data=body.encode('utf-8'), content_type=content_type)
+            assert response.status_code == 200
+            assert json.loads(response.data) == {'result': 120000, 'success': True}
+        
+        response = client.post('/api/add/raw', data='1,2'.encode('utf-16'), content_type='text/plain; charset=utf-16')
+        assert json.loads(response.data)['result'] == 3
+        
+        response = client.post('/api/add/raw', data=b'1,\xff2', content_type='text/plain')
+        assert response.status_code == 400
+        response = client.post('/api/add/raw', json={'numbers': '1,2'})
+        assert response.status_code == 415
+    
+    def test_api_compressed_bodies(self, monkeypatch):
+        """Test: gzip (and zstd when installed) bodies are decompressed on the fly, with a size cap"""
+        import gzip
+        from src import api
+        from src.bodies import supported_encodings
+        
+        client = api.app.test_client()
+        body = ",".join(["7"] * 50000).encode('utf-8')
+        compressed = {'gzip': gzip.compress(body)}
+        if 'zstd' in supported_encodings():
+            import zstandard
+            compressed['zstd'] = zstandard.ZstdCompressor().compress(body)
+        
+        for encoding, data in compressed.items():
+            response = client.post('/api/add/raw', data=data, content_type='text/plain',
+                                   headers={'Content-Encoding': encoding})
+            assert json.loads(response.data) == {'result': 350000, 'success': True}, encoding
+        
+        for encoding, data in compressed.items():
+            response = client.post('/api/add/raw', data=data[:-20], content_type='text/plain',
+                                   headers={'Content-Encoding': encoding})
+            assert response.status_code == 400, encoding
+            assert json.loads(response.data)['error'].startswith('invalid compressed body')
+        
+        response = client.post('/api/add/raw', data=body, content_type='text/plain',
+                               headers={'Content-Encoding': 'br'})
+        assert response.status_code == 415
+        
+        monkeypatch.setitem(api.app.config, 'MAX_DECODED_BODY_SIZE', 1000)
+        response = client.post('/api/add/raw', data=compressed['gzip'], content_type='text/plain',
+                               headers={'Content-Encoding': 'gzip'})
+        assert response.status_code == 413
+        assert json.loads(response.data)['limit'] == 'decoded_body_size'
+    
+    # ===== STEP 16: LEAN RESPONSES AND FAST JSON =====
+    def test_api_lean_responses(self):
+        """Test: echo=false or Prefer: return=minimal drops the echoed input"""
+        from src.api import app, result_cache
+        
+        client = app.test_client()
+        result_cache.clear()
+        response = client.post('/api/add?echo=false', json={'numbers': '1,2,3'})
+        assert json.loads(response.data) == {'result': 6, 'success': True}
+        assert 'Preference-Applied' not in response.headers
+        
+        response = client.post('/api/add', json={'numbers': '1,2,3'}, headers={'Prefer': 'return=minimal'})
+        assert json.loads(response.data) == {'result': 6, 'success': True}
+        assert response.headers['X-Cache'] == 'HIT'
+        assert response.headers['Preference-Applied'] == 'return=minimal'
+        
+        # The query parameter takes precedence over the header
+        response = client.post('/api/add?echo=true', json={'numbers': '1,2,3'}, headers={'Prefer': 'return=minimal'})
+        assert json.loads(response.data)['input'] == '1,2,3'
+        
+        response = client.post('/api/add/stream', data='"1,2"\n', content_type='application/x-ndjson',
+                               headers={'Prefer': 'respond-async, return=minimal'})
+        assert json.loads(response.get_data()) == {'line': 1, 'result': 3, 'success': True}
+    
+    def test_api_fast_json_encoding(self, monkeypatch):
+        """Test: The JSON provider encodes every result type like the standard library"""
+        from decimal import Decimal
+        from flask.json.provider import DefaultJSONProvider
+        from src import api
+        from src.fast_json import FastJSONProvider
+        
+        assert isinstance(api.app.json, FastJSONProvider)
+        standard = DefaultJSONProvider(api.app)
+        payloads = [
+            {'result': 6, 'input': 'é,1', 'success': True},
+            {'result': Decimal('3.3'), 'success': True},
+            {'result': 2 ** 70, 'success': True},
+            {'results': [{'result': 1.5, 'success': True}], 'count': 1},
+        ]
+        for payload in payloads:
+            assert json.loads(api.app.json.response(payload).data) == json.loads(standard.response(payload).data)
+            assert json.loads(api.app.json.dumps(payload)) == json.loads(standard.dumps(payload))
+        
+        client = api.app.test_client()
+        response = client.post('/api/add', json={'numbers': ','.join(['9223372036854775807'] * 4)})
+        assert json.loads(response.data)['result'] == 4 * (2 ** 63 - 1)
+        assert json.loads(client.get('/').data)['json_encoder'] in ('orjson', 'stdlib')
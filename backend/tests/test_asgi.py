@@ -0,0 +1,155 @@
+"""
+Test cases for the asyncio ASGI variant of the String Calculator API.
+"""
+
+import asyncio
+import json
+
+
+def call_asgi(app, method, path, body=b'', headers=None):
+    """In-process ASGI client: run one request and collect the response."""
+    path, _, query = path.partition('?')
+    scope = {
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'query_string': query.encode(),
+        'headers': [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()],
+    }
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+    
+    async def receive():
+        return messages.pop(0) if messages else {'type': 'http.disconnect'}
+    
+    async def send(message):
+        sent.append(message)
+    
+    asyncio.run(app(scope, receive, send))
+    start, content = sent[0], sent[1]
+    response_headers = {name.decode(): value.decode() for name, value in start['headers']}
+    return start['status'], response_headers, content['body']
+
+
+class TestASGIApp:
+    """Test suite for the ASGI application contract."""
+    
+    def setup_method(self):
+        """Set up the ASGI app and a Flask test client for comparison."""
+        from src.api import app as flask_app, result_cache
+        from src.asgi import CalculatorASGIApp
+        self.app = CalculatorASGIApp()
+        self.flask_client = flask_app.test_client()
+        self.result_cache = result_cache
+    
+    def test_add_matches_flask_bytes(self):
+        """Test: /api/add responses are byte-identical to the Flask app"""
+        bodies = [
+            {'numbers': '1,2,3'}, {'numbers': '//[***]\n1***2***3'}, {'numbers': ''},
+            {'numbers': 'é,1'}, {}, {'numbers': None}, {'numbers': []}, [1, 2], b'{bad', b'\xff',
+        ]
+        for body in bodies:
+            self.result_cache.clear()
+            encoded = body if isinstance(body, bytes) else json.dumps(body).encode()
+            status, headers, content = call_asgi(self.app, 'POST', '/api/add', encoded,
+                                                 {'Content-Type': 'application/json'})
+            self.result_cache.clear()
+            expected = self.flask_client.post('/api/add', data=encoded, content_type='application/json')
+            
+            assert status == expected.status_code
+            assert content == expected.data
+            assert headers.get('x-cache') == expected.headers.get('X-Cache')
+    
+    def test_health_and_root_match_flask_bytes(self):
+        """Test: /api/health and / bodies are byte-identical to the Flask app"""
+        for path in ('/api/health', '/'):
+            status, _, content = call_asgi(self.app, 'GET', path)
+            expected = self.flask_client.get(path)
+            assert status == 200
+            assert content == expected.data
+    
+    def test_error_responses(self):
+        """Test: Content type, JSON and routing errors"""
+        status, _, content = call_asgi(self.app, 'POST', '/api/add', b'1,2', {'Content-Type': 'text/plain'})
+        assert status == 400
+        assert json.loads(content)['success'] is False
+        
+        status, _, content = call_asgi(self.app, 'POST', '/api/add', b'{bad', {'Content-Type': 'application/json'})
+        assert status == 400
+        assert json.loads(content) == {'error': 'Missing required field: numbers', 'success': False}
+        
+        assert call_asgi(self.app, 'GET', '/missing')[0] == 404
+        assert call_asgi(self.app, 'GET', '/api/add')[0] == 405
+    
+    def test_large_bodies_offloaded_to_executor(self):
+        """Test: Bodies over the threshold are decoded and evaluated in the executor"""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        from src.asgi import CalculatorASGIApp
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            app = CalculatorASGIApp(offload_threshold=64, executor=executor)
+            with patch.object(executor, 'submit', wraps=executor.submit) as submit, \
+                    patch('src.asgi.json.loads', wraps=json.loads) as loads:
+                body = json.dumps({'numbers': ','.join(['1'] * 50)}).encode()
+                status, _, content = call_asgi(app, 'POST', '/api/add', body, {'Content-Type': 'application/json'})
+                assert loads.call_count == 1
+                call_asgi(app, 'POST', '/api/add', b'{"numbers": "1,2"}', {'Content-Type': 'application/json'})
+        
+        assert status == 200
+        assert json.loads(content)['result'] == 50
+        assert submit.call_count == 1
+    
+    def test_body_size_limit(self, monkeypatch):
+        """Test: Bodies over MAX_BODY_SIZE are refused like the Flask app, declared or not"""
+        from src.api import app as flask_app
+        
+        monkeypatch.setitem(flask_app.config, 'MAX_BODY_SIZE', 64)
+        body = json.dumps({'numbers': ','.join(['1'] * 50)}).encode()
+        expected = self.flask_client.post('/api/add', data=body, content_type='application/json')
+        for headers in ({'Content-Type': 'application/json', 'Content-Length': str(len(body))},
+                        {'Content-Type': 'application/json'}):
+            status, _, content = call_asgi(self.app, 'POST', '/api/add', body, headers)
+            assert status == expected.status_code == 413
+            assert content == expected.data
+        
+        status, _, content = call_asgi(self.app, 'POST', '/api/add', b'{"numbers": "1,2"}',
+                                       {'Content-Type': 'application/json'})
+        assert json.loads(content)['result'] == 3
+    
+    def test_cors_headers(self):
+        """Test: CORS headers mirror flask-cors"""
+        _, headers, _ = call_asgi(self.app, 'GET', '/api/health', headers={'Origin': 'http://localhost:3000'})
+        assert headers['access-control-allow-origin'] == 'http://localhost:3000'
+        assert headers['vary'] == 'Origin'
+        
+        status, headers, _ = call_asgi(self.app, 'OPTIONS', '/api/add', headers={'Origin': 'http://x'})
+        assert status == 200
+        assert 'POST' in headers['access-control-allow-methods']
+    
+    def test_lifespan(self):
+        """Test: Lifespan startup and shutdown are acknowledged"""
+        messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+        sent = []
+        
+        async def receive():
+            return messages.pop(0)
+        
+        async def send(message):
+            sent.append(message['type'])
+        
+        asyncio.run(self.app({'type': 'lifespan'}, receive, send))
+        assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+    
+    def test_lean_add_matches_flask(self):
+        """Test: Lean /api/add responses match the Flask app, headers included"""
+        encoded = json.dumps({'numbers': '1,2,3'}).encode()
+        for path, headers in [('/api/add?echo=false', {}), ('/api/add', {'Prefer': 'return=minimal'})]:
+            status, response_headers, content = call_asgi(self.app, 'POST', path, encoded,
+                                                          {'Content-Type': 'application/json', **headers})
+            expected = self.flask_client.post(path, data=encoded, content_type='application/json', headers=headers)
+            
+            assert status == expected.status_code == 200
+            assert content == expected.data
+            assert json.loads(content) == {'result': 6, 'success': True}
+            assert response_headers.get('preference-applied') == expected.headers.get('Preference-Applied')
@@ -0,0 +1,66 @@
+"""
+Test cases for the API load generator.
+"""
+
+
+class TestLoadGenerator:
+    """Test suite for workload building, percentiles and load runs."""
+    
+    def test_percentile_nearest_rank(self):
+        """Test: Percentiles use the nearest-rank definition"""
+        from src.loadgen import percentile
+        
+        values = [float(value) for value in range(1, 101)]
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([7.0], 0.99) == 7.0
+        assert percentile([], 0.5) == 0.0
+    
+    def test_workload_mixes_styles_within_size_range(self):
+        """Test: Requests cover every delimiter form and carry correct expectations"""
+        import json
+        from src.loadgen import build_workload
+        from src.string_calculator import StringCalculator
+        
+        workload = build_workload(count=40, min_size=10, max_size=2000, seed=3)
+        bodies = [json.loads(item.body)['numbers'] for item in workload]
+        
+        assert any(body.startswith('//[*][%]\n') for body in bodies)
+        assert any(body.startswith('//[***]\n') for body in bodies)
+        assert any(body.startswith('//;\n') for body in bodies)
+        assert any(not body.startswith('//') for body in bodies)
+        for body, item in zip(bodies, workload):
+            assert len(body) <= 2000
+            assert item.expected == StringCalculator().add(body)
+    
+    def test_run_load_against_in_process_server(self):
+        """Test: A short run reports every request with no errors or mismatches"""
+        from src.loadgen import build_workload, run_load, serve_in_process
+        
+        workload = build_workload(count=10, max_size=500)
+        with serve_in_process() as url:
+            report = run_load(url, workload, concurrency=2, duration=10.0, max_requests=20)
+        
+        assert report.requests == 20
+        assert report.errors == {}
+        assert report.mismatches == 0
+        assert 0 < report.p50 <= report.p95 <= report.p99 <= report.max
+        assert report.throughput > 0
+    
+    def test_cache_hits_reported_and_salt_defeats_cache(self):
+        """Test: Repeated inputs show up as cache hits; salted requests are all parsed"""
+        from src.api import result_cache
+        from src.loadgen import build_workload, run_load, serve_in_process
+        
+        workload = build_workload(count=4, max_size=500, seed=5)
+        result_cache.clear()
+        with serve_in_process() as url:
+            repeated = run_load(url, workload, concurrency=1, duration=10.0, max_requests=12)
+            salted = run_load(url, workload, concurrency=1, duration=10.0, max_requests=12, salt=True)
+        
+        assert repeated.cache_hits == 8
+        assert repeated.cache_hit_ratio == 8 / 12
+        assert salted.cache_hits == 0
+        assert salted.mismatches == 0 and salted.errors == {}
+        assert 'cache_hit_ratio' in salted.as_dict()
@@ -0,0 +1,68 @@
+"""
+Test cases for the Prometheus-style metrics registry and calculator hooks.
+"""
+
+import pytest
+
+
+class TestMetrics:
+    """Test suite for metric rendering and StringCalculator instrumentation."""
+    
+    def setup_method(self):
+        """Set up a fresh service metrics registry before each test."""
+        from src.metrics import ServiceMetrics
+        self.metrics = ServiceMetrics()
+    
+    def test_counter_and_histogram_render_text_format(self):
+        """Test: Samples use cumulative buckets, _sum/_count and escaped labels"""
+        from src.metrics import MetricsRegistry
+        
+        registry = MetricsRegistry()
+        counter = registry.counter('demo_total', 'Demo counter.', ('kind',))
+        histogram = registry.histogram('demo_seconds', 'Demo histogram.', (0.1, 1.0))
+        counter.inc('a"b')
+        counter.inc('a"b', amount=2)
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        
+        lines = registry.render().splitlines()
+        assert '# TYPE demo_total counter' in lines
+        assert 'demo_total{kind="a\\"b"} 3' in lines
+        assert 'demo_seconds_bucket{le="0.1"} 2' in lines
+        assert 'demo_seconds_bucket{le="1"} 3' in lines
+        assert 'demo_seconds_bucket{le="+Inf"} 4' in lines
+        assert 'demo_seconds_sum 3.65' in lines
+        assert 'demo_seconds_count 4' in lines
+    
+    def test_duplicate_metric_names_rejected(self):
+        """Test: A registry refuses two metrics with the same name"""
+        with pytest.raises(ValueError):
+            self.metrics.registry.counter('calculator_requests_total', 'Again.')
+    
+    def test_calculator_records_phases_per_engine(self):
+        """Test: Instrumented adds report every phase and keep their results"""
+        from src.string_calculator import StringCalculator
+        
+        regex_calculator = StringCalculator(observer=self.metrics)
+        scan_calculator = StringCalculator(engine='scan', observer=self.metrics)
+        
+        assert regex_calculator.add("//[*][%]\n1*2%3*x") == 6
+        assert scan_calculator.add("1,2\n3") == 6
+        
+        for phase in ('split', 'parse', 'sum'):
+            assert self.metrics.phase_seconds.count(phase) == 1
+        assert self.metrics.phase_seconds.count('header') == 2
+        assert self.metrics.phase_seconds.count('delimiters') == 2
+        assert self.metrics.phase_seconds.count('scan') == 1
+        assert self.metrics.input_size.count() == 2
+    
+    def test_instrumentation_toggles_at_runtime(self):
+        """Test: Detaching the hook stops recording"""
+        from src.string_calculator import StringCalculator
+        
+        calculator = StringCalculator(observer=self.metrics)
+        calculator.add("1,2")
+        calculator.observer = None
+        calculator.add("1,2")
+        
+        assert self.metrics.input_size.count() == 1
@@ -0,0 +1,85 @@
+"""
+Test cases for the String Calculator API result cache.
+"""
+
+
+class TestResultCache:
+    """Test suite for ResultCache eviction and statistics."""
+    
+    def setup_method(self):
+        """Set up a cache with a controllable clock before each test."""
+        from src.result_cache import ResultCache
+        self.now = 0.0
+        self.cache = ResultCache(max_entries=3, ttl=10.0, max_bytes=10 ** 6, clock=lambda: self.now)
+    
+    def test_get_or_compute_hits_on_repeat(self):
+        """Test: Second lookup of the same input is served from the cache"""
+        calls = []
+        
+        def compute(numbers):
+            calls.append(numbers)
+            return 6
+        
+        assert self.cache.get_or_compute("1,2,3", compute) == (6, False)
+        assert self.cache.get_or_compute("1,2,3", compute) == (6, True)
+        assert calls == ["1,2,3"]
+        
+        stats = self.cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
+    
+    def test_ttl_expiry(self):
+        """Test: Entries expire after the TTL"""
+        key = self.cache.key_for("1,2")
+        self.cache.put(key, 3)
+        
+        self.now = 10.0
+        assert self.cache.get(key) == 3
+        self.now = 10.5
+        assert self.cache.get(key) is None
+        assert self.cache.stats()['entries'] == 0
+    
+    def test_lru_eviction_by_entries(self):
+        """Test: Least recently used entry is evicted at the entry limit"""
+        keys = [self.cache.key_for(str(i)) for i in range(4)]
+        for index, key in enumerate(keys[:3]):
+            self.cache.put(key, index)
+        self.cache.get(keys[0])
+        self.cache.put(keys[3], 3)
+        
+        assert self.cache.get(keys[1]) is None
+        assert self.cache.get(keys[0]) == 0
+        assert self.cache.stats()['evictions'] == 1
+    
+    def test_byte_cap(self):
+        """Test: Byte budget limits how many entries are kept"""
+        from src.result_cache import ResultCache
+        
+        cache = ResultCache(max_entries=100, ttl=None, max_bytes=400)
+        for i in range(10):
+            cache.put(cache.key_for(str(i)), i)
+        
+        stats = cache.stats()
+        assert stats['bytes'] <= 400
+        assert 0 < stats['entries'] < 10
+        assert cache.get(cache.key_for("9")) == 9
+    
+    def test_api_cache_headers_and_stats(self):
+        """Test: /api/add reports cache hits and /api/health exposes stats"""
+        import json
+        from src.api import app, result_cache
+        
+        client = app.test_client()
+        result_cache.clear()
+        
+        first = client.post('/api/add', json={'numbers': '//;\n1;2;3'})
+        second = client.post('/api/add', json={'numbers': '//;\n1;2;3'})
+        
+        assert first.headers['X-Cache'] == 'MISS'
+        assert second.headers['X-Cache'] == 'HIT'
+        assert json.loads(second.data) == json.loads(first.data)
+        
+        stats = json.loads(client.get('/api/health').data)['cache']
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
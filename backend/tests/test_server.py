@@ -0,0 +1,149 @@
+"""
+Test cases for the pre-fork production server launcher.
+"""
+
+import http.client
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason="pre-fork server requires os.fork")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    """Reserve and release an ephemeral port."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(port, deadline=10.0):
+    """Poll until the server accepts connections."""
+    end = time.monotonic() + deadline
+    while time.monotonic() < end:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise AssertionError(f"server on port {port} did not start")
+
+
+def slow_app(environ, start_response):
+    """WSGI app that sleeps on /slow to trigger the request timeout."""
+    if environ['PATH_INFO'] == '/slow':
+        time.sleep(5)
+    start_response('200 OK', [('Content-Type', 'text/plain'), ('Content-Length', '2')])
+    return [b'ok']
+
+
+def run_slow_server(port):
+    """Child process entry point running a one-worker server around slow_app."""
+    from src.server import PreforkServer
+    PreforkServer(slow_app, host='127.0.0.1', port=port, workers=1, timeout=0.5,
+                  graceful_timeout=2.0, warmup=None).run()
+
+
+class TestPreforkServer:
+    """Test suite for the production server launcher."""
+    
+    def test_warm_up_compiles_patterns_before_traffic(self):
+        """Test warm-up leaves every delimiter form's pattern compiled."""
+        from src.api import app, calculator
+        from src.server import WARMUP_INPUTS, warm_up
+        
+        calculator.pattern_cache.clear()
+        warm_up(app)
+        misses = calculator.pattern_cache.info().misses
+        
+        for sample in WARMUP_INPUTS:
+            calculator.add(sample)
+        assert calculator.pattern_cache.info().misses == misses
+    
+    def test_workers_keep_alive_restart_and_stop(self):
+        """Test keep-alive, graceful restart on SIGHUP and shutdown on SIGTERM."""
+        port = free_port()
+        process = subprocess.Popen(
+            [sys.executable, 'run_api.py', '--host', '127.0.0.1', '--port', str(port), '--workers', '2',
+             '--graceful-timeout', '5'],
+            cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            wait_for_server(port)
+            
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.request('POST', '/api/add', body='{"numbers": "//;\\n1;2"}',
+                               headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            assert response.status == 200
+            assert b'"result":3' in response.read()
+            first_socket = connection.sock
+            
+            connection.request('GET', '/api/health')
+            response = connection.getresponse()
+            assert response.status == 200
+            response.read()
+            assert connection.sock is first_socket
+            connection.close()
+            
+            process.send_signal(signal.SIGHUP)
+            time.sleep(1.0)
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.request('GET', '/api/health')
+            assert connection.getresponse().status == 200
+            connection.close()
+            
+            process.send_signal(signal.SIGTERM)
+            assert process.wait(timeout=10) == 0
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+    
+    def test_sessions_need_a_single_worker(self, monkeypatch):
+        """Test several workers are refused while sessions are enabled."""
+        from src.api import app
+        from src.server import PreforkServer, main
+        
+        monkeypatch.setitem(app.config, 'SESSIONS_ENABLED', True)
+        with pytest.raises(ValueError, match='single worker'):
+            PreforkServer(app, workers=2)
+        assert PreforkServer(app, workers=1).workers == 1
+        
+        monkeypatch.setitem(app.config, 'SESSIONS_ENABLED', False)
+        assert PreforkServer(app, workers=2).workers == 2
+        
+        with pytest.raises(SystemExit):
+            main(['--sessions', '--workers', '2'])
+    
+    def test_request_timeout_closes_connection(self):
+        """Test a request running past the timeout is aborted without a response."""
+        port = free_port()
+        context = multiprocessing.get_context('fork')
+        process = context.Process(target=run_slow_server, args=(port,))
+        process.start()
+        try:
+            wait_for_server(port)
+            
+            started = time.monotonic()
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.request('GET', '/slow')
+            with pytest.raises(http.client.RemoteDisconnected):
+                connection.getresponse()
+            assert time.monotonic() - started < 3
+            
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.request('GET', '/fast')
+            assert connection.getresponse().read() == b'ok'
+        finally:
+            os.kill(process.pid, signal.SIGTERM)
+            process.join(timeout=10)
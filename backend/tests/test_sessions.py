@@ -0,0 +1,115 @@
+"""
+Test cases for running-sum sessions.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+
+class TestSessionStore:
+    """Test suite for SessionStore sums, expiry and memory caps."""
+    
+    def setup_method(self):
+        """Set up a store with a controllable clock before each test."""
+        from src.sessions import SessionStore
+        self.now = 0.0
+        self.store = SessionStore(max_sessions=3, ttl=10.0, max_bytes=10 ** 6, clock=lambda: self.now)
+    
+    def test_appends_match_whole_input(self):
+        """Test: Any split into fragments gives the sum of the whole input"""
+        from src.string_calculator import StringCalculator
+        
+        calculator = StringCalculator()
+        rng = random.Random(5)
+        inputs = ["1,2\n3", "//;\n1;2;3", "//[***]\n10***20***x***30", "//[*][%]\n1*2%3*44%5", "//[ab][a]\n1ab2a3"]
+        for full in inputs:
+            header_end = full.index('\n') + 1 if full.startswith('//') else 0
+            for _ in range(20):
+                cuts = sorted(rng.sample(range(header_end, len(full) + 1), 3))
+                session = self.store.open(full[:cuts[0]])
+                for low, high in zip(cuts, cuts[1:] + [len(full)]):
+                    session = self.store.append(session.session_id, full[low:high])
+                    assert session.result() == calculator.add(full[:high]), f"Failed for: {full[:high]!r}"
+                self.store.close(session.session_id)
+    
+    def test_header_is_fixed_at_open(self):
+        """Test: The opening fragment decides the delimiters"""
+        session = self.store.open("//;\n1;2")
+        assert session.delimiters == [';']
+        assert self.store.append(session.session_id, ";3,4").result() == 3
+        
+        session = self.store.open("")
+        assert self.store.append(session.session_id, "//;\n1;2").result() == 0
+    
+    def test_idle_sessions_expire(self):
+        """Test: Sessions idle past the TTL are gone; used ones stay alive"""
+        from src.exceptions import SessionNotFoundError
+        
+        idle = self.store.open("1")
+        active = self.store.open("2")
+        self.now = 8.0
+        self.store.append(active.session_id, ",3")
+        self.now = 15.0
+        
+        assert self.store.get(active.session_id).result() == 5
+        with pytest.raises(SessionNotFoundError):
+            self.store.get(idle.session_id)
+        assert self.store.stats()['expired'] == 1
+    
+    def test_caps_evict_least_recently_used(self):
+        """Test: Session count and byte budget evict the oldest sessions"""
+        from src.exceptions import SessionNotFoundError
+        from src.sessions import SessionStore
+        
+        sessions = [self.store.open(str(i)) for i in range(4)]
+        with pytest.raises(SessionNotFoundError):
+            self.store.get(sessions[0].session_id)
+        assert self.store.stats()['sessions'] == 3
+        
+        store = SessionStore(max_bytes=SessionStore.SESSION_OVERHEAD * 2 + 100, clock=lambda: self.now)
+        first = store.open("1")
+        second = store.open("2")
+        store.append(second.session_id, "9" * 200)
+        with pytest.raises(SessionNotFoundError):
+            store.get(first.session_id)
+        assert store.stats()['bytes'] <= store.max_bytes
+    
+    def test_scans_run_outside_the_store_lock(self):
+        """Test: A session busy scanning does not block the rest of the store"""
+        first = self.store.open("1")
+        second = self.store.open("2")
+        
+        first.lock.acquire()
+        worker = threading.Thread(target=self.store.append, args=(first.session_id, ",3"))
+        worker.start()
+        try:
+            time.sleep(0.05)
+            assert self.store.append(second.session_id, ",5").result() == 7
+            assert self.store.stats()['sessions'] == 2
+        finally:
+            first.lock.release()
+            worker.join()
+        assert first.result() == 4
+    
+    def test_fragment_over_work_limit_closes_session(self):
+        """Test: Every fragment gets a fresh budget; running out ends the session"""
+        from src.exceptions import LimitExceededError, SessionNotFoundError
+        from src.sessions import SessionStore
+        from src.string_calculator import StringCalculator
+        
+        store = SessionStore(calculator=StringCalculator(max_numbers=3), clock=lambda: self.now)
+        session = store.open("1,2,")
+        for _ in range(3):
+            session = store.append(session.session_id, "3,4,")
+        assert session.result() == 24
+        
+        with pytest.raises(LimitExceededError):
+            store.append(session.session_id, "1,1,1,1,")
+        with pytest.raises(SessionNotFoundError):
+            store.get(session.session_id)
+        assert store.stats()['sessions'] == 0 and store.stats()['bytes'] == 0
+        with pytest.raises(LimitExceededError):
+            store.open("1,1,1,1,")
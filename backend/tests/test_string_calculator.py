@@ -156,3 +156,927 @@ class TestStringCalculator:
         assert result == 100, "Complex multiple delimiters should work"
 
 
+class TestScanningEngine:
+    """Test suite for the single-pass scanning engine."""
+    
+    def setup_method(self):
+        """Set up one calculator per engine before each test."""
+        from src.string_calculator import StringCalculator
+        # Negatives are allowed so signed tokens exercise the parsers too
+        self.regex_calculator = StringCalculator(engine='regex', allow_negatives=True)
+        self.scan_calculator = StringCalculator(engine='scan', allow_negatives=True)
+    
+    # ===== STEP 5: SCANNING ENGINE =====
+    def test_scan_engine_matches_regex_engine(self):
+        """Test: Scan engine returns the same results as the regex engine"""
+        inputs = [
+            "", "1", "1,2,3", "1\n2,3", "1,,2", ",1,2,", " 1 , 2 ", "1,a,2",
+            "//;\n1;2;3", "//*\n1*2*3", "//[***]\n1***2***3", "//[*][%]\n1*2%3",
+            "//[**][%%]\n1**2%%3", "//[sep][::][#]\n10sep20::30#40",
+            "//[**]\n1***2", "//[*][**]\n1**2", "//[a1][a]\n5a12", "+1,-2,1_000",
+        ]
+        for input_str in inputs:
+            expected = self.regex_calculator.add(input_str)
+            assert self.scan_calculator.add(input_str) == expected, f"Failed for: {input_str!r}"
+    
+    def test_scan_engine_window_edges(self):
+        """Test: Window boundaries never change the result"""
+        from src.scanner import scan_sum
+        
+        cases = [
+            ("1***2***3", ['**']),
+            ("5a12a1a3", ['a1', 'a']),
+            ("1**2*3***4", ['*', '**']),
+            ("1 , 2 ,,x, 3", [',']),
+        ]
+        for text, delimiters in cases:
+            expected = self.regex_calculator._parse_numbers_with_delimiters(text, delimiters)
+            for window_size in (1, 2, 3, 64):
+                result = scan_sum(text, delimiters, window_size=window_size)
+                assert result == sum(expected), f"Failed for: {text!r} (window {window_size})"
+    
+    def test_scan_engine_large_input(self):
+        """Test: Scan engine sums inputs spanning many windows"""
+        large_input = "//[***]\n" + "***".join(str(i) for i in range(100000))
+        assert self.scan_calculator.add(large_input) == sum(range(100000))
+    
+    def test_unknown_engine_rejected(self):
+        """Test: Unknown engine names raise ValueError"""
+        from src.string_calculator import StringCalculator
+        
+        with pytest.raises(ValueError):
+            StringCalculator(engine='fast')
+
+
+class TestPatternCache:
+    """Test suite for the compiled delimiter-pattern cache."""
+    
+    def setup_method(self):
+        """Set up a small private cache before each test."""
+        from src.pattern_cache import PatternCache
+        from src.string_calculator import StringCalculator
+        self.cache = PatternCache(maxsize=2)
+        self.calculator = StringCalculator(pattern_cache=self.cache)
+    
+    # ===== STEP 6: PATTERN CACHE =====
+    def test_repeated_delimiter_sets_hit_cache(self):
+        """Test: Reusing a delimiter header compiles its pattern only once"""
+        assert self.calculator.add("//[***]\n1***2***3") == 6
+        assert self.calculator.add("//[***]\n4***5") == 9
+        
+        info = self.cache.info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert info.currsize == 1
+    
+    def test_delimiter_order_is_part_of_key(self):
+        """Test: Same delimiters in a different order get their own pattern"""
+        assert self.cache.get(['*', '**']) is not self.cache.get(['**', '*'])
+        assert self.cache.get(['*', '**']).split("1**2") == ['1', '', '2']
+        assert self.cache.get(['**', '*']).split("1**2") == ['1', '2']
+    
+    def test_lru_eviction(self):
+        """Test: Least recently used pattern is evicted at capacity"""
+        first = self.cache.get(['a'])
+        self.cache.get(['b'])
+        self.cache.get(['a'])
+        self.cache.get(['c'])
+        
+        assert len(self.cache) == 2
+        assert self.cache.get(['a']) is first
+        assert self.cache.info().misses == 3
+    
+    def test_resize_and_clear(self):
+        """Test: Cache can be resized and cleared"""
+        self.cache.get(['a'])
+        self.cache.get(['b'])
+        self.cache.maxsize = 1
+        assert len(self.cache) == 1
+        
+        self.cache.clear()
+        assert self.cache.info() == (0, 0, 1, 0)
+        
+        with pytest.raises(ValueError):
+            self.cache.maxsize = 0
+    
+    def test_concurrent_access(self):
+        """Test: Cache stays consistent under concurrent lookups"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        delimiter_sets = [['*'], ['%'], ['*'], ['%']] * 50
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            patterns = list(executor.map(self.cache.get, delimiter_sets))
+        
+        assert all(pattern.pattern in (r'\*', '%') for pattern in patterns)
+        info = self.cache.info()
+        assert info.hits + info.misses == len(delimiter_sets)
+        assert info.currsize == 2
+
+
+class TestStreamingAdd:
+    """Test suite for streaming add over iterators and file-like objects."""
+    
+    def setup_method(self):
+        """Set up fresh calculator instance before each test."""
+        from src.string_calculator import StringCalculator
+        self.calculator = StringCalculator()
+    
+    # ===== STEP 7: STREAMING ADD =====
+    def test_add_iter_matches_add(self):
+        """Test: Every way of chunking an input gives the same sum as add"""
+        inputs = [
+            "", "1", "1,2,3", "1\n2,3", " 1 , 2 ", "1,a,2", "//;\n1;2;3",
+            "//[***]\n1***2***3", "//[*][%]\n1*2%3", "//[**]\n1***2", "//[a1][a]\n5a12",
+        ]
+        for input_str in inputs:
+            expected = self.calculator.add(input_str)
+            for size in (1, 2, 3, 5):
+                chunks = [input_str[i:i + size] for i in range(0, len(input_str), size)]
+                assert self.calculator.add_iter(chunks) == expected, f"Failed for: {input_str!r} ({size})"
+    
+    def test_numbers_and_delimiters_straddle_chunks(self):
+        """Test: Numbers and multi-char delimiters split across chunks"""
+        assert self.calculator.add_iter(["//[***]\n12", "3*", "**4", "5***", "6"]) == 174
+        assert self.calculator.add_iter(["1", "0,", "2", "0"]) == 30
+    
+    def test_add_stream_text_and_binary(self):
+        """Test: add_stream reads text and binary file objects"""
+        import io
+        
+        data = "//[*][%]\n" + "*".join(str(i) for i in range(1000)) + "%7"
+        expected = sum(range(1000)) + 7
+        assert self.calculator.add_stream(io.StringIO(data), chunk_size=7) == expected
+        assert self.calculator.add_stream(io.BytesIO(data.encode()), chunk_size=7) == expected
+    
+    def test_add_stream_splits_multibyte_characters(self):
+        """Test: Multi-byte characters split across reads are decoded correctly"""
+        import io
+        
+        data = "//[§]\n1§2§3".encode('utf-8')
+        assert self.calculator.add_stream(io.BytesIO(data), chunk_size=1) == 6
+    
+    def test_short_header_only_stream(self):
+        """Test: Streams shorter than the header lookahead still resolve headers"""
+        assert self.calculator.add_iter(["//", ";\n1;", "2"]) == 3
+        assert self.calculator.add_iter(["/"]) == 0
+        assert self.calculator.add_iter([]) == 0
+
+
+class TestMemoryMappedAdd:
+    """Test suite for summing files through a memory map."""
+    
+    def setup_method(self):
+        """Set up fresh calculator instance before each test."""
+        from src.string_calculator import StringCalculator
+        self.calculator = StringCalculator()
+    
+    # ===== STEP 8: MEMORY-MAPPED FILES =====
+    def test_add_file_matches_add(self, tmp_path):
+        """Test: add_file honors default and custom delimiter headers"""
+        inputs = [
+            "1,2,3", "1\n2,3", " 1 , 2 ", "1,,x,2", "//;\n1;2;3", "//[***]\n1***2***3",
+            "//[*][%]\n1*2%3", "//[**]\n1***2", "//§\n1§2§3", "//[é][§]\n1é2§3", "1,\xa02 ,٣",
+        ]
+        for index, input_str in enumerate(inputs):
+            path = tmp_path / f"input_{index}.txt"
+            path.write_bytes(input_str.encode('utf-8'))
+            assert self.calculator.add_file(path) == self.calculator.add(input_str), f"Failed for: {input_str!r}"
+    
+    def test_add_file_empty_file(self, tmp_path):
+        """Test: Empty file returns 0"""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        assert self.calculator.add_file(path) == 0
+    
+    def test_add_file_large_input(self, tmp_path):
+        """Test: Files spanning many scan windows are summed completely"""
+        path = tmp_path / "large.txt"
+        path.write_text("//[***]\n" + "***".join(str(i) for i in range(200000)), encoding='utf-8')
+        assert self.calculator.add_file(str(path)) == sum(range(200000))
+    
+    def test_add_file_skips_undecodable_tokens(self, tmp_path):
+        """Test: Tokens that are not valid UTF-8 are skipped like invalid numbers"""
+        path = tmp_path / "binary.txt"
+        path.write_bytes(b"1,\xff\xfe,2")
+        assert self.calculator.add_file(path) == 3
+
+
+class TestParallelAdd:
+    """Test suite for parallel chunked summation."""
+    
+    # ===== STEP 9: PARALLEL SUMMATION =====
+    def test_aligned_spans_sum_to_serial_result(self):
+        """Test: Summing aligned spans separately equals one serial scan"""
+        from src.scanner import aligned_spans, scan_sum
+        
+        cases = [
+            ("1,2,3,4,5,6,7,8,9", [',']),
+            ("1***2***3***4", ['**']),
+            ("5a12a1a3a1a7", ['a1', 'a']),
+            ("1**2*3***4**5", ['*', '**']),
+        ]
+        for text, delimiters in cases:
+            expected = scan_sum(text, delimiters)
+            for count in (2, 3, 5):
+                spans = aligned_spans(text, delimiters, 0, len(text), count)
+                assert len(spans) <= count
+                assert sum(scan_sum(text[low:high], delimiters) for low, high in spans) == expected
+    
+    def test_parallel_add_matches_serial(self):
+        """Test: Parallel mode returns the serial result"""
+        from src.string_calculator import StringCalculator
+        
+        large_input = "//[*][%%]\n" + "*".join(str(i) for i in range(20000)) + "%%5"
+        parallel = StringCalculator(workers=2, parallel_threshold=1)
+        assert parallel.add(large_input) == StringCalculator().add(large_input)
+    
+    def test_parallel_add_file(self, tmp_path):
+        """Test: Parallel mode sums memory-mapped files"""
+        from src.string_calculator import StringCalculator
+        
+        path = tmp_path / "large.txt"
+        path.write_text("//[***]\n" + "***".join(str(i) for i in range(20000)), encoding='utf-8')
+        parallel = StringCalculator(workers=2, parallel_threshold=1)
+        assert parallel.add_file(path) == sum(range(20000))
+    
+    def test_small_inputs_stay_serial(self):
+        """Test: Inputs below the threshold never start a process pool"""
+        from unittest.mock import patch
+        from src.string_calculator import StringCalculator
+        
+        calculator = StringCalculator(workers=4)
+        with patch('src.string_calculator.parallel_sum') as parallel_sum:
+            assert calculator.add("1,2,3") == 6
+        parallel_sum.assert_not_called()
+    
+    def test_worker_setting(self):
+        """Test: Worker count defaults to serial and None means one per CPU"""
+        import os
+        from src.string_calculator import StringCalculator
+        
+        assert StringCalculator().workers == 1
+        assert StringCalculator(workers=None).workers == (os.cpu_count() or 1)
+        assert StringCalculator(workers=0).workers == 1
+
+
+class TestNumpyEngine:
+    """Test suite for the NumPy-vectorized parsing backend."""
+    
+    def setup_method(self):
+        """Set up one calculator per engine before each test."""
+        from src.string_calculator import StringCalculator
+        self.regex_calculator = StringCalculator(engine='regex', allow_negatives=True)
+        self.numpy_calculator = StringCalculator(engine='numpy', allow_negatives=True)
+    
+    # ===== STEP 10: NUMPY BACKEND =====
+    def test_numpy_engine_matches_regex_engine(self):
+        """Test: Vectorized sums agree on whitespace, empty and invalid fields"""
+        pytest.importorskip('numpy')
+        
+        inputs = [
+            "", "1", "1,2,3", "1\n2,3", "1,,2", ",1,2,", " 1 , 2 ", "1 2,3", "1,a,2",
+            "+1,-2,1_000", "007,\t8\x0b", "\x1c5,\xa06,٣", "//;\n1;2;3", "//*\n1*2*3",
+            "//[*][%]\n1*2%3", "12345678901234567890123,1", "999999999999999999," * 50,
+        ]
+        for input_str in inputs:
+            expected = self.regex_calculator.add(input_str)
+            assert self.numpy_calculator.add(input_str) == expected, f"Failed for: {input_str!r}"
+    
+    def test_numpy_window_edges(self):
+        """Test: Window boundaries never change the vectorized result"""
+        pytest.importorskip('numpy')
+        from src.vectorized import numpy_sum
+        
+        text = "1, 22 ,x,333,,-4,55555"
+        expected = sum(self.regex_calculator._parse_numbers_with_delimiters(text, [',']))
+        for window_size in (1, 2, 5, 64):
+            assert numpy_sum(text, [','], window_size=window_size) == expected
+            assert numpy_sum(text.encode(), [b','], window_size=window_size) == expected
+    
+    def test_numpy_engine_large_input(self, tmp_path):
+        """Test: Vectorized sums of large strings and mapped files"""
+        pytest.importorskip('numpy')
+        
+        large_input = "\n".join(str(i) for i in range(200000))
+        assert self.numpy_calculator.add(large_input) == sum(range(200000))
+        
+        path = tmp_path / "large.txt"
+        path.write_text(large_input, encoding='utf-8')
+        assert self.numpy_calculator.add_file(path) == sum(range(200000))
+    
+    def test_numpy_engine_falls_back(self, monkeypatch):
+        """Test: Multi-char delimiters or missing NumPy fall back to scanning"""
+        from src import vectorized
+        
+        assert not vectorized.is_supported(['***'])
+        assert self.numpy_calculator.add("//[***]\n1***2***3") == 6
+        
+        monkeypatch.setattr(vectorized, 'np', None)
+        assert not vectorized.is_supported([','])
+        assert self.numpy_calculator.add("1,2,3") == 6
+    
+    def test_numpy_engine_digit_delimiters(self, tmp_path):
+        """Test: Digit delimiters are left to the scanning engine, whatever the engine or size"""
+        from src.string_calculator import StringCalculator
+        from src import vectorized
+        
+        assert not vectorized.is_supported(['1'])
+        inputs = {'//1\n' + '213' * 2000: 63973, '//[0]\n' + '1020304,' * 1000: 5001}
+        for input_str, expected in inputs.items():
+            assert len(input_str) > 4096
+            assert self.regex_calculator.add(input_str) == expected
+            assert self.numpy_calculator.add(input_str) == expected
+            assert StringCalculator().add(input_str) == expected
+            assert StringCalculator(numeric='int64').add(input_str) == expected
+            
+            path = tmp_path / "digits.txt"
+            path.write_text(input_str, encoding='utf-8')
+            assert self.numpy_calculator.add_file(path) == expected
+
+
+class RecordingObserver:
+    """Observer that records every callback it receives."""
+    
+    def __init__(self):
+        self.events = []
+    
+    def header_parsed(self, input_size, header_length, seconds):
+        self.events.append(('header_parsed', input_size, header_length))
+    
+    def delimiters_resolved(self, delimiters, seconds):
+        self.events.append(('delimiters_resolved', delimiters))
+    
+    def parts_split(self, parts, seconds):
+        self.events.append(('parts_split', parts))
+    
+    def numbers_parsed(self, numbers, rejected, seconds):
+        self.events.append(('numbers_parsed', numbers, rejected))
+    
+    def sum_finished(self, total, seconds, engine):
+        self.events.append(('sum_finished', total, engine))
+
+
+class TestObservers:
+    """Test suite for pluggable profiling hooks."""
+    
+    def setup_method(self):
+        """Set up a recording observer before each test."""
+        self.observer = RecordingObserver()
+    
+    # ===== STEP 11: PROFILING HOOKS =====
+    def test_observer_receives_every_phase(self):
+        """Test: Each phase of add() is reported in order with its counts"""
+        from src.string_calculator import StringCalculator
+        
+        calculator = StringCalculator(observer=self.observer)
+        
+        assert calculator.add("//[*][%]\n1*2%x*3") == 6
+        assert self.observer.events == [
+            ('header_parsed', 16, 9),
+            ('delimiters_resolved', ['*', '%']),
+            ('parts_split', 4),
+            ('numbers_parsed', 4, 1),
+            ('sum_finished', 6, 'regex'),
+        ]
+    
+    def test_fused_engines_report_sum_only(self):
+        """Test: Engines without separate split/parse phases name themselves"""
+        from src.string_calculator import StringCalculator
+        
+        calculator = StringCalculator(engine='scan', observer=self.observer)
+        
+        assert calculator.add("1,2\n3") == 6
+        assert [event[0] for event in self.observer.events] == [
+            'header_parsed', 'delimiters_resolved', 'sum_finished'
+        ]
+        assert self.observer.events[-1] == ('sum_finished', 6, 'scan')
+    
+    def test_observed_results_match_unobserved(self):
+        """Test: Attaching an observer never changes a result"""
+        from src.observers import CalculatorObserver, MultiObserver
+        from src.string_calculator import StringCalculator
+        
+        plain = StringCalculator()
+        observed = StringCalculator(observer=MultiObserver(CalculatorObserver(), self.observer))
+        
+        inputs = ["", "1", "1,,2", " 1 , x ", "\x1c5,6", "//;\n1;2", "//[\n]\n1[2", "//[***]\n1***2"]
+        for input_str in inputs:
+            assert observed.add(input_str) == plain.add(input_str), f"Failed for: {input_str!r}"
+        assert len([event for event in self.observer.events if event[0] == 'sum_finished']) == len(inputs) - 1
+
+
+class TestNumericModes:
+    """Test suite for explicit numeric modes."""
+    
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        from src.string_calculator import StringCalculator
+        self.StringCalculator = StringCalculator
+    
+    # ===== STEP 12: NUMERIC MODES =====
+    def test_int64_mode_matches_bigint_in_range(self, tmp_path):
+        """Test: int64 mode picks a fast engine and agrees with the default"""
+        from src.workloads import generate_input
+        
+        fast = self.StringCalculator(numeric='int64', allow_negatives=True)
+        plain = self.StringCalculator(allow_negatives=True)
+        assert fast.engine == 'auto'
+        
+        inputs = ["", "1,2", " 1 , x ", "-5,3", "//;\n1;2", "//[***]\n1***2", generate_input('default', 200_000)]
+        for input_str in inputs:
+            assert fast.add(input_str) == plain.add(input_str), f"Failed for: {input_str[:20]!r}"
+        
+        path = tmp_path / "numbers.txt"
+        path.write_text(inputs[-1], encoding='utf-8')
+        assert fast.add_file(path) == plain.add(inputs[-1])
+    
+    def test_int64_overflow_raises(self, tmp_path):
+        """Test: Tokens and sums outside the signed 64-bit range raise a clear error"""
+        from src.exceptions import NegativeNumberError, NumericOverflowError
+        from src.numeric import INT64_MAX, INT64_MIN
+        
+        calculator = self.StringCalculator(numeric='int64', allow_negatives=True)
+        assert calculator.add(f"{INT64_MAX - 1},1") == INT64_MAX
+        assert calculator.add(f"{INT64_MIN + 1},-1") == INT64_MIN
+        assert calculator.add(f"{INT64_MAX},{INT64_MIN}") == -1
+        
+        with pytest.raises(NumericOverflowError, match="overflows the int64 numeric mode") as excinfo:
+            calculator.add(f"{INT64_MAX},1")
+        assert excinfo.value.total == INT64_MAX + 1
+        # Tokens outside the range are rejected even when the total would fit
+        big = "99999999999999999999999,-99999999999999999999990"
+        engines = [self.StringCalculator(numeric='int64', allow_negatives=True, engine=engine)
+                   for engine in ('regex', 'scan', 'numpy')]
+        for engine_calculator in engines:
+            with pytest.raises(NumericOverflowError, match="sum of negative numbers"):
+                engine_calculator.add(big)
+            with pytest.raises(NumericOverflowError, match="sum of positive numbers"):
+                engine_calculator.add(f"{INT64_MAX + 1},-1")
+            with pytest.raises(NumericOverflowError, match="sum of positive numbers"):
+                engine_calculator.add(f"{INT64_MAX},{INT64_MAX},-{INT64_MAX}")
+        with pytest.raises(NumericOverflowError):
+            calculator.add_iter(["99999999999999999999", "999,-99999999999999999999990"])
+        # Without allow_negatives a negative token is reported as such first
+        with pytest.raises(NegativeNumberError):
+            self.StringCalculator(numeric='int64').add(big)
+        with pytest.raises(NumericOverflowError):
+            calculator.add_iter([f"{INT64_MAX}", ",1"])
+        
+        path = tmp_path / "numbers.txt"
+        path.write_text(f"{INT64_MIN},-1", encoding='utf-8')
+        with pytest.raises(NumericOverflowError):
+            calculator.add_file(path)
+        
+        # The default mode keeps arbitrary precision
+        assert self.StringCalculator().add(f"{INT64_MAX},1") == INT64_MAX + 1
+    
+    def test_decimal_and_float_modes(self):
+        """Test: Decimal and float modes read fractional tokens"""
+        from decimal import Decimal
+        
+        decimal_calculator = self.StringCalculator(numeric='decimal')
+        assert decimal_calculator.add("0.1,0.2\n3") == Decimal('3.3')
+        assert decimal_calculator.add("//[;;]\n1.5;;2e1;;x;;nan") == Decimal('21.5')
+        assert decimal_calculator.add_iter(["1.2", "5,0.7"]) == Decimal('1.95')
+        
+        float_calculator = self.StringCalculator(numeric='float')
+        assert float_calculator.add("1.5, 2.25 ,inf,x") == 3.75
+        assert isinstance(float_calculator.add("1,2"), float)
+    
+    def test_fraction_policy(self):
+        """Test: Integer modes skip, truncate or round non-integral tokens"""
+        assert self.StringCalculator().add("1.5,2.5,3") == 3
+        assert self.StringCalculator(fraction_policy='truncate', allow_negatives=True).add("1.9,-2.5,3") == 2
+        assert self.StringCalculator(fraction_policy='round').add("1.5,2.5,3,1e2") == 107
+        assert self.StringCalculator(numeric='int64', fraction_policy='round').add("0.5,1.5") == 2
+    
+    def test_invalid_numeric_settings(self):
+        """Test: Unknown numeric modes and fraction policies are rejected"""
+        with pytest.raises(ValueError, match="Unknown numeric mode"):
+            self.StringCalculator(numeric='int32')
+        with pytest.raises(ValueError, match="Unknown fraction policy"):
+            self.StringCalculator(fraction_policy='ceil')
+
+
+class TestNegativeNumbers:
+    """Test suite for negative number rejection."""
+    
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        from src.string_calculator import StringCalculator
+        self.StringCalculator = StringCalculator
+    
+    # ===== STEP 13: NEGATIVE NUMBERS =====
+    def test_every_engine_reports_all_negatives(self, tmp_path):
+        """Test: Each engine collects every negative number in input order"""
+        from src.exceptions import NegativeNumberError
+        
+        input_str = "//[;][%%]\n1;-2%%3;x; -40 ;-5"
+        path = tmp_path / "numbers.txt"
+        path.write_text(input_str, encoding='utf-8')
+        
+        for engine in self.StringCalculator.ENGINES:
+            calculator = self.StringCalculator(engine=engine)
+            for add in (calculator.add, lambda text: calculator.add_iter([text[:12], text[12:]])):
+                with pytest.raises(NegativeNumberError, match="negative numbers not allowed: -2, -40, -5$") as excinfo:
+                    add(input_str)
+                assert excinfo.value.negatives == [-2, -40, -5]
+                assert excinfo.value.count == 3
+            with pytest.raises(NegativeNumberError):
+                calculator.add_file(path)
+        
+        with pytest.raises(NegativeNumberError, match="-1, -3"):
+            self.StringCalculator(engine='numpy').add("-1\n2,-3")
+        with pytest.raises(NegativeNumberError, match="-2"):
+            self.StringCalculator(observer=RecordingObserver()).add("1,-2")
+    
+    def test_report_limit(self):
+        """Test: Only the first negatives are listed, with the total count"""
+        from src.exceptions import NegativeNumberError
+        
+        calculator = self.StringCalculator(engine='scan', negative_report_limit=3)
+        with pytest.raises(NegativeNumberError) as excinfo:
+            calculator.add(",".join(str(-i) for i in range(1, 100001)))
+        
+        assert excinfo.value.negatives == [-1, -2, -3]
+        assert excinfo.value.count == 100000
+        assert str(excinfo.value) == "negative numbers not allowed: -1, -2, -3 (and 99997 more)"
+    
+    def test_parallel_workers_merge_negatives(self):
+        """Test: Negatives found in worker processes are merged in order"""
+        from src.exceptions import NegativeNumberError
+        
+        large_input = ",".join(str(i) for i in range(20000)) + ",-7," + ",".join(str(i) for i in range(20000)) + ",-8"
+        parallel = self.StringCalculator(workers=2, parallel_threshold=1, negative_report_limit=10)
+        with pytest.raises(NegativeNumberError) as excinfo:
+            parallel.add(large_input)
+        assert excinfo.value.negatives == [-7, -8]
+    
+    def test_allow_negatives(self):
+        """Test: Negatives are summed when allowed, and minus signs alone are not negatives"""
+        assert self.StringCalculator(allow_negatives=True).add("1,-2,3") == 2
+        assert self.StringCalculator().add("1-2,-,3") == 3
+        assert self.StringCalculator(numeric='decimal', allow_negatives=True).add("1.5,-0.5") == 1
+
+
+class TestStrictMode:
+    """Test suite for strict parsing with located errors."""
+    
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        from src.string_calculator import StringCalculator
+        self.strict_calculator = StringCalculator(strict=True)
+    
+    # ===== STEP 14: STRICT MODE =====
+    def test_invalid_tokens_are_located(self, tmp_path):
+        """Test: Strict mode reports byte offset, line and column of each invalid token"""
+        from src.exceptions import InvalidTokenError
+        from src.validation import TokenError
+        
+        with pytest.raises(InvalidTokenError) as excinfo:
+            self.strict_calculator.add("1,2\nx,4\n5 ,bad")
+        assert excinfo.value.errors == [TokenError('x', 4, 2, 1), TokenError('bad', 11, 3, 4)]
+        assert str(excinfo.value) == ("invalid tokens: 'x' at line 2, column 1 (byte 4); "
+                                      "'bad' at line 3, column 4 (byte 11)")
+        
+        # Offsets count UTF-8 bytes, columns count characters, both from the start of the input
+        input_str = "//[é]\n1é2éx"
+        expected = [TokenError('x', 13, 2, 5)]
+        path = tmp_path / "numbers.txt"
+        path.write_text(input_str, encoding='utf-8')
+        readers = [
+            self.strict_calculator.add,
+            lambda text: self.strict_calculator.add_iter(list(text)),
+            lambda text: self.strict_calculator.add_file(path),
+        ]
+        for read in readers:
+            with pytest.raises(InvalidTokenError) as excinfo:
+                read(input_str)
+            assert excinfo.value.errors == expected
+    
+    def test_positions_across_windows_and_chunks(self):
+        """Test: Window and chunk boundaries never shift reported positions"""
+        from src.exceptions import InvalidTokenError
+        from src.scanner import scan_sum
+        from src.validation import InvalidTokenCollector
+        
+        text = "10**x**3*\n*4**\n**y"
+        for window_size in (1, 3, 64):
+            invalid = InvalidTokenCollector()
+            assert scan_sum(text, ['**', '*'], window_size=window_size, invalid=invalid) == 17
+            assert [(error.token, error.line, error.column) for error in invalid.errors] == [
+                ('x', 1, 5), ('\n', 1, 10), ('\n', 2, 5), ('y', 3, 3)
+            ]
+        
+        for size in (1, 2, 5):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            with pytest.raises(InvalidTokenError) as excinfo:
+                self.strict_calculator.add_iter(["//[**][*]\n"] + chunks)
+            assert [(error.line, error.column) for error in excinfo.value.errors] == [
+                (2, 5), (2, 10), (3, 5), (4, 3)
+            ]
+    
+    def test_report_limit_and_valid_input(self):
+        """Test: Only the first invalid tokens are located; clean input passes"""
+        from src.exceptions import InvalidTokenError
+        from src.string_calculator import StringCalculator
+        
+        calculator = StringCalculator(strict=True, invalid_report_limit=2)
+        with pytest.raises(InvalidTokenError, match=r"\(and 3 more\)$") as excinfo:
+            calculator.add("a,b,1,c,d,e")
+        assert [error.token for error in excinfo.value.errors] == ['a', 'b']
+        assert excinfo.value.count == 5
+        
+        assert self.strict_calculator.add("1, 2 ,+3,1_000,٣") == 1009
+    
+    def test_empty_token_after_final_delimiter(self):
+        """Test: A trailing delimiter is reported however the input is windowed or chunked"""
+        from src.exceptions import InvalidTokenError
+        from src.scanner import scan_sum
+        from src.validation import InvalidTokenCollector
+        
+        for window_size in (1, 2, 64):
+            invalid = InvalidTokenCollector()
+            assert scan_sum("1,2,", [','], window_size=window_size, invalid=invalid) == 3
+            assert [(error.token, error.offset) for error in invalid.errors] == [('', 4)]
+            assert scan_sum("1,2,", [','], window_size=window_size) == 3
+        
+        long_input = '11' + ',1' * 32767 + ','
+        readers = [
+            lambda text: self.strict_calculator.add(text),
+            lambda text: self.strict_calculator.add_iter([text]),
+            lambda text: self.strict_calculator.add_iter(list(text)),
+            lambda text: self.strict_calculator.add_iter([text[:-1], text[-1:]]),
+        ]
+        for input_str in ("1,2,", "//[**]\n1**2**", long_input):
+            for read in readers:
+                with pytest.raises(InvalidTokenError) as excinfo:
+                    read(input_str)
+                assert [(error.token, error.offset) for error in excinfo.value.errors] == [('', len(input_str.encode()))]
+        
+        assert self.strict_calculator.add_iter(["1,", "2"]) == 3
+        assert self.strict_calculator.add_iter([]) == 0
+    
+    def test_strict_add_iter_matches_add(self):
+        """Test: Strict results and reported tokens never depend on where the input is cut"""
+        from src.exceptions import InvalidTokenError
+        
+        def outcome(read):
+            try:
+                return read()
+            except InvalidTokenError as e:
+                return e.errors
+        
+        inputs = [
+            "1,,2", ",1", "1,2,", ",,", "1,\n,2", "1, x,,3", "//;\n1;;2;", "//[**]\n1****2**",
+            "//[*][%]\n1*%2%", "//[ab][a]\n1aab2a",
+        ]
+        for input_str in inputs:
+            expected = outcome(lambda: self.strict_calculator.add(input_str))
+            for first in range(1, len(input_str)):
+                for second in range(first, len(input_str) + 1):
+                    chunks = [input_str[:first], input_str[first:second], input_str[second:]]
+                    assert outcome(lambda: self.strict_calculator.add_iter(chunks)) == expected, chunks
+                    encoded = [chunk.encode() for chunk in chunks]
+                    assert outcome(lambda: self.strict_calculator.add_iter(encoded)) == expected, chunks
+        with pytest.raises(InvalidTokenError):
+            self.strict_calculator.add("1,,2")
+    
+    def test_lenient_parsing_matches_int(self):
+        """Test: Shape-based token checks agree with strip() and int() without raising"""
+        from src.scanner import integer_value
+        
+        tokens = ["1", " 2 ", "+3", "-4", "1_000", "٣", "\x1c5", "", " ", "x", "1 2", "1__0",
+                  "_1", "1_", "1.5", "++1", "0x10", "1e3", b" 7", b"\xff", "9" * 5000]
+        for token in tokens:
+            text = token.decode('utf-8', errors='replace') if isinstance(token, bytes) else token
+            try:
+                expected = int(text.strip())
+            except ValueError:
+                expected = None
+            assert integer_value(token) == expected, f"Failed for: {token!r}"
+
+
+class TestNumberRules:
+    """Test suite for configurable number rules."""
+    
+    def setup_method(self):
+        """Set up the kata rule set before each test."""
+        from src.rules import NumberRules
+        self.kata_rules = NumberRules(max_value=1000)
+    
+    # ===== STEP 15: NUMBER RULES =====
+    def test_numbers_above_limit_are_ignored(self, tmp_path):
+        """Test: Numbers bigger than 1000 are ignored by every engine and reader"""
+        from src.string_calculator import StringCalculator
+        
+        input_str = "//[;]\n" + ";".join(["2", "1001", "1000", "+7", "99999999999999999999", "x"] * 2000)
+        path = tmp_path / "numbers.txt"
+        path.write_text(input_str, encoding='utf-8')
+        for engine in StringCalculator.ENGINES:
+            calculator = StringCalculator(engine=engine, rules=self.kata_rules)
+            assert calculator.add("2,1001") == 2, f"Failed for engine: {engine}"
+            assert calculator.add(input_str) == 2018000, f"Failed for engine: {engine}"
+            assert calculator.add_iter([input_str[:9], input_str[9:]]) == 2018000
+            assert calculator.add_file(path) == 2018000
+    
+    def test_min_value_ignores_negatives(self):
+        """Test: Numbers below min_value are ignored, so they are not rejected as negatives"""
+        from src.exceptions import NegativeNumberError
+        from src.rules import NumberRules
+        from src.string_calculator import StringCalculator
+        
+        assert StringCalculator(rules=NumberRules(min_value=0)).add("-5,3,-2") == 3
+        assert StringCalculator(rules=NumberRules(min_value=10, max_value=20)).add("5,10,20,25") == 30
+        with pytest.raises(NegativeNumberError):
+            StringCalculator(rules=self.kata_rules).add("-5,3")
+    
+    def test_signs_and_digit_grouping(self):
+        """Test: Tokens using a disallowed sign or grouping are invalid"""
+        from src.exceptions import InvalidTokenError
+        from src.rules import NumberRules
+        from src.string_calculator import StringCalculator
+        
+        assert StringCalculator(rules=NumberRules(signs='')).add("+5,-3,4") == 4
+        assert StringCalculator(rules=NumberRules(signs='-'), allow_negatives=True).add("+5,-3,4") == 1
+        assert StringCalculator(rules=NumberRules(digit_grouping="'")).add("1'000,1_000,2''0,'3,4") == 1004
+        
+        calculator = StringCalculator(rules=NumberRules(digit_grouping=None), strict=True)
+        with pytest.raises(InvalidTokenError) as excinfo:
+            calculator.add("1_000,2")
+        assert [error.token for error in excinfo.value.errors] == ['1_000']
+        
+        # Out-of-range values are valid tokens, ignored without an error
+        assert StringCalculator(rules=self.kata_rules, strict=True).add("1,5000") == 1
+    
+    def test_rules_follow_numeric_mode(self):
+        """Test: Rules compose with the decimal mode and reject bad settings"""
+        from decimal import Decimal
+        from src.rules import NumberRules
+        from src.string_calculator import StringCalculator
+        
+        calculator = StringCalculator(numeric='decimal', rules=NumberRules(max_value=10, digit_grouping="'"))
+        assert calculator.add("1.5,10.5,2'0.5,2") == Decimal('3.5')
+        
+        # Default rules leave the plain fast paths in place
+        assert StringCalculator(rules=NumberRules()).rules is None
+        for settings in ({'min_value': 2, 'max_value': 1}, {'signs': '*'}, {'digit_grouping': '1'},
+                         {'digit_grouping': ' '}, {'digit_grouping': '--'}):
+            with pytest.raises(ValueError):
+                NumberRules(**settings)
+
+
+class TestDelimiterTrie:
+    """Test suite for trie-compiled delimiter patterns."""
+    
+    def setup_method(self):
+        """Set up fresh calculator instance before each test."""
+        from src.string_calculator import StringCalculator
+        self.calculator = StringCalculator()
+    
+    # ===== STEP 16: DELIMITER TRIE =====
+    def test_precedence_matches_alternation(self):
+        """Test: The trie splits exactly like a flat alternation in listed order"""
+        import random
+        import re
+        from src.delimiter_trie import trie_pattern
+        
+        rng = random.Random(20)
+        for _ in range(2000):
+            delimiters = [''.join(rng.choice('ab*') for _ in range(rng.randint(1, 4)))
+                          for _ in range(rng.randint(1, 6))]
+            text = ''.join(rng.choice('ab*1') for _ in range(30))
+            flat = re.compile('|'.join(re.escape(delimiter) for delimiter in delimiters))
+            trie = re.compile(trie_pattern(delimiters))
+            assert trie.split(text) == flat.split(text), f"Failed for: {delimiters!r} on {text!r}"
+    
+    def test_shadowed_delimiters_are_pruned(self):
+        """Test: A delimiter listed after one of its prefixes never matches; longer ones listed first win"""
+        from src.delimiter_trie import trie_pattern
+        
+        assert trie_pattern(['*', '**']) == r'\*'
+        assert trie_pattern(['**', '*', '%']) == r'(?:\*(?:\*)?|%)'
+        assert trie_pattern(['abc', 'ab', 'abd']) == 'ab(?:c)?'
+        assert trie_pattern([b'ab', b'ac']) == b'a(?:b|c)'
+        assert self.calculator.add("//[*][**]\n1**2") == 3
+        assert self.calculator.add("//[**][*]\n1***2") == 3
+    
+    def test_many_delimiters(self):
+        """Test: Dozens of similar multi-character delimiters split the same with every engine"""
+        from src.string_calculator import StringCalculator
+        
+        delimiters = [f"<sep{index:02d}>" for index in range(40)] + ["##x", "##", "#"]
+        header = "//" + "".join(f"[{delimiter}]" for delimiter in delimiters) + "\n"
+        input_str = header + "".join(f"{index}{delimiters[index % len(delimiters)]}" for index in range(1000))
+        for engine in StringCalculator.ENGINES:
+            assert StringCalculator(engine=engine).add(input_str) == 499500, f"Failed for engine: {engine}"
+        
+        # Chains too deep for one nested pattern fall back to the flat alternation
+        from src.delimiter_trie import MAX_TRIE_NESTING, trie_pattern
+        chain = ['a' * size for size in range(MAX_TRIE_NESTING + 1, 0, -1)]
+        assert trie_pattern(chain) == '|'.join(chain)
+
+
+class TestHeaderParsing:
+    """Test suite for the bounded delimiter header parser."""
+    
+    def setup_method(self):
+        """Set up a calculator with small header limits before each test."""
+        from src.string_calculator import StringCalculator
+        self.calculator = StringCalculator(max_header_length=16, max_delimiters=3)
+    
+    # ===== STEP 17: HEADER LIMITS =====
+    def test_header_forms(self):
+        """Test: Both header forms parse from the first line, malformed ones use the defaults"""
+        from src.header import HeaderMatch, parse_header
+        
+        assert parse_header("//;\n1;2") == HeaderMatch([';'], 4)
+        assert parse_header("//\n\n1\n2") == HeaderMatch(['\n'], 4)
+        assert parse_header("//[\n1[2") == HeaderMatch(['['], 4)
+        assert parse_header("//[*][%%]\n1") == HeaderMatch(['*', '%%'], 10)
+        assert parse_header("//[]]\n1]2") == HeaderMatch([']'], 6)
+        assert parse_header("//[a]]\n1") == HeaderMatch(['a'], 7)
+        for text in ("1,2", "//", "//[]\n1", "//[*]x\n1", "//[a\nb]\n1", "//;;\n1"):
+            assert parse_header(text) is None, f"Failed for: {text!r}"
+    
+    def test_limits_raise_invalid_delimiter(self, tmp_path):
+        """Test: Too long or too crowded headers raise, whatever the reader"""
+        from src.exceptions import InvalidDelimiterError
+        
+        long_header = "//[" + "*" * 20 + "]\n1*2"
+        crowded = "//[a][b][c][d]\n1a2"
+        path = tmp_path / "numbers.txt"
+        for input_str in (long_header, crowded, "//[" + "1" * 1000):
+            path.write_text(input_str, encoding='utf-8')
+            readers = [
+                self.calculator.add,
+                lambda text: self.calculator.add_iter(list(text)),
+                lambda text: self.calculator.add_file(path),
+            ]
+            for read in readers:
+                with pytest.raises(InvalidDelimiterError):
+                    read(input_str)
+        
+        assert self.calculator.add("//[" + "*" * 13 + "]\n1" + "*" * 13 + "2") == 3
+        assert self.calculator.add("//[a][b][c]\n1a2b3c4") == 10
+        # Unbracketed long first lines are plain numbers, as before
+        assert self.calculator.add("//" + "1" * 1000) == 0
+    
+    def test_stream_resolves_header_at_first_newline(self):
+        """Test: add_iter stops buffering as soon as the header line is complete"""
+        from src.header import header_complete
+        
+        assert not header_complete("//[***")
+        assert header_complete("//[***]\n")
+        assert not header_complete("//\n")
+        assert header_complete("//\n\n")
+        assert header_complete("//[" + "*" * 20, max_length=16)
+        assert header_complete("12")
+        assert self.calculator.add_iter(["//[**", "*]\n1**", "*2"]) == 3
+
+
+class TestWorkLimits:
+    """Test suite for per-input work limits."""
+    
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        from src.string_calculator import StringCalculator
+        self.StringCalculator = StringCalculator
+    
+    # ===== STEP 18: WORK LIMITS =====
+    def test_number_limit_every_engine(self, tmp_path):
+        """Test: Inputs with more numbers than allowed raise, whatever the engine or reader"""
+        from src.exceptions import LimitExceededError
+        
+        allowed = ",".join(["7"] * 5000)
+        path = tmp_path / "numbers.txt"
+        for engine in self.StringCalculator.ENGINES:
+            calculator = self.StringCalculator(engine=engine, max_numbers=5000)
+            assert calculator.add(allowed) == 35000, f"Failed for engine: {engine}"
+            assert calculator.add("1,2") == 3
+            for input_str in (allowed + ",1", "1," * 6000):
+                path.write_text(input_str, encoding='utf-8')
+                readers = [
+                    calculator.add,
+                    lambda text: calculator.add_iter([text[:100], text[100:]]),
+                    lambda text: calculator.add_file(path),
+                ]
+                for read in readers:
+                    with pytest.raises(LimitExceededError) as excinfo:
+                        read(input_str)
+                    assert excinfo.value.limit == 'numbers'
+    
+    def test_cpu_time_limit(self):
+        """Test: Parsing stops at the first window checked after the CPU allowance runs out"""
+        from src.exceptions import LimitExceededError
+        from src.limits import WorkBudget
+        
+        budget = WorkBudget(max_cpu_time=0.0)
+        with pytest.raises(LimitExceededError, match="cpu_time limit of 0.0"):
+            for _ in range(1000):
+                budget.charge(1)
+        
+        calculator = self.StringCalculator(engine='scan', max_cpu_time=0.0)
+        with pytest.raises(LimitExceededError):
+            calculator.add(",".join(["123"] * 200000))
+        assert self.StringCalculator(max_cpu_time=60.0).add("1,2,3") == 6
@@ -0,0 +1,36 @@
+"""
+Test cases for the synthetic workload generator.
+"""
+
+import pytest
+
+
+class TestWorkloads:
+    """Test suite for generated calculator inputs."""
+    
+    def test_every_style_respects_size_and_parses(self):
+        """Test: Inputs stay within the size budget and use their delimiter form"""
+        from src.string_calculator import StringCalculator
+        from src.workloads import STYLES, generate_input
+        
+        calculator = StringCalculator()
+        for style, (header, delimiters) in STYLES.items():
+            for size in (50, 5000, 200000):
+                numbers = generate_input(style, size)
+                assert len(numbers) <= size
+                assert numbers.startswith(header)
+                
+                section = numbers[len(header):]
+                tokens = calculator._parse_numbers_with_delimiters(section, delimiters)
+                assert calculator.add(numbers) == sum(tokens) > 0
+                assert all(0 <= token <= 1000 for token in tokens)
+    
+    def test_generation_is_reproducible(self):
+        """Test: The same seed gives the same input"""
+        from src.workloads import generate_input
+        
+        assert generate_input('multiple', 1000, seed=7) == generate_input('multiple', 1000, seed=7)
+        assert generate_input('multiple', 1000, seed=7) != generate_input('multiple', 1000, seed=8)
+        
+        with pytest.raises(ValueError):
+            generate_input('unknown')